@@ -5,6 +5,7 @@ Database connection management for Snowflake and PostgreSQL.
 """
 
 import os
+import threading
 from contextlib import contextmanager
 from typing import Any, Dict, Optional
 
@@ -16,11 +17,20 @@ from snowflake.connector import DictCursor
 
 
 class SnowflakeConnection:
-    """Manages Snowflake database connections."""
+    """
+    Manages Snowflake database connections.
+
+    Each thread gets its own connection: cursors on one Snowflake connection
+    serialize on the connection lock, so threads sharing an instance (e.g.
+    parallel validation or the transfer producer) would otherwise block each
+    other.
+    """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or self._load_config()
-        self._connection = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []  # every open connection, across all threads
 
     def _load_config(self) -> Dict[str, Any]:
         """Load Snowflake configuration from environment/settings."""
@@ -43,26 +53,53 @@ class SnowflakeConnection:
         }
 
     def connect(self):
-        """Establish connection to Snowflake."""
-        if self._connection is None or self._connection.is_closed():
-            self._connection = snowflake.connector.connect(
+        """Return this thread's Snowflake connection, establishing it if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or connection.is_closed():
+            connection = snowflake.connector.connect(
                 user=self.config["user"],
                 password=self.config["password"],
                 account=self.config["account"],
                 warehouse=self.config["warehouse"],
                 database=self.config["database"],
+                # Heartbeat the session so a connection reused across a long
+                # run (see sf_migrate) is not expired while idle
+                client_session_keep_alive=True,
             )
             # Force JSON result format so the Arrow C extension never tries to
             # deserialize oversized values (large VARCHAR/VARIANT/DECIMAL),
             # which causes errno 75 "Value too large for defined data type".
-            self._connection.cursor().execute(
-                "ALTER SESSION SET PYTHON_CONNECTOR_QUERY_RESULT_FORMAT = 'JSON'"
+            # Pin the text output formats too: the transfer engine casts every
+            # column to VARCHAR and the binary COPY encoders parse these layouts
+            # (FF6 also keeps full microsecond precision).
+            connection.cursor().execute(
+                "ALTER SESSION SET "
+                "PYTHON_CONNECTOR_QUERY_RESULT_FORMAT = 'JSON' "
+                "DATE_OUTPUT_FORMAT = 'YYYY-MM-DD' "
+                "TIMESTAMP_NTZ_OUTPUT_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6' "
+                "TIMESTAMP_LTZ_OUTPUT_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6 TZH:TZM' "
+                "TIMESTAMP_TZ_OUTPUT_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6 TZH:TZM' "
+                "BINARY_OUTPUT_FORMAT = 'HEX'"
             )
-        return self._connection
-
-    def reconnect(self):
-        """Force a fresh connection, closing any existing one."""
-        self.close()
+            self._local.connection = connection
+            with self._lock:
+                self._connections = [
+                    c for c in self._connections if not c.is_closed()
+                ] + [connection]
+        return connection
+
+    def reconnect(self, stale=None):
+        """
+        Force a fresh connection for this thread.
+
+        stale: the expired connection to discard (defaults to this thread's).
+               Pass it when the connection was opened by another thread so
+               that thread also reconnects on its next use.
+        """
+        stale = stale or getattr(self._local, "connection", None)
+        if stale is not None:
+            stale.close()
+        self._local.connection = None
         return self.connect()
 
     @contextmanager
@@ -77,10 +114,12 @@ class SnowflakeConnection:
             cur.close()
 
     def close(self):
-        """Close the connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the connections of every thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
 
     def __enter__(self):
         return self
@@ -93,12 +132,18 @@ class PostgresConnection:
     """Manages PostgreSQL database connections with pooling."""
 
     def __init__(
-        self, db_alias: str = "data_factory_ops", min_conn: int = 1, max_conn: int = 5
+        self,
+        db_alias: str = "data_factory_ops",
+        min_conn: Optional[int] = None,
+        max_conn: int = 5,
     ):
         self.db_alias = db_alias
         self.config = self._load_config()
         self._pool = None
-        self.min_conn = min_conn
+        # psycopg2's pool closes any connection returned while it already holds
+        # min_conn idle ones, so min_conn < max_conn means reconnecting on nearly
+        # every checkout under concurrency. Keep the whole pool open by default.
+        self.min_conn = max_conn if min_conn is None else min_conn
         self.max_conn = max_conn
 
     def _load_config(self) -> Dict[str, Any]:
@@ -115,6 +160,13 @@ class PostgresConnection:
             "password": db_config["PASSWORD"],
             "host": db_config["HOST"],
             "port": db_config.get("PORT", 5432),
+            # libpq TCP keepalives: long transfers hold pooled connections
+            # idle while Snowflake streams, and NATs/load balancers otherwise
+            # drop them silently
+            "keepalives": 1,
+            "keepalives_idle": 60,
+            "keepalives_interval": 30,
+            "keepalives_count": 5,
         }
 
     def get_pool(self):
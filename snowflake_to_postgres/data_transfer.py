@@ -4,15 +4,35 @@ snowflake_to_postgres/data_transfer.py
 High-performance bulk data transfer from Snowflake to PostgreSQL.
 """
 
-import csv
 import io
 import logging
+import multiprocessing
+import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import uuid
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from psycopg2.extensions import encodings
+
+from .binary_copy import (
+    BINARY_COPY_HEADER,
+    BINARY_COPY_TRAILER,
+    get_field_encoder,
+    make_row_encoder,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +77,113 @@ def _build_resume_query(original_query: str, offset: int) -> str:
     return f"{query} LIMIT 9223372036854775807 OFFSET {offset}"
 
 
+def _execute_with_status_ticker(
+    cursor,
+    query: str,
+    status_callback: Optional[Callable[[str], None]] = None,
+    interval: float = 10,
+):
+    """
+    Execute *query* on *cursor*, reporting elapsed time every *interval* seconds.
+
+    Uses a self-rescheduling threading.Timer that is cancelled once the query
+    returns, so no thread is started at all for queries faster than *interval*.
+    """
+    if not status_callback:
+        cursor.execute(query)
+        return
+
+    start = time.time()
+    lock = threading.Lock()
+    state = {"timer": None, "done": False}
+
+    def _tick():
+        with lock:
+            if state["done"]:
+                return
+            elapsed = int(time.time() - start)
+            status_callback(f"Still waiting for Snowflake... ({elapsed}s elapsed)")
+            _schedule()
+
+    def _schedule():
+        timer = threading.Timer(interval, _tick)
+        timer.daemon = True
+        state["timer"] = timer
+        timer.start()
+
+    with lock:
+        _schedule()
+    try:
+        cursor.execute(query)
+    finally:
+        with lock:
+            state["done"] = True
+            state["timer"].cancel()
+
+
+def _csv_field(val: Optional[str]) -> str:
+    """Format one value as a CSV field for COPY ... CSV NULL '\\N'."""
+    if val is None:
+        return "\\N"
+    if val == "\\N" or any(c in val for c in ',"\r\n'):
+        # Quoted, so a literal \N string is not read back as NULL
+        return '"' + val.replace('"', '""') + '"'
+    return val
+
+
+def _largest_first(tables: List[str], row_counts: Dict[str, Optional[int]]):
+    """
+    Order tables for a worker pool, biggest (by row estimate) first.
+
+    A large table dispatched last would run alone at the end while the other
+    workers sit idle; starting it first lets the small ones fill in around it.
+    """
+    return sorted(tables, key=lambda t: row_counts.get(t.upper()) or 0, reverse=True)
+
+
+def _init_transfer_process():
+    """ProcessPoolExecutor initializer: spawned workers must set up Django."""
+    import django
+
+    django.setup()
+
+
+def _transfer_table_in_process(
+    sf_config: Dict,
+    db_alias: str,
+    engine_kwargs: Dict,
+    table_kwargs: Dict,
+    events,
+    report_rows: bool = True,
+) -> "TransferStats":
+    """
+    Transfer one table in a worker process with its own connections.
+
+    Progress is sent back to the parent as (kind, table, payload) tuples on
+    *events*: kind is "rows" (only if report_rows), "status" or "checkpoint".
+    """
+    from .connections import PostgresConnection, SnowflakeConnection
+
+    table = table_kwargs["source_table"]
+    # One connection for the COPY, plus the parallel imports with --s3-stage
+    # (the pool opens every slot up front, so don't size it for unused ones)
+    max_conn = 1 + (
+        engine_kwargs["s3_import_workers"] if engine_kwargs.get("s3_stage") else 0
+    )
+    with SnowflakeConnection(sf_config) as sf_conn, PostgresConnection(
+        db_alias, max_conn=max_conn
+    ) as pg_conn:
+        engine = DataTransferEngine(sf_conn, pg_conn, **engine_kwargs)
+        return engine.transfer_table(
+            **table_kwargs,
+            progress_callback=(
+                (lambda n: events.put(("rows", table, n))) if report_rows else None
+            ),
+            status_callback=lambda m: events.put(("status", table, m)),
+            checkpoint_callback=lambda n: events.put(("checkpoint", table, n)),
+        )
+
+
 @dataclass
 class TransferStats:
     """Statistics for data transfer operation."""
@@ -69,6 +196,79 @@ class TransferStats:
     error_message: Optional[str] = None
 
 
+class _CopyStream(io.RawIOBase):
+    """
+    File-like COPY source fed from the transfer producer queue.
+
+    copy_expert() pulls data through read(); batches are taken off the queue
+    only as PostgreSQL consumes them, so one COPY statement can span many
+    batches (all of them when *max_batches* is 0) without ever holding more
+    than the queued batches in memory.
+    """
+
+    def __init__(
+        self,
+        batch_queue: "queue.Queue",
+        max_batches: int = 0,
+        header: bytes = b"",
+        trailer: bytes = b"",
+        on_batch: Optional[Callable[[int], None]] = None,
+    ):
+        super().__init__()
+        self._queue = batch_queue
+        self._max_batches = max_batches
+        self._header = header
+        self._trailer = trailer
+        self._on_batch = on_batch
+        self._chunk = b""
+        self._pos = 0
+        self._started = False
+        self._done = False
+        self.batches = 0
+        self.exhausted = False  # producer signalled EOF
+        self.error: Optional[Exception] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self) -> bytes:
+        if not self._started:
+            self._started = True
+            return self._header
+
+        if self._max_batches and self.batches >= self._max_batches:
+            self._done = True
+            return self._trailer
+
+        item = self._queue.get()
+        if item is None:
+            self.exhausted = True
+            self._done = True
+            return self._trailer
+        if isinstance(item, Exception):
+            self.error = item
+            raise item
+
+        row_count, data = item
+        self.batches += 1
+        if self._on_batch:
+            self._on_batch(row_count)
+        return data
+
+    def read(self, size: int = -1) -> bytes:
+        while self._pos >= len(self._chunk):
+            if self._done:
+                return b""
+            self._chunk = self._next_chunk()
+            self._pos = 0
+
+        if size is None or size < 0:
+            size = len(self._chunk) - self._pos
+        data = self._chunk[self._pos : self._pos + size]
+        self._pos += len(data)
+        return data
+
+
 class DataTransferEngine:
     """Transfers data from Snowflake to PostgreSQL efficiently."""
 
@@ -76,22 +276,67 @@ class DataTransferEngine:
         self,
         sf_connection,
         pg_connection,
-        batch_size: int = 10000,
+        batch_size: int = 100000,
         use_copy: bool = True,
+        binary_copy: bool = True,
+        commit_every: int = 0,
+        copy_buffer_size: int = 65536,
+        download_workers: int = 1,
+        s3_stage: Optional[str] = None,
+        aws_credentials: Optional[Dict[str, str]] = None,
+        s3_import_workers: int = 4,
+        max_batch_bytes: int = 64 * 1024 * 1024,
     ):
         self.sf_conn = sf_connection
         self.pg_conn = pg_connection
         self.batch_size = batch_size
         self.use_copy = use_copy
+        self.binary_copy = binary_copy
+        # Commit every N batches; 0 commits once per table, so a failed table is
+        # rolled back entirely instead of paying a WAL flush per batch.
+        self.commit_every = commit_every
+        # Bytes copy_expert reads from the COPY stream per libpq write
+        # (psycopg2's default of 8 KiB means many tiny writes on wide tables)
+        self.copy_buffer_size = copy_buffer_size
+        # >1 downloads Snowflake result chunks concurrently (get_result_batches)
+        self.download_workers = download_workers
+        # Cap on the approximate size of one batch so very wide rows cannot
+        # blow up memory at large batch sizes (0 disables the guard)
+        self.max_batch_bytes = max_batch_bytes
+        # Optional server-side path: Snowflake unloads to s3_stage
+        # (s3://bucket/prefix) and PostgreSQL imports with the aws_s3 extension.
+        # aws_credentials keys: access_key_id, secret_access_key, session_token,
+        # region.
+        self.s3_stage = s3_stage
+        self.aws_credentials = aws_credentials or {}
+        self.s3_import_workers = s3_import_workers
+        # Snowflake metadata caches, kept for the lifetime of the engine
+        self._columns_cache: Dict[Tuple[str, str], List[str]] = {}
+        self._tables_cache: Dict[str, List[str]] = {}
+        self._row_count_cache: Dict[Tuple[str, str], Optional[int]] = {}
 
     def _get_row_count_estimate(self, schema: str, table: str) -> Optional[int]:
-        """Get approximate row count for a table."""
-        query = f'SELECT COUNT(*) as "CNT" FROM {schema}.{table}'
+        """
+        Get approximate row count for a table.
+
+        Reads ROW_COUNT from INFORMATION_SCHEMA.TABLES (served from metadata,
+        no warehouse scan) instead of running COUNT(*).
+        """
+        cache_key = (schema, table.upper())
+        if cache_key in self._row_count_cache:
+            return self._row_count_cache[cache_key]
+
+        query = """
+        SELECT ROW_COUNT
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = %s
+        AND TABLE_NAME = UPPER(%s)
+        """
         try:
             with self.sf_conn.cursor() as cursor:
-                cursor.execute(query)
+                cursor.execute(query, (schema, table))
                 result = cursor.fetchone()
-                return result["CNT"] if result else None
+                return result["ROW_COUNT"] if result else None
         except Exception:
             return None
 
@@ -107,20 +352,33 @@ class DataTransferEngine:
         progress_callback: Optional[Callable[[int], None]] = None,
         status_callback: Optional[Callable[[str], None]] = None,
         checkpoint_callback: Optional[Callable[[int], None]] = None,
+        bulk_mode: bool = False,
+        columns: Optional[List[str]] = None,
+        row_estimate: Optional[int] = None,
     ) -> TransferStats:
         """
         Transfer data from a Snowflake table to PostgreSQL.
 
+        where_clause / limit: applied in the Snowflake SELECT (every load
+                      method runs that query), so filtered-out rows are
+                      never sent. Range filters on clustering-key columns
+                      also let Snowflake skip micro-partitions.
         start_offset: number of rows already committed (checkpoint resume).
                       The query will be issued with OFFSET start_offset so
                       previously transferred rows are skipped.
+        bulk_mode:    drop secondary indexes and switch the table to UNLOGGED
+                      for the load; both are restored afterwards (even on
+                      failure) and the table is ANALYZEd.
+        columns / row_estimate: pre-fetched metadata (see transfer_schema);
+                      looked up per table when not given.
         """
         target_table = target_table or source_table
         start_time = datetime.now()
 
         try:
             # Get column list
-            columns = self._get_columns(source_schema, source_table)
+            if columns is None:
+                columns = self._get_columns(source_schema, source_table)
             # Cast every column to VARCHAR in Snowflake so the connector's C-level
             # type converter never sees oversized numerics/VARIANTs that cause
             # errno 75 (EOVERFLOW) in the 252005 "Failed to convert current row" error.
@@ -143,35 +401,58 @@ class DataTransferEngine:
             )
 
             # Show row count estimate
-            if status_callback:
-                status_callback(f"Counting rows in {source_schema}.{source_table}...")
-            row_estimate = self._get_row_count_estimate(source_schema, source_table)
+            if row_estimate is None:
+                if status_callback:
+                    status_callback(
+                        f"Counting rows in {source_schema}.{source_table}..."
+                    )
+                row_estimate = self._get_row_count_estimate(source_schema, source_table)
             if status_callback and row_estimate is not None:
                 status_callback(f"~{row_estimate:,} rows to transfer")
 
             # Transfer data
-            if self.use_copy:
-                rows_transferred = self._transfer_using_copy(
-                    query,
-                    columns,
-                    target_schema,
-                    target_table,
-                    progress_callback,
-                    status_callback,
-                    checkpoint_callback,
-                    start_offset,
-                )
-            else:
-                rows_transferred = self._transfer_using_insert(
-                    query,
-                    columns,
-                    target_schema,
-                    target_table,
-                    progress_callback,
-                    status_callback,
-                    checkpoint_callback,
-                    start_offset,
-                )
+            bulk_state = (
+                self._begin_bulk_load(target_schema, target_table, status_callback)
+                if bulk_mode
+                else None
+            )
+            try:
+                if self.s3_stage:
+                    rows_transferred = self._transfer_using_s3(
+                        query,
+                        columns,
+                        target_schema,
+                        target_table,
+                        progress_callback,
+                        status_callback,
+                    )
+                elif self.use_copy:
+                    rows_transferred = self._transfer_using_copy(
+                        query,
+                        columns,
+                        target_schema,
+                        target_table,
+                        progress_callback,
+                        status_callback,
+                        checkpoint_callback,
+                        start_offset,
+                    )
+                else:
+                    rows_transferred = self._transfer_using_insert(
+                        query,
+                        columns,
+                        target_schema,
+                        target_table,
+                        progress_callback,
+                        status_callback,
+                        checkpoint_callback,
+                        start_offset,
+                    )
+            finally:
+                if bulk_state is not None:
+                    self._end_bulk_load(
+                        target_schema, target_table, bulk_state, status_callback
+                    )
 
             rows_transferred += start_offset  # include already-committed rows in total
             end_time = datetime.now()
@@ -229,29 +510,8 @@ class DataTransferEngine:
             if status_callback:
                 status_callback("Querying Snowflake...")
 
-            def _execute_with_ticker(cursor, exec_query):
-                """Execute query on cursor, printing elapsed time every 10 s."""
-                stop_ticker = threading.Event()
-
-                def _tick():
-                    start = time.time()
-                    while not stop_ticker.wait(10):
-                        elapsed = int(time.time() - start)
-                        if status_callback:
-                            status_callback(
-                                f"Still waiting for Snowflake... ({elapsed}s elapsed)"
-                            )
-
-                ticker = threading.Thread(target=_tick, daemon=True)
-                ticker.start()
-                try:
-                    cursor.execute(exec_query)
-                finally:
-                    stop_ticker.set()
-                    ticker.join()
-
             try:
-                _execute_with_ticker(sf_cursor, query)
+                _execute_with_status_ticker(sf_cursor, query, status_callback)
             except Exception as exec_err:
                 if _is_sf_auth_error(exec_err):
                     if status_callback:
@@ -264,117 +524,221 @@ class DataTransferEngine:
                     sf_cursor.close()
                     sf_conn = self.sf_conn.reconnect()
                     sf_cursor = sf_conn.cursor()
-                    _execute_with_ticker(sf_cursor, query)
+                    _execute_with_status_ticker(sf_cursor, query, status_callback)
                 else:
                     raise
 
             if status_callback:
                 status_callback("Fetching and inserting rows...")
 
-            with self.pg_conn.connection() as pg_conn:
-                pg_cursor = pg_conn.cursor()
-
-                # Create CSV buffer.
-                # Use \N as the explicit NULL marker (PG standard) with QUOTE_MINIMAL.
-                # \N contains no CSV special chars so csv.writer leaves it unquoted;
-                # PG COPY NULL '\N' matches only unquoted \N → DB NULL.
-                # Empty strings from Snowflake become unquoted empty fields which,
-                # because NULL is now '\N' (not empty), PG stores as '' not NULL.
-                _NULL_MARKER = "\\N"
-                buffer = io.StringIO()
-                writer = csv.writer(buffer)
-
-                batch_count = 0
-                column_list = ", ".join([f'"{col.lower()}"' for col in columns])
+            # Binary COPY when every target column type has an encoder,
+            # otherwise fall back to CSV.
+            encode_row = None
+            if self.binary_copy:
+                encoders = self._get_binary_encoders(
+                    target_schema, target_table, columns
+                )
+                if encoders:
+                    encode_row = make_row_encoder(encoders)
+
+            # Column list and COPY statement (binary or CSV).
+            # CSV uses \N as the explicit NULL marker (PG standard), written
+            # unquoted; PG COPY NULL '\N' matches only unquoted \N → DB NULL.
+            # Empty strings from Snowflake become unquoted empty fields which,
+            # because NULL is now '\N' (not empty), PG stores as '' not NULL.
+            _NULL_MARKER = "\\N"
+            column_list = ", ".join([f'"{col.lower()}"' for col in columns])
+            if encode_row:
+                copy_format = "COPY BINARY"
+                copy_sql = (
+                    f'COPY {target_schema}."{target_table}" ({column_list}) '
+                    f"FROM STDIN WITH (FORMAT BINARY)"
+                )
+            else:
+                copy_format = "COPY"
                 copy_sql = (
                     f'COPY {target_schema}."{target_table}" ({column_list}) '
                     f"FROM STDIN WITH CSV NULL '{_NULL_MARKER}'"
                 )
 
-                while True:
-                    batch_count += 1
-                    if status_callback:
-                        status_callback(
-                            f"Batch {batch_count}: fetching up to {self.batch_size:,} rows from Snowflake..."
+            separator_count = len(columns) - 1
+            text_encoding = "utf-8"  # replaced by the PG client encoding below
+
+            def _serialize(rows):
+                """Serialize one batch of rows to bytes (no COPY header/trailer)."""
+                if encode_row:
+                    return b"".join([encode_row(row) for row in rows])
+                else:
+                    # Rows are joined directly and encoded in this (producer)
+                    # thread, so the consumer only ships bytes. A row needs
+                    # per-field quoting only if it contains a quote/CR/LF, an
+                    # embedded comma, or a literal \N value (every other \N in
+                    # the line is a NULL marker).
+                    lines = []
+                    for row in rows:
+                        line = ",".join(
+                            [_NULL_MARKER if val is None else val for val in row]
                         )
+                        if (
+                            line.count(",") != separator_count
+                            or line.count(_NULL_MARKER) != row.count(None)
+                            or '"' in line
+                            or "\n" in line
+                            or "\r" in line
+                        ):
+                            line = ",".join([_csv_field(val) for val in row])
+                        lines.append(line)
+                    lines.append("")
+                    data = "\n".join(lines)
+                    # Null bytes (\x00) are not valid in PG text columns and cause
+                    # psycopg2's copy_expert to segfault at the C level — strip them.
+                    # One scan per batch instead of a replace() per value; \x00
+                    # never triggers quoting, so this equals stripping each value.
+                    if "\x00" in data:
+                        data = data.replace("\x00", "")
+                    return data.encode(text_encoding)
+
+            # Snowflake fetch + serialization run in a producer thread so the next
+            # batch downloads while the current one is being COPYed into PostgreSQL.
+            # maxsize=2 bounds memory to roughly two serialized batches.
+            # Queue items: (row_count, data), an Exception, or None at EOF.
+            batch_queue = queue.Queue(maxsize=2)
+            stop_producer = threading.Event()
+
+            def _put(item) -> bool:
+                """Block until *item* is queued; give up if the consumer stopped."""
+                while not stop_producer.is_set():
                     try:
-                        rows = sf_cursor.fetchmany(self.batch_size)
-                    except Exception as fetch_err:
-                        if _is_sf_auth_error(fetch_err) and total_rows > 0:
-                            if status_callback:
-                                status_callback(
-                                    f"Snowflake session expired after {total_rows:,} rows — reconnecting and resuming..."
-                                )
-                            logger.warning(
-                                f"Snowflake auth error at row {total_rows}, reconnecting: {fetch_err}"
-                            )
-                            sf_cursor.close()
-                            sf_conn = self.sf_conn.reconnect()
-                            sf_cursor = sf_conn.cursor()
-                            # Resume from the absolute table position: rows already committed
-                            # in prior runs (start_offset) plus rows committed this session
-                            # (total_rows). Using only total_rows would re-insert rows from
-                            # prior runs, causing duplicates.
-                            resume_query = _build_resume_query(
-                                query, start_offset + total_rows
-                            )
-                            sf_cursor.execute(resume_query)
-                            continue
-                        raise
-
-                    if not rows:
+                        batch_queue.put(item, timeout=1)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+
+            def _produce():
+                nonlocal sf_conn, sf_cursor
+                fetched_rows = 0
+                fetch_count = 0
+                row_batches = self._iter_row_batches(sf_cursor)
+                try:
+                    while not stop_producer.is_set():
+                        fetch_count += 1
                         if status_callback:
-                            status_callback("No more rows — transfer complete.")
-                        break
-
-                    if status_callback:
-                        status_callback(
-                            f"Batch {batch_count}: writing {len(rows):,} rows to PostgreSQL (COPY)..."
-                        )
-
-                    # Write rows to CSV buffer
-                    buffer.seek(0)
-                    buffer.truncate()
-
-                    for row in rows:
-                        # None  → \N  (unquoted by QUOTE_MINIMAL) → COPY NULL '\N' → DB NULL
-                        # ''    → ''  (unquoted empty)             → PG stores as ''  (not NULL)
-                        # other → str(val) as normal CSV field
-                        # Null bytes (\x00) are not valid in PG text columns and cause
-                        # psycopg2's copy_expert to segfault at the C level — strip them.
-                        clean_row = [
-                            (
-                                _NULL_MARKER
-                                if val is None
-                                else str(val).replace("\x00", "")
+                            status_callback(
+                                f"Batch {fetch_count}: fetching up to {self.batch_size:,} rows from Snowflake..."
                             )
-                            for val in row
-                        ]
-                        writer.writerow(clean_row)
-
-                    # Use COPY to load data
-                    buffer.seek(0)
-                    pg_cursor.copy_expert(copy_sql, buffer)
-                    pg_conn.commit()
-
-                    total_rows += len(rows)
+                        try:
+                            rows = next(row_batches, None)
+                        except Exception as fetch_err:
+                            if _is_sf_auth_error(fetch_err) and fetched_rows > 0:
+                                if status_callback:
+                                    status_callback(
+                                        f"Snowflake session expired after {fetched_rows:,} rows — reconnecting and resuming..."
+                                    )
+                                logger.warning(
+                                    f"Snowflake auth error at row {fetched_rows}, reconnecting: {fetch_err}"
+                                )
+                                sf_cursor.close()
+                                # Runs on the producer thread: discard the caller's
+                                # expired connection, not just this thread's.
+                                sf_conn = self.sf_conn.reconnect(stale=sf_conn)
+                                sf_cursor = sf_conn.cursor()
+                                # Resume from the absolute table position: rows already
+                                # committed in prior runs (start_offset) plus rows fetched
+                                # this session (fetched_rows). Fetched-but-uncommitted
+                                # batches are still queued and will be written, so they
+                                # must not be fetched again. Using only fetched_rows would
+                                # re-insert rows from prior runs, causing duplicates.
+                                resume_query = _build_resume_query(
+                                    query, start_offset + fetched_rows
+                                )
+                                sf_cursor.execute(resume_query)
+                                row_batches = self._iter_row_batches(sf_cursor)
+                                fetch_count -= 1
+                                continue
+                            raise
+
+                        if not rows:
+                            break
+
+                        fetched_rows += len(rows)
+                        if not _put((len(rows), _serialize(rows))):
+                            return
+                    _put(None)
+                except Exception as e:
+                    _put(e)
+
+            # The cursor context manager commits on success and rolls back on error,
+            # so uncommitted batches never outlive a failed transfer.
+            with self.pg_conn.cursor(dict_cursor=False) as pg_cursor:
+                pg_conn = pg_cursor.connection
+                uncommitted_batches = 0
+                text_encoding = encodings[pg_conn.encoding]
+
+                producer = threading.Thread(target=_produce, daemon=True)
+                producer.start()
+                batch_count = 0
 
-                    if checkpoint_callback:
-                        checkpoint_callback(start_offset + total_rows)
+                def _on_batch(row_count):
+                    nonlocal batch_count, total_rows
+                    batch_count += 1
+                    total_rows += row_count
 
                     if progress_callback:
                         progress_callback(total_rows)
 
                     if status_callback:
                         status_callback(
-                            f"Batch {batch_count}: done — {total_rows:,} rows inserted so far."
+                            f"Batch {batch_count}: streamed {row_count:,} rows to PostgreSQL ({copy_format}) — {total_rows:,} so far."
                         )
 
                     logger.debug(
-                        f"Batch {batch_count}: {len(rows)} rows transferred (total: {total_rows})"
+                        f"Batch {batch_count}: {row_count} rows transferred (total: {total_rows})"
                     )
 
-                pg_cursor.close()
+                try:
+                    # One COPY statement per commit group (the whole table when
+                    # commit_every=0); batches are streamed into it as they arrive.
+                    while True:
+                        stream = _CopyStream(
+                            batch_queue,
+                            max_batches=self.commit_every,
+                            header=BINARY_COPY_HEADER if encode_row else b"",
+                            trailer=BINARY_COPY_TRAILER if encode_row else b"",
+                            on_batch=_on_batch,
+                        )
+                        try:
+                            pg_cursor.copy_expert(
+                                copy_sql, stream, size=self.copy_buffer_size
+                            )
+                        except Exception:
+                            # psycopg2 wraps errors raised inside read(); surface
+                            # the producer's original exception instead
+                            if stream.error is not None:
+                                raise stream.error
+                            raise
+
+                        if stream.batches:
+                            uncommitted_batches += stream.batches
+                            if self.commit_every:
+                                pg_conn.commit()
+                                uncommitted_batches = 0
+                                if checkpoint_callback:
+                                    checkpoint_callback(start_offset + total_rows)
+
+                        if stream.exhausted:
+                            if status_callback:
+                                status_callback("No more rows — transfer complete.")
+                            break
+                finally:
+                    stop_producer.set()
+                    producer.join()
+
+                # Commit the remainder (the whole table when commit_every=0)
+                if uncommitted_batches:
+                    pg_conn.commit()
+                    if checkpoint_callback:
+                        checkpoint_callback(start_offset + total_rows)
 
         finally:
             sf_cursor.close()
@@ -403,29 +767,8 @@ class DataTransferEngine:
             if status_callback:
                 status_callback("Querying Snowflake...")
 
-            def _execute_with_ticker(cursor, exec_query):
-                """Execute query on cursor, printing elapsed time every 10 s."""
-                stop_ticker = threading.Event()
-
-                def _tick():
-                    start = time.time()
-                    while not stop_ticker.wait(10):
-                        elapsed = int(time.time() - start)
-                        if status_callback:
-                            status_callback(
-                                f"Still waiting for Snowflake... ({elapsed}s elapsed)"
-                            )
-
-                ticker = threading.Thread(target=_tick, daemon=True)
-                ticker.start()
-                try:
-                    cursor.execute(exec_query)
-                finally:
-                    stop_ticker.set()
-                    ticker.join()
-
             try:
-                _execute_with_ticker(sf_cursor, query)
+                _execute_with_status_ticker(sf_cursor, query, status_callback)
             except Exception as exec_err:
                 if _is_sf_auth_error(exec_err):
                     if status_callback:
@@ -438,89 +781,401 @@ class DataTransferEngine:
                     sf_cursor.close()
                     sf_conn = self.sf_conn.reconnect()
                     sf_cursor = sf_conn.cursor()
-                    _execute_with_ticker(sf_cursor, query)
+                    _execute_with_status_ticker(sf_cursor, query, status_callback)
                 else:
                     raise
 
             if status_callback:
                 status_callback("Fetching and inserting rows...")
 
-            with self.pg_conn.connection() as pg_conn:
-                pg_cursor = pg_conn.cursor()
+            # The cursor context manager commits on success and rolls back on error,
+            # so uncommitted batches never outlive a failed transfer.
+            with self.pg_conn.cursor(dict_cursor=False) as pg_cursor:
+                pg_conn = pg_cursor.connection
+                uncommitted_batches = 0
 
                 batch_count = 0
+                # Prepare the INSERT once: each batch is sent as one text[] per
+                # column and unnested server-side, so the statement is parsed
+                # and planned once per table instead of once per batch.
+                stmt_name = f"sf_insert_{uuid.uuid4().hex}"
+                column_types = self._get_pg_column_types(
+                    pg_cursor, target_schema, target_table
+                )
                 column_list = ", ".join([f'"{col.lower()}"' for col in columns])
-                placeholders = ", ".join(["%s"] * len(columns))
-                insert_sql = f'INSERT INTO {target_schema}."{target_table}" ({column_list}) VALUES ({placeholders})'
+                select_list = ", ".join(
+                    f'c{i}::{column_types.get(col.lower(), "text")}'
+                    for i, col in enumerate(columns)
+                )
+                unnest_args = ", ".join(f"${i + 1}" for i in range(len(columns)))
+                unnest_alias = ", ".join(f"c{i}" for i in range(len(columns)))
+                pg_cursor.execute(
+                    f"PREPARE {stmt_name} ({', '.join(['text[]'] * len(columns))}) AS "
+                    f'INSERT INTO {target_schema}."{target_table}" ({column_list}) '
+                    f"SELECT {select_list} FROM unnest({unnest_args}) AS u({unnest_alias})"
+                )
+                execute_sql = (
+                    f"EXECUTE {stmt_name} ({', '.join(['%s'] * len(columns))})"
+                )
+                # Prepared statements outlive transactions and the pool keeps
+                # its connections open, so drop it on every exit path.
+                try:
+                    row_batches = self._iter_row_batches(sf_cursor)
 
-                while True:
-                    batch_count += 1
-                    if status_callback:
-                        status_callback(
-                            f"Batch {batch_count}: fetching up to {self.batch_size:,} rows from Snowflake..."
-                        )
-                    try:
-                        rows = sf_cursor.fetchmany(self.batch_size)
-                    except Exception as fetch_err:
-                        if _is_sf_auth_error(fetch_err) and total_rows > 0:
-                            if status_callback:
-                                status_callback(
-                                    f"Snowflake session expired after {total_rows:,} rows — reconnecting and resuming..."
-                                )
-                            logger.warning(
-                                f"Snowflake auth error at row {total_rows}, reconnecting: {fetch_err}"
-                            )
-                            sf_cursor.close()
-                            sf_conn = self.sf_conn.reconnect()
-                            sf_cursor = sf_conn.cursor()
-                            # Resume from absolute table position: prior runs + this session.
-                            resume_query = _build_resume_query(
-                                query, start_offset + total_rows
+                    while True:
+                        batch_count += 1
+                        if status_callback:
+                            status_callback(
+                                f"Batch {batch_count}: fetching up to {self.batch_size:,} rows from Snowflake..."
                             )
-                            sf_cursor.execute(resume_query)
-                            continue
-                        raise
+                        try:
+                            rows = next(row_batches, None)
+                        except Exception as fetch_err:
+                            if _is_sf_auth_error(fetch_err) and total_rows > 0:
+                                if status_callback:
+                                    status_callback(
+                                        f"Snowflake session expired after {total_rows:,} rows — reconnecting and resuming..."
+                                    )
+                                logger.warning(
+                                    f"Snowflake auth error at row {total_rows}, reconnecting: {fetch_err}"
+                                )
+                                sf_cursor.close()
+                                sf_conn = self.sf_conn.reconnect()
+                                sf_cursor = sf_conn.cursor()
+                                # Resume from absolute table position: prior runs + this session.
+                                resume_query = _build_resume_query(
+                                    query, start_offset + total_rows
+                                )
+                                sf_cursor.execute(resume_query)
+                                row_batches = self._iter_row_batches(sf_cursor)
+                                continue
+                            raise
+
+                        if not rows:
+                            if status_callback:
+                                status_callback("No more rows — transfer complete.")
+                            break
 
-                    if not rows:
                         if status_callback:
-                            status_callback("No more rows — transfer complete.")
-                        break
+                            status_callback(
+                                f"Batch {batch_count}: writing {len(rows):,} rows to PostgreSQL (INSERT)..."
+                            )
 
-                    if status_callback:
-                        status_callback(
-                            f"Batch {batch_count}: writing {len(rows):,} rows to PostgreSQL (INSERT)..."
+                        # One EXECUTE per batch: rows transposed into per-column arrays
+                        pg_cursor.execute(
+                            execute_sql, [list(values) for values in zip(*rows)]
                         )
 
-                    # Execute batch
-                    pg_cursor.executemany(insert_sql, rows)
-                    pg_conn.commit()
+                        total_rows += len(rows)
+                        uncommitted_batches += 1
 
-                    total_rows += len(rows)
+                        if (
+                            self.commit_every
+                            and uncommitted_batches >= self.commit_every
+                        ):
+                            pg_conn.commit()
+                            uncommitted_batches = 0
+                            if checkpoint_callback:
+                                checkpoint_callback(start_offset + total_rows)
 
-                    if checkpoint_callback:
-                        checkpoint_callback(start_offset + total_rows)
+                        if progress_callback:
+                            progress_callback(total_rows)
 
-                    if progress_callback:
-                        progress_callback(total_rows)
+                        if status_callback:
+                            status_callback(
+                                f"Batch {batch_count}: done — {total_rows:,} rows inserted so far."
+                            )
 
-                    if status_callback:
-                        status_callback(
-                            f"Batch {batch_count}: done — {total_rows:,} rows inserted so far."
+                        logger.debug(
+                            f"Batch {batch_count}: {len(rows)} rows inserted (total: {total_rows})"
                         )
 
-                    logger.debug(
-                        f"Batch {batch_count}: {len(rows)} rows inserted (total: {total_rows})"
-                    )
-
-                pg_cursor.close()
+                    # Commit the remainder (the whole table when commit_every=0)
+                    if uncommitted_batches:
+                        pg_conn.commit()
+                        if checkpoint_callback:
+                            checkpoint_callback(start_offset + total_rows)
+                except BaseException:
+                    try:
+                        # DEALLOCATE cannot run in the aborted transaction
+                        pg_conn.rollback()
+                        pg_cursor.execute(f"DEALLOCATE {stmt_name}")
+                    except Exception as e:
+                        logger.warning(f"Could not deallocate {stmt_name}: {e}")
+                    raise
+                pg_cursor.execute(f"DEALLOCATE {stmt_name}")
 
         finally:
             sf_cursor.close()
 
         return total_rows
 
+    def _iter_row_batches(self, sf_cursor) -> Iterator[list]:
+        """
+        Yield lists of up to batch_size rows from an executed Snowflake cursor.
+
+        With download_workers > 1 the result set's chunks (get_result_batches)
+        are downloaded concurrently, keeping download_workers chunks in flight
+        and yielding rows in result order; otherwise rows come from fetchmany.
+
+        The first batch is used to estimate the row width; if batch_size rows
+        would exceed max_batch_bytes, later batches are shrunk to fit.
+        """
+
+        def _download(result_batch):
+            rows = list(result_batch.create_iter())
+            # The connector yields conversion errors in-line instead of raising
+            for row in rows:
+                if isinstance(row, Exception):
+                    raise row
+            return rows
+
+        def _iter_rows():
+            with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+                pending = deque()
+                for result_batch in sf_cursor.get_result_batches() or []:
+                    pending.append(pool.submit(_download, result_batch))
+                    if len(pending) >= self.download_workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+
+        if self.download_workers <= 1:
+            sf_cursor.arraysize = self.batch_size
+            fetch = sf_cursor.fetchmany
+        else:
+            rows_iter = _iter_rows()
+
+            def fetch(size):
+                return list(islice(rows_iter, size))
+
+        fetch_size = self.batch_size
+        sized = not self.max_batch_bytes
+        while True:
+            rows = fetch(fetch_size)
+            if not rows:
+                return
+            if not sized:
+                sized = True
+                # Every column is cast to VARCHAR, so values are str or None
+                row_bytes = sum(len(v) for row in rows for v in row if v) / len(rows)
+                if row_bytes * fetch_size > self.max_batch_bytes:
+                    fetch_size = max(1, int(self.max_batch_bytes / row_bytes))
+                    logger.info(
+                        f"Rows average ~{row_bytes:,.0f} bytes; reducing batch size "
+                        f"from {self.batch_size:,} to {fetch_size:,} rows"
+                    )
+                    if self.download_workers <= 1:
+                        sf_cursor.arraysize = fetch_size
+            yield rows
+
+    def _begin_bulk_load(
+        self,
+        target_schema: str,
+        target_table: str,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> dict:
+        """
+        Prepare a target table for a bulk load.
+
+        Drops indexes that do not back a constraint (PK/UNIQUE/EXCLUDE indexes
+        stay) and sets the table UNLOGGED unless a permanent table references it
+        through a foreign key. Returns the state needed by _end_bulk_load.
+        """
+        qualified = f'{target_schema}."{target_table}"'
+        state = {"index_defs": [], "set_unlogged": False}
+
+        with self.pg_conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT ic.relname AS index_name, pg_get_indexdef(i.indexrelid) AS index_def
+                FROM pg_index i
+                JOIN pg_class ic ON ic.oid = i.indexrelid
+                LEFT JOIN pg_constraint con ON con.conindid = i.indexrelid
+                WHERE i.indrelid = %s::regclass
+                AND con.oid IS NULL
+                """,
+                (qualified,),
+            )
+            indexes = cursor.fetchall()
+
+            cursor.execute(
+                """
+                SELECT
+                    c.relpersistence,
+                    EXISTS (
+                        SELECT 1 FROM pg_constraint
+                        WHERE contype = 'f' AND confrelid = c.oid AND conrelid <> c.oid
+                    ) AS is_referenced
+                FROM pg_class c
+                WHERE c.oid = %s::regclass
+                """,
+                (qualified,),
+            )
+            table_info = cursor.fetchone()
+
+            for index in indexes:
+                cursor.execute(f'DROP INDEX {target_schema}."{index["index_name"]}"')
+                state["index_defs"].append(index["index_def"])
+
+            if table_info["relpersistence"] == "p" and not table_info["is_referenced"]:
+                cursor.execute(f"ALTER TABLE {qualified} SET UNLOGGED")
+                state["set_unlogged"] = True
+
+        if status_callback:
+            status_callback(
+                f"Bulk mode: dropped {len(state['index_defs'])} index(es)"
+                + (", table set UNLOGGED" if state["set_unlogged"] else "")
+            )
+        return state
+
+    def _end_bulk_load(
+        self,
+        target_schema: str,
+        target_table: str,
+        state: dict,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Undo _begin_bulk_load: restore LOGGED, rebuild indexes, ANALYZE."""
+        qualified = f'{target_schema}."{target_table}"'
+
+        if status_callback:
+            status_callback(
+                f"Bulk mode: rebuilding {len(state['index_defs'])} index(es)..."
+            )
+
+        with self.pg_conn.cursor() as cursor:
+            if state["set_unlogged"]:
+                cursor.execute(f"ALTER TABLE {qualified} SET LOGGED")
+            for index_def in state["index_defs"]:
+                cursor.execute(index_def)
+
+        # ANALYZE outside the rebuild transaction so a failure here cannot
+        # roll back the restored indexes
+        with self.pg_conn.cursor() as cursor:
+            cursor.execute(f"ANALYZE {qualified}")
+
+    def _transfer_using_s3(
+        self,
+        query: str,
+        columns: List[str],
+        target_schema: str,
+        target_table: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> int:
+        """
+        Transfer via S3 without routing rows through this process.
+
+        Snowflake unloads the query result to CSV files under s3_stage with
+        COPY INTO, then each file is imported in parallel with
+        aws_s3.table_import_from_s3 on PostgreSQL. Files are imported in
+        separate transactions, so a failed import leaves earlier files loaded.
+        """
+        creds = self.aws_credentials
+        parsed = urlparse(self.s3_stage)
+        bucket = parsed.netloc
+        prefix = "/".join(
+            part
+            for part in (parsed.path.strip("/"), target_schema, target_table)
+            if part
+        )
+        location = f"s3://{bucket}/{prefix}/"
+
+        credentials_sql = "AWS_KEY_ID = %s AWS_SECRET_KEY = %s"
+        credentials_params = [
+            creds.get("access_key_id"),
+            creds.get("secret_access_key"),
+        ]
+        if creds.get("session_token"):
+            credentials_sql += " AWS_TOKEN = %s"
+            credentials_params.append(creds["session_token"])
+
+        # Uncompressed: aws_s3 only gunzips objects with Content-Encoding: gzip
+        # metadata, which Snowflake does not set. NULL is unloaded as unquoted
+        # \N and empty strings as "", matching the CSV COPY path.
+        unload_sql = f"""
+        COPY INTO '{location}'
+        FROM ({query.replace("%", "%%")})
+        CREDENTIALS = ({credentials_sql})
+        FILE_FORMAT = (
+            TYPE = CSV
+            COMPRESSION = NONE
+            FIELD_OPTIONALLY_ENCLOSED_BY = '"'
+            NULL_IF = ('\\\\N')
+            EMPTY_FIELD_AS_NULL = FALSE
+        )
+        MAX_FILE_SIZE = 256000000
+        HEADER = FALSE
+        OVERWRITE = TRUE
+        DETAILED_OUTPUT = TRUE
+        """
+
+        if status_callback:
+            status_callback(f"Unloading from Snowflake to {location}...")
+        with self.sf_conn.cursor() as cursor:
+            cursor.execute(unload_sql, credentials_params)
+            files = [
+                (row["FILE_NAME"], row["ROW_COUNT"])
+                for row in cursor.fetchall()
+                if row["ROW_COUNT"]
+            ]
+
+        if status_callback:
+            status_callback(f"Importing {len(files)} file(s) into PostgreSQL...")
+
+        column_list = ",".join(f'"{col.lower()}"' for col in columns)
+        import_sql = """
+        SELECT aws_s3.table_import_from_s3(
+            %s, %s, %s,
+            aws_commons.create_s3_uri(%s, %s, %s),
+            aws_commons.create_aws_credentials(%s, %s, %s)
+        )
+        """
+        total_rows = 0
+        progress_lock = threading.Lock()
+
+        def _import(file_name, row_count):
+            nonlocal total_rows
+            with self.pg_conn.cursor() as cursor:
+                cursor.execute(
+                    import_sql,
+                    (
+                        f'{target_schema}."{target_table}"',
+                        column_list,
+                        "(FORMAT csv, NULL '\\N')",
+                        bucket,
+                        f"{prefix}/{file_name}",
+                        creds.get("region", ""),
+                        creds.get("access_key_id", ""),
+                        creds.get("secret_access_key", ""),
+                        creds.get("session_token", ""),
+                    ),
+                )
+            with progress_lock:
+                total_rows += row_count
+                if progress_callback:
+                    progress_callback(total_rows)
+                if status_callback:
+                    status_callback(
+                        f"Imported {file_name} ({row_count:,} rows) — {total_rows:,} so far."
+                    )
+
+        max_workers = max(1, min(self.s3_import_workers, len(files)))
+        max_workers = min(max_workers, getattr(self.pg_conn, "max_conn", max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_import, name, count) for name, count in files]
+            for future in as_completed(futures):
+                future.result()
+
+        return total_rows
+
     def _get_columns(self, schema: str, table: str) -> List[str]:
         """Get column names for a table. Returns names in their original Snowflake case."""
+        cache_key = (schema, table.upper())
+        if cache_key in self._columns_cache:
+            return self._columns_cache[cache_key]
+
         query = """
         SELECT COLUMN_NAME
         FROM INFORMATION_SCHEMA.COLUMNS
@@ -529,9 +1184,116 @@ class DataTransferEngine:
         ORDER BY ORDINAL_POSITION
         """
 
-        with self.sf_conn.cursor() as cursor:
+        with self.sf_conn.cursor(dict_cursor=False) as cursor:
             cursor.execute(query, (schema, table))
-            return [row["COLUMN_NAME"] for row in cursor.fetchall()]
+            columns = [row[0] for row in cursor]
+
+        self._columns_cache[cache_key] = columns
+        return columns
+
+    def _get_all_columns(self, schema: str) -> Dict[str, List[str]]:
+        """
+        Get column names for every table in *schema* with a single query.
+
+        Returns {TABLE_NAME: [column, ...]} keyed on the Snowflake table name.
+        """
+        query = """
+        SELECT TABLE_NAME, COLUMN_NAME
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+
+        columns_by_table: Dict[str, List[str]] = {}
+        # Tuple rows: one row per column in the schema, no dict per row
+        with self.sf_conn.cursor(dict_cursor=False) as cursor:
+            cursor.execute(query, (schema,))
+            for table_name, column_name in cursor:
+                columns_by_table.setdefault(table_name, []).append(column_name)
+
+        for table, columns in columns_by_table.items():
+            self._columns_cache[(schema, table)] = columns
+        return columns_by_table
+
+    def _get_all_row_counts(self, schema: str) -> Dict[str, Optional[int]]:
+        """
+        Get metadata row counts for every table in *schema*.
+
+        Returns {TABLE_NAME: ROW_COUNT}. The counts are read by the same
+        INFORMATION_SCHEMA.TABLES query as _get_tables, so this adds no
+        round-trip once the table list has been loaded.
+        """
+        self._get_tables(schema)
+        return {
+            table: row_count
+            for (cached_schema, table), row_count in self._row_count_cache.items()
+            if cached_schema == schema
+        }
+
+    def _get_pg_column_types(
+        self, pg_cursor, target_schema: str, target_table: str
+    ) -> Dict[str, str]:
+        """
+        Return {column_name: base type} for a PostgreSQL table.
+
+        The type modifier is left off (varchar, not varchar(50)): an explicit
+        cast to varchar(n)/char(n) silently truncates, while the INSERT's
+        own assignment cast to the column rejects an over-long value.
+        """
+        pg_cursor.execute(
+            """
+            SELECT a.attname, format_type(a.atttypid, NULL)
+            FROM pg_attribute a
+            WHERE a.attrelid = %s::regclass
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+            """,
+            (f'{target_schema}."{target_table}"',),
+        )
+        return dict(pg_cursor.fetchall())
+
+    def _get_binary_encoders(
+        self, target_schema: str, target_table: str, columns: List[str]
+    ) -> Optional[List[Callable[[str], bytes]]]:
+        """
+        Return one binary COPY encoder per column, in *columns* order.
+
+        Returns None if any target column has a type without a binary encoder,
+        or the connection's client encoding is not UTF8 (the text encoders
+        write UTF-8, which PG would read in the client encoding), in which
+        case the caller falls back to CSV COPY.
+        """
+        query = """
+        SELECT column_name, udt_name
+        FROM information_schema.columns
+        WHERE table_schema = %s
+        AND table_name = %s
+        """
+        with self.pg_conn.cursor() as cursor:
+            client_encoding = cursor.connection.encoding
+            cursor.execute(query, (target_schema.lower(), target_table))
+            udt_names = {
+                row["column_name"]: row["udt_name"] for row in cursor.fetchall()
+            }
+
+        if client_encoding != "UTF8":
+            logger.info(
+                f"{target_schema}.{target_table}: client encoding "
+                f"{client_encoding} is not UTF8, using CSV COPY"
+            )
+            return None
+
+        encoders = []
+        for col in columns:
+            encoder = get_field_encoder(udt_names.get(col.lower(), ""))
+            if encoder is None:
+                logger.info(
+                    f"{target_schema}.{target_table}: column {col.lower()!r} "
+                    f"({udt_names.get(col.lower())}) has no binary encoder, using CSV COPY"
+                )
+                return None
+            encoders.append(encoder)
+        return encoders
 
     def transfer_schema(
         self,
@@ -545,6 +1307,8 @@ class DataTransferEngine:
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
         row_progress_callback: Optional[Callable[[int], None]] = None,
         status_callback: Optional[Callable[[str], None]] = None,
+        bulk_mode: bool = False,
+        use_processes: bool = False,
     ) -> List[TransferStats]:
         """
         Transfer all tables in a schema.
@@ -552,6 +1316,9 @@ class DataTransferEngine:
         checkpoint: optional CheckpointManager.  Completed tables are skipped;
                     interrupted tables resume from their last committed row.
         workers:    number of parallel threads (each gets its own SF connection).
+        bulk_mode:  see transfer_table.
+        use_processes: run the workers as processes instead of threads, each
+                    with its own Snowflake and PostgreSQL connections.
         """
         from .connections import SnowflakeConnection  # local import avoids circular dep
 
@@ -574,6 +1341,11 @@ class DataTransferEngine:
 
         total_tables = len(tables)
 
+        # Metadata for every table in two INFORMATION_SCHEMA queries (tables +
+        # row counts, columns) instead of two per table
+        all_columns = self._get_all_columns(source_schema) if tables else {}
+        all_row_counts = self._get_all_row_counts(source_schema) if tables else {}
+
         def _make_checkpoint_cb(table):
             if checkpoint:
                 return lambda rows: checkpoint.update_progress(table, rows)
@@ -603,12 +1375,48 @@ class DataTransferEngine:
                     progress_callback=row_progress_callback,
                     status_callback=status_callback,
                     checkpoint_callback=_make_checkpoint_cb(table),
+                    bulk_mode=bulk_mode,
+                    columns=all_columns.get(table.upper()),
+                    row_estimate=all_row_counts.get(table.upper()),
                 )
                 _on_table_done(table, stats)
                 stats_list.append(stats)
             return stats_list
 
+        # No point in more workers (Snowflake sessions, pool slots) than tables
+        workers = max(1, min(workers, total_tables))
+
+        if use_processes:
+            return self._transfer_tables_in_processes(
+                tables,
+                workers,
+                checkpoint,
+                progress_callback,
+                row_progress_callback,
+                status_callback,
+                table_kwargs=lambda table: dict(
+                    source_schema=source_schema,
+                    source_table=table,
+                    target_schema=target_schema,
+                    where_clause=where_clause,
+                    limit=limit,
+                    start_offset=checkpoint.get_offset(table) if checkpoint else 0,
+                    bulk_mode=bulk_mode,
+                    columns=all_columns.get(table.upper()),
+                    row_estimate=all_row_counts.get(table.upper()),
+                ),
+            )
+
         # --- Parallel path ---
+        # Each worker holds one pooled PG connection for the whole table, so more
+        # workers than pool slots would fail with PoolError — clamp to the pool.
+        max_conn = getattr(self.pg_conn, "max_conn", workers)
+        if workers > max_conn:
+            logger.warning(
+                f"workers={workers} exceeds PostgreSQL pool size {max_conn}, "
+                f"using {max_conn} workers"
+            )
+            workers = max_conn
         sf_config = self.sf_conn.config
         _print_lock = threading.Lock()
 
@@ -632,7 +1440,7 @@ class DataTransferEngine:
                 )
             sf_conn = SnowflakeConnection(sf_config)
             engine = DataTransferEngine(
-                sf_conn, self.pg_conn, self.batch_size, self.use_copy
+                sf_conn, self.pg_conn, **self._worker_engine_kwargs(workers)
             )
             try:
                 stats = engine.transfer_table(
@@ -642,9 +1450,16 @@ class DataTransferEngine:
                     where_clause=where_clause,
                     limit=limit,
                     start_offset=start_offset,
-                    progress_callback=lambda n: _prefixed_row_progress(table, n),
+                    progress_callback=(
+                        (lambda n: _prefixed_row_progress(table, n))
+                        if row_progress_callback
+                        else None
+                    ),
                     status_callback=lambda m: _prefixed_status(table, m),
                     checkpoint_callback=_make_checkpoint_cb(table),
+                    bulk_mode=bulk_mode,
+                    columns=all_columns.get(table.upper()),
+                    row_estimate=all_row_counts.get(table.upper()),
                 )
             finally:
                 sf_conn.close()
@@ -662,23 +1477,138 @@ class DataTransferEngine:
         table_index = {t: i for i, t in enumerate(tables)}
 
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_to_table = {executor.submit(_transfer_one, t): t for t in tables}
+            future_to_table = {
+                executor.submit(_transfer_one, t): t
+                for t in _largest_first(tables, all_row_counts)
+            }
             for future in as_completed(future_to_table):
                 table = future_to_table[future]
                 stats_list[table_index[table]] = future.result()
 
         return stats_list
 
+    def _worker_engine_kwargs(self, workers: int) -> Dict:
+        """Settings for the per-worker engines of a parallel transfer."""
+        return dict(
+            batch_size=self.batch_size,
+            use_copy=self.use_copy,
+            binary_copy=self.binary_copy,
+            commit_every=self.commit_every,
+            copy_buffer_size=self.copy_buffer_size,
+            download_workers=self.download_workers,
+            s3_stage=self.s3_stage,
+            aws_credentials=self.aws_credentials,
+            # Keep workers x imports within the shared PG pool
+            s3_import_workers=max(1, self.s3_import_workers // workers),
+            max_batch_bytes=self.max_batch_bytes,
+        )
+
+    def _transfer_tables_in_processes(
+        self,
+        tables: List[str],
+        workers: int,
+        checkpoint,
+        progress_callback: Optional[Callable[[str, int, int], None]],
+        row_progress_callback: Optional[Callable[[int], None]],
+        status_callback: Optional[Callable[[str], None]],
+        table_kwargs: Callable[[str], Dict],
+    ) -> List[TransferStats]:
+        """
+        Transfer tables in a pool of worker processes.
+
+        Row encoding is CPU-bound Python, so threads contend for the GIL once a
+        few tables stream at once; processes scale it across cores. Each worker
+        opens its own Snowflake and PostgreSQL connections. Callbacks and
+        checkpoint updates run in this process, fed from a shared queue.
+        """
+        total_tables = len(tables)
+        stats_list = [None] * total_tables
+        table_index = {t: i for i, t in enumerate(tables)}
+        engine_kwargs = self._worker_engine_kwargs(1)
+        # spawn, not fork: the parent holds live connections and threads
+        ctx = multiprocessing.get_context("spawn")
+
+        def _drain(events):
+            while True:
+                try:
+                    kind, table, payload = events.get_nowait()
+                except queue.Empty:
+                    return
+                if kind == "rows" and row_progress_callback:
+                    row_progress_callback(payload)
+                elif kind == "status" and status_callback:
+                    status_callback(f"[{table}] {payload}")
+                elif kind == "checkpoint" and checkpoint:
+                    checkpoint.update_progress(table, payload)
+
+        with ctx.Manager() as manager, ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_transfer_process
+        ) as executor:
+            events = manager.Queue()
+            kwargs_by_table = {table: table_kwargs(table) for table in tables}
+            row_counts = {
+                table.upper(): kwargs["row_estimate"]
+                for table, kwargs in kwargs_by_table.items()
+            }
+            future_to_table = {}
+            for table in _largest_first(tables, row_counts):
+                kwargs = kwargs_by_table[table]
+                if kwargs["start_offset"] and status_callback:
+                    status_callback(
+                        f"[{table}] Resuming from row "
+                        f"{kwargs['start_offset']:,} (checkpoint)"
+                    )
+                future = executor.submit(
+                    _transfer_table_in_process,
+                    self.sf_conn.config,
+                    self.pg_conn.db_alias,
+                    engine_kwargs,
+                    kwargs,
+                    events,
+                    row_progress_callback is not None,
+                )
+                future_to_table[future] = table
+
+            pending = set(future_to_table)
+            completed = 0
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                _drain(events)
+                for future in done:
+                    table = future_to_table[future]
+                    stats = future.result()
+                    if checkpoint and stats.success:
+                        checkpoint.mark_completed(table)
+                    stats_list[table_index[table]] = stats
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(table, completed, total_tables)
+            _drain(events)
+
+        return stats_list
+
     def _get_tables(self, schema: str) -> List[str]:
         """Get all table names in schema."""
+        if schema in self._tables_cache:
+            return self._tables_cache[schema]
+
         query = """
-        SELECT TABLE_NAME
+        SELECT TABLE_NAME, ROW_COUNT
         FROM INFORMATION_SCHEMA.TABLES
         WHERE TABLE_SCHEMA = %s
         AND TABLE_TYPE = 'BASE TABLE'
         ORDER BY TABLE_NAME
         """
 
-        with self.sf_conn.cursor() as cursor:
+        with self.sf_conn.cursor(dict_cursor=False) as cursor:
             cursor.execute(query, (schema,))
-            return [row["TABLE_NAME"].lower() for row in cursor.fetchall()]
+            rows = cursor.fetchall()
+
+        # Row counts come free with the table list — cache them for the
+        # per-table estimate so a schema transfer needs no extra queries.
+        for table_name, row_count in rows:
+            self._row_count_cache[(schema, table_name)] = row_count
+        tables = [table_name.lower() for table_name, _ in rows]
+
+        self._tables_cache[schema] = tables
+        return tables
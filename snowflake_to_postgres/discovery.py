@@ -4,9 +4,34 @@ snowflake_to_postgres/discovery.py
 Schema discovery and introspection for Snowflake databases.
 """
 
+import hashlib
+import json
+import logging
+import pickle
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from snowflake.connector.errors import ProgrammingError
+
+logger = logging.getLogger(__name__)
+
+# Rows per fetchmany() round when streaming metadata result sets
+FETCH_ARRAYSIZE = 10_000
+
+
+def _iter_rows(cur, arraysize: int = FETCH_ARRAYSIZE):
+    """Yield a cursor's rows in fetchmany batches instead of one fetchall list."""
+    cur.arraysize = arraysize
+    while rows := cur.fetchmany(arraysize):
+        yield from rows
 
 
 class ConstraintType(Enum):
@@ -16,12 +41,12 @@ class ConstraintType(Enum):
     CHECK = "CHECK"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Column:
     """Represents a table column."""
 
     name: str
-    data_type: str
+    data_type: str  # upper case, as set by SnowflakeSchemaDiscovery
     is_nullable: bool
     default_value: Optional[str] = None
     character_maximum_length: Optional[int] = None
@@ -31,7 +56,7 @@ class Column:
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """Represents a table constraint."""
 
@@ -43,7 +68,7 @@ class Constraint:
     check_clause: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Index:
     """Represents a table index."""
 
@@ -53,7 +78,7 @@ class Index:
     index_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Represents a database table with full metadata."""
 
@@ -69,7 +94,7 @@ class Table:
     row_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class View:
     """Represents a database view."""
 
@@ -77,7 +102,7 @@ class View:
     ddl: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Procedure:
     """Represents a stored procedure."""
 
@@ -85,7 +110,7 @@ class Procedure:
     ddl: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Schema:
     """Represents a complete database schema."""
 
@@ -99,9 +124,65 @@ class Schema:
 class SnowflakeSchemaDiscovery:
     """Discovers and extracts schema information from Snowflake."""
 
-    def __init__(self, connection):
+    # SHOW COLUMNS reports internal type names where INFORMATION_SCHEMA uses
+    # the SQL names the translator maps from.
+    SHOW_TYPE_NAMES = {
+        "FIXED": "NUMBER",
+        "REAL": "FLOAT",
+    }
+
+    # DESCRIBE TABLE reports e.g. VARCHAR(16777216) / NUMBER(38,0)
+    DESCRIBE_TYPE_PATTERN = re.compile(r"^(\w+)(?:\((\d+)(?:,(\d+))?\))?$")
+
+    # Above this many tables one INFORMATION_SCHEMA.COLUMNS scan beats
+    # fanning out a DESCRIBE TABLE per table
+    DESCRIBE_TABLE_THRESHOLD = 500
+
+    # SHOW returns at most this many rows; a full result may be truncated
+    SHOW_ROW_LIMIT = 10_000
+
+    def __init__(
+        self,
+        connection,
+        use_show_commands: bool = True,
+        max_workers: int = 8,
+        exact_row_count: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            connection: SnowflakeConnection
+            use_show_commands: List objects with SHOW commands (served from the
+                metadata store, no warehouse needed) instead of
+                INFORMATION_SCHEMA. Each SHOW falls back to the
+                INFORMATION_SCHEMA query if it fails.
+            max_workers: Threads used for per-table row count queries. Each
+                opens its own Snowflake session.
+            exact_row_count: Count rows with SELECT COUNT(*) per table instead
+                of reading Snowflake's metadata row count.
+            cache_dir: If set, discovered schemas are pickled here and reused
+                while the schema's catalog fingerprint (latest LAST_ALTERED
+                and object counts) is unchanged.
+            cache_ttl: Maximum age in seconds of a reusable cache file; older
+                files are rediscovered and overwritten. None means no limit,
+                0 always rediscovers (refreshing the cache).
+        """
         self.conn = connection
+        self.use_show_commands = use_show_commands
+        self.max_workers = max(1, max_workers)
+        self.exact_row_count = exact_row_count
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
         self._constraint_warning_shown = False
+        # Per-object catalog lookups, kept for the lifetime of the instance so
+        # repeated discover_schema calls (e.g. with different table filters)
+        # don't re-query them. Keys include the database name.
+        self._row_count_cache: Dict[Tuple[str, str, str], int] = {}
+        self._table_info_cache: Dict[
+            Tuple[str, str, Optional[str]], Dict[str, Tuple[Optional[str], int]]
+        ] = {}
+        self._ddl_cache: Dict[Tuple[str, str, str, str], str] = {}
 
     def discover_schema(
         self,
@@ -120,100 +201,334 @@ class SnowflakeSchemaDiscovery:
         Returns:
             Schema object with all metadata
         """
-        schema = Schema(name=schema_name, database=self.conn.config["database"])
 
         def _status(msg):
             if status_callback:
                 status_callback(msg)
 
+        cache_path = self._get_cache_path(schema_name, table_filter)
+        if cache_path and self._cache_is_fresh(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    schema = pickle.load(f)
+                _status("Schema unchanged since last discovery — using cache")
+                return schema
+            except Exception:
+                # Unreadable/stale format — rediscover and overwrite it
+                pass
+
+        schema = Schema(name=schema_name, database=self.conn.config["database"])
+
         # Get tables (filtered if specified)
-        tables = self._get_tables(schema_name)
+        tables = self._get_tables(schema_name, table_filter)
         if table_filter:
-            table_filter_upper = table_filter.upper()
-            tables = [t for t in tables if t.upper() == table_filter_upper]
             if not tables:
-                import logging
-
-                logger = logging.getLogger(__name__)
                 logger.warning(
                     f"Table '{table_filter}' not found in schema '{schema_name}'. "
                     f"No tables will be processed."
                 )
 
+        only_table = None
+        if table_filter and tables:
+            # SHOW TABLES LIKE is case-insensitive: prefer ORDERS, then
+            # "orders" as typed, over other case variants (which would also
+            # collide in the lower-cased metadata maps)
+            only_table = next(
+                (
+                    name
+                    for wanted in (table_filter.upper(), table_filter)
+                    for name in tables
+                    if name == wanted
+                ),
+                tables[0],
+            )
+            tables = [only_table]
+
         total = len(tables)
         _status(f"Found {total} table(s) — fetching metadata...")
 
-        for i, table_name in enumerate(tables, 1):
-            table = Table(name=table_name.lower(), schema=schema_name.lower())
-            prefix = f"[{i}/{total}] {table_name.lower()}"
-
-            # Get columns
-            _status(f"{prefix} — columns")
-            table.columns = self._get_columns(schema_name, table_name)
-
-            # Get constraints
-            _status(f"{prefix} — constraints")
-            constraints = self._get_constraints(schema_name, table_name)
-            for constraint in constraints:
-                if constraint.type == ConstraintType.PRIMARY_KEY:
-                    table.primary_key = constraint
-                elif constraint.type == ConstraintType.FOREIGN_KEY:
-                    table.foreign_keys.append(constraint)
-                elif constraint.type == ConstraintType.UNIQUE:
-                    table.unique_constraints.append(constraint)
-                elif constraint.type == ConstraintType.CHECK:
-                    table.check_constraints.append(constraint)
-
-            # Get row count estimate
-            _status(f"{prefix} — row count")
-            table.row_count = self._get_row_count(schema_name, table_name)
-
-            # Get table comment
-            table.comment = self._get_table_comment(schema_name, table_name)
-
-            _status(
-                f"{prefix} — done  "
-                f"({len(table.columns)} cols, {table.row_count:,} rows)"
+        # One schema-wide query per metadata kind instead of one per table.
+        # With a table filter the same queries are narrowed to that table.
+        if tables:
+            _status("Fetching columns...")
+            all_columns = self._get_all_columns(schema_name, only_table, tables)
+            _status("Fetching constraints...")
+            all_constraints = self._get_all_constraints(schema_name, only_table)
+            table_info = self._get_all_table_info(schema_name, only_table)
+        else:
+            all_columns, all_constraints, table_info = {}, {}, {}
+
+        # Interned (like column type names) so every Table shares one str
+        schema_lower = sys.intern(schema_name.lower())
+
+        def _build(table_name):
+            table_lower = table_name.lower()
+            comment, row_count = table_info.get(table_lower, (None, 0))
+            table = Table(
+                name=table_lower,
+                schema=schema_lower,
+                columns=all_columns.get(table_lower, []),
+                comment=comment,
             )
-            schema.tables.append(table)
+            self._add_constraints(table, all_constraints.get(table_lower, []))
+            if self.exact_row_count:
+                row_count = self._get_row_count(schema_name, table_name)
+            table.row_count = row_count
+            return table
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Exact row counts run one COUNT(*) per table; overlap them across
+            # workers (each worker thread uses its own Snowflake connection).
+            built = executor.map(_build, tables)
+            for i, table in enumerate(built, 1):
+                _status(
+                    f"[{i}/{total}] {table.name} — done  "
+                    f"({len(table.columns)} cols, {table.row_count:,} rows)"
+                )
+                schema.tables.append(table)
 
         # Skip views and procedures when filtering by specific table
         if not table_filter:
-            # Get views with definitions
-            view_names = self._get_views(schema_name)
-            if view_names:
-                _status(f"Fetching {len(view_names)} view definition(s)...")
-            for view_name in view_names:
-                view_ddl = self._get_view_definition(schema_name, view_name)
-                schema.views.append(View(name=view_name, ddl=view_ddl))
-
-            # Get procedures with definitions
-            procedure_names = self._get_procedures(schema_name)
-            if procedure_names:
-                _status(f"Fetching {len(procedure_names)} procedure definition(s)...")
-            for proc_name in procedure_names:
-                proc_ddl = self._get_procedure_definition(schema_name, proc_name)
-                schema.procedures.append(Procedure(name=proc_name, ddl=proc_ddl))
+            self._add_views_and_procedures(schema, schema_name, _status)
+
+        if cache_path:
+            self._save_cache(cache_path, schema)
 
         return schema
 
-    def _get_tables(self, schema_name: str) -> List[str]:
-        """Get all table names in schema."""
+    def discover_views(self, schema_name: str, status_callback=None) -> Schema:
+        """
+        Discover only the views and procedures of a schema.
+
+        For build-views, which needs no table metadata: skips the column,
+        constraint and table-info queries. The returned Schema has no tables.
+        """
+        schema = Schema(name=schema_name, database=self.conn.config["database"])
+        self._add_views_and_procedures(
+            schema, schema_name, status_callback or (lambda msg: None)
+        )
+        return schema
+
+    def _add_views_and_procedures(self, schema: Schema, schema_name: str, status):
+        """Append the schema's views and procedures, with DDL, to schema."""
+        # Get views with definitions
+        view_names = self._get_views(schema_name)
+        if view_names:
+            status(f"Fetching {len(view_names)} view definition(s)...")
+        view_ddls = self._get_ddl_definitions("VIEW", schema_name, view_names)
+        for view_name, view_ddl in zip(view_names, view_ddls):
+            schema.views.append(View(name=view_name, ddl=view_ddl))
+
+        # Get procedures with definitions
+        procedure_names = self._get_procedures(schema_name)
+        if procedure_names:
+            status(f"Fetching {len(procedure_names)} procedure definition(s)...")
+        proc_ddls = self._get_ddl_definitions("PROCEDURE", schema_name, procedure_names)
+        for proc_name, proc_ddl in zip(procedure_names, proc_ddls):
+            schema.procedures.append(Procedure(name=proc_name, ddl=proc_ddl))
+
+    def _get_cache_path(
+        self, schema_name: str, table_filter: Optional[str]
+    ) -> Optional[Path]:
+        """
+        Return the cache file for this schema's current catalog state.
+
+        The file name hashes the database, schema, discovery options and a
+        fingerprint of the catalog, so any DDL/DML (which bumps LAST_ALTERED)
+        or a dropped object yields a new key. Returns None if caching is off
+        or the fingerprint cannot be read.
+        """
+        if not self.cache_dir:
+            return None
+        query = """
+        SELECT
+            (SELECT MAX(LAST_ALTERED) FROM INFORMATION_SCHEMA.TABLES
+             WHERE TABLE_SCHEMA = %s) as TABLES_ALTERED,
+            (SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES
+             WHERE TABLE_SCHEMA = %s) as TABLE_COUNT,
+            (SELECT MAX(LAST_ALTERED) FROM INFORMATION_SCHEMA.PROCEDURES
+             WHERE PROCEDURE_SCHEMA = %s) as PROCEDURES_ALTERED,
+            (SELECT COUNT(*) FROM INFORMATION_SCHEMA.PROCEDURES
+             WHERE PROCEDURE_SCHEMA = %s) as PROCEDURE_COUNT
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(query, (schema_name,) * 4)
+                fingerprint = cur.fetchone()
+        except Exception:
+            return None
+
+        key = "|".join(
+            str(part)
+            for part in (
+                self.conn.config["database"],
+                schema_name,
+                table_filter,
+                self.exact_row_count,
+                fingerprint["TABLES_ALTERED"],
+                fingerprint["TABLE_COUNT"],
+                fingerprint["PROCEDURES_ALTERED"],
+                fingerprint["PROCEDURE_COUNT"],
+            )
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def _cache_is_fresh(self, cache_path: Path) -> bool:
+        """True if the cache file exists and is within cache_ttl."""
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+        except OSError:
+            return False
+        return self.cache_ttl is None or age < self.cache_ttl
+
+    def _save_cache(self, cache_path: Path, schema: Schema):
+        """Pickle a discovered schema (best effort)."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(schema, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(cache_path)  # atomic rename
+        except Exception as e:
+            logger.warning(f"Could not write discovery cache {cache_path}: {e}")
+
+    def _add_constraints(self, table: Table, constraints: List[Constraint]):
+        """Sort a table's constraints into its PK/FK/UNIQUE/CHECK slots."""
+        for constraint in constraints:
+            if constraint.type == ConstraintType.PRIMARY_KEY:
+                table.primary_key = constraint
+            elif constraint.type == ConstraintType.FOREIGN_KEY:
+                table.foreign_keys.append(constraint)
+            elif constraint.type == ConstraintType.UNIQUE:
+                table.unique_constraints.append(constraint)
+            elif constraint.type == ConstraintType.CHECK:
+                table.check_constraints.append(constraint)
+
+    def _show(
+        self, what: str, scope: str, like: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Run SHOW <what> [LIKE '<like>'] IN <scope> and return its rows
+        (lowercase keys). *like* is matched literally and case-insensitively.
+
+        Returns None when SHOW commands are disabled, the command fails
+        (e.g. 000625 — more than 10k objects) or it returns SHOW_ROW_LIMIT
+        rows and may have been capped, so callers can fall back to
+        INFORMATION_SCHEMA.
+        """
+        if not self.use_show_commands:
+            return None
+        like_clause = ""
+        if like:
+            # Escape LIKE wildcards so the name matches literally, then quote
+            # the pattern as a string literal (backslash is an escape there too)
+            pattern = re.sub(r"([\\_%])", r"\\\1", like)
+            literal = pattern.replace("\\", "\\\\").replace("'", "\\'")
+            like_clause = f"LIKE '{literal}' "
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(f"SHOW {what} {like_clause}IN {scope}")
+                rows = cur.fetchall()
+        except ProgrammingError as e:
+            logger.info(
+                f"SHOW {what} IN {scope} failed ({e.errno}); "
+                f"falling back to INFORMATION_SCHEMA"
+            )
+            return None
+        if len(rows) >= self.SHOW_ROW_LIMIT:
+            logger.info(
+                f"SHOW {what} IN {scope} returned {len(rows):,} rows and may be "
+                f"truncated; falling back to INFORMATION_SCHEMA"
+            )
+            return None
+        return rows
+
+    def _schema_scope(self, schema_name: str) -> str:
+        return f"SCHEMA {self.conn.config['database']}.{schema_name}"
+
+    def _get_tables(
+        self, schema_name: str, table_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get all table names in schema.
+
+        table_name: only return this table (case-insensitive match, filtered
+                    server-side).
+        """
+        rows = self._show("TABLES", self._schema_scope(schema_name), like=table_name)
+        if rows is not None:
+            return sorted(row["name"] for row in rows)
+
         query = """
         SELECT TABLE_NAME
         FROM INFORMATION_SCHEMA.TABLES
         WHERE TABLE_SCHEMA = %s
         AND TABLE_TYPE = 'BASE TABLE'
-        ORDER BY TABLE_NAME
         """
+        params = [schema_name]
+        if table_name:
+            query += "AND UPPER(TABLE_NAME) = %s\n"
+            params.append(table_name.upper())
+        query += "ORDER BY TABLE_NAME"
         with self.conn.cursor() as cur:
-            cur.execute(query, (schema_name,))
-            return [row["TABLE_NAME"] for row in cur.fetchall()]
+            cur.execute(query, params)
+            return [row["TABLE_NAME"] for row in _iter_rows(cur)]
 
     def _get_columns(self, schema_name: str, table_name: str) -> List[Column]:
         """Get all columns for a table."""
+        return self._get_all_columns(schema_name, table_name).get(
+            table_name.lower(), []
+        )
+
+    def _get_all_columns(
+        self,
+        schema_name: str,
+        table_name: Optional[str] = None,
+        tables: Optional[List[str]] = None,
+    ) -> Dict[str, List[Column]]:
+        """
+        Get columns for every table in the schema (or just *table_name*).
+
+        Tries, in order: one SHOW COLUMNS for the schema; a concurrent
+        DESCRIBE TABLE per table when *tables* is given and small enough; one
+        INFORMATION_SCHEMA.COLUMNS query.
+
+        Returns {table_name.lower(): [Column, ...]} in ordinal order.
+        """
+        if table_name:
+            database = self.conn.config["database"]
+            scope = f'TABLE {database}.{schema_name}."{table_name}"'
+        else:
+            scope = self._schema_scope(schema_name)
+        rows = self._show("COLUMNS", scope)
+        if rows is not None:
+            return self._columns_from_show(rows)
+
+        if (
+            self.use_show_commands
+            and tables
+            and len(tables) <= self.DESCRIBE_TABLE_THRESHOLD
+        ):
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    described = executor.map(
+                        lambda name: self._get_columns_via_describe(schema_name, name),
+                        tables,
+                    )
+                    return {
+                        name.lower(): columns
+                        for name, columns in zip(tables, described)
+                    }
+            except ProgrammingError as e:
+                logger.info(
+                    f"DESCRIBE TABLE failed ({e.errno}); "
+                    f"falling back to INFORMATION_SCHEMA"
+                )
+
         query = """
         SELECT
+            TABLE_NAME,
             COLUMN_NAME,
             DATA_TYPE,
             IS_NULLABLE,
@@ -225,36 +540,130 @@ class SnowflakeSchemaDiscovery:
             COMMENT
         FROM INFORMATION_SCHEMA.COLUMNS
         WHERE TABLE_SCHEMA = %s
-        AND TABLE_NAME = %s
-        ORDER BY ORDINAL_POSITION
         """
+        params = [schema_name]
+        if table_name:
+            query += "AND TABLE_NAME = %s\n"
+            params.append(table_name)
+        query += "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+
+        columns_by_table: Dict[str, List[Column]] = {}
+        current_table = table_columns = None
+        # Tuple rows (no per-row dict), unpacked in SELECT order and passed to
+        # Column positionally — the SELECT list mirrors Column's field order.
+        # Rows arrive grouped by table, so the target list only changes
+        # when the table does.
+        with self.conn.cursor(dict_cursor=False) as cur:
+            cur.execute(query, params)
+            rows = _iter_rows(cur)
+            for row_table, column_name, data_type, is_nullable, *rest in rows:
+                if row_table != current_table:
+                    current_table = row_table
+                    table_columns = columns_by_table.setdefault(row_table.lower(), [])
+                table_columns.append(
+                    Column(
+                        column_name.lower(),
+                        sys.intern(data_type.upper()),
+                        is_nullable == "YES",
+                        *rest,
+                    )
+                )
+        return columns_by_table
+
+    def _columns_from_show(self, rows: List[Dict]) -> Dict[str, List[Column]]:
+        """Build Column lists from SHOW COLUMNS rows (listed in column order)."""
+        columns_by_table: Dict[str, List[Column]] = {}
+        for row in rows:
+            # data_type is a JSON blob, e.g.
+            # {"type":"FIXED","precision":38,"scale":0,"nullable":true}
+            type_info = json.loads(row["data_type"])
+            type_name = type_info["type"]
+            is_fixed = type_name == "FIXED"
+            table_columns = columns_by_table.setdefault(row["table_name"].lower(), [])
+            table_columns.append(
+                Column(
+                    name=row["column_name"].lower(),
+                    data_type=sys.intern(
+                        self.SHOW_TYPE_NAMES.get(type_name, type_name).upper()
+                    ),
+                    is_nullable=type_info.get("nullable", True),
+                    default_value=row["default"] or None,
+                    character_maximum_length=type_info.get("length"),
+                    # Timestamps carry precision/scale too; only keep them for
+                    # numbers, as INFORMATION_SCHEMA does
+                    numeric_precision=type_info.get("precision") if is_fixed else None,
+                    numeric_scale=type_info.get("scale") if is_fixed else None,
+                    ordinal_position=len(table_columns) + 1,
+                    comment=row["comment"] or None,
+                )
+            )
+        return columns_by_table
+
+    def _get_columns_via_describe(
+        self, schema_name: str, table_name: str
+    ) -> List[Column]:
+        """Get a table's columns with DESCRIBE TABLE (metadata only, no warehouse)."""
+        database = self.conn.config["database"]
+        columns = []
         with self.conn.cursor() as cur:
-            cur.execute(query, (schema_name, table_name))
-            columns = []
+            cur.execute(f'DESCRIBE TABLE {database}.{schema_name}."{table_name}"')
             for row in cur.fetchall():
+                if row["kind"] != "COLUMN":
+                    continue
+                match = self.DESCRIBE_TYPE_PATTERN.match(row["type"])
+                if match:
+                    type_name, first_arg, second_arg = match.groups()
+                else:
+                    type_name, first_arg, second_arg = row["type"], None, None
+                is_fixed = type_name == "NUMBER"
+                is_text = type_name == "VARCHAR"
                 columns.append(
                     Column(
-                        name=row["COLUMN_NAME"].lower(),
-                        data_type=row["DATA_TYPE"],
-                        is_nullable=row["IS_NULLABLE"] == "YES",
-                        default_value=row["COLUMN_DEFAULT"],
-                        character_maximum_length=row["CHARACTER_MAXIMUM_LENGTH"],
-                        numeric_precision=row["NUMERIC_PRECISION"],
-                        numeric_scale=row["NUMERIC_SCALE"],
-                        ordinal_position=row["ORDINAL_POSITION"],
-                        comment=row["COMMENT"],
+                        name=row["name"].lower(),
+                        # INFORMATION_SCHEMA reports VARCHAR columns as TEXT
+                        data_type=sys.intern("TEXT" if is_text else type_name.upper()),
+                        is_nullable=row["null?"] == "Y",
+                        default_value=row["default"],
+                        character_maximum_length=(
+                            int(first_arg) if is_text and first_arg else None
+                        ),
+                        numeric_precision=(
+                            int(first_arg) if is_fixed and first_arg else None
+                        ),
+                        numeric_scale=(
+                            int(second_arg) if is_fixed and second_arg else None
+                        ),
+                        ordinal_position=len(columns) + 1,
+                        comment=row["comment"],
                     )
                 )
-            return columns
+        return columns
 
     def _get_constraints(self, schema_name: str, table_name: str) -> List[Constraint]:
         """Get all constraints for a table."""
-        constraints = []
+        return self._get_all_constraints(schema_name, table_name).get(
+            table_name.lower(), []
+        )
+
+    def _get_all_constraints(
+        self, schema_name: str, table_name: Optional[str] = None
+    ) -> Dict[str, List[Constraint]]:
+        """
+        Get constraints for every table in the schema (or just *table_name*).
+
+        Returns {table_name.lower(): [Constraint, ...]}.
+        """
+        constraints_by_table: Dict[str, List[Constraint]] = {}
+        # Both queries are ordered by table, constraint and column position, so
+        # each constraint's rows are contiguous and can be grouped in one pass.
+        # Constraint names are only unique per table, hence the compound key.
+        by_constraint = itemgetter("TABLE_NAME", "CONSTRAINT_NAME")
 
         # Try to get primary keys and unique constraints
         try:
             query = """
             SELECT
+                tc.TABLE_NAME,
                 tc.CONSTRAINT_NAME,
                 tc.CONSTRAINT_TYPE,
                 kcu.COLUMN_NAME
@@ -264,36 +673,33 @@ class SnowflakeSchemaDiscovery:
                 AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
                 AND tc.TABLE_NAME = kcu.TABLE_NAME
             WHERE tc.TABLE_SCHEMA = %s
-            AND tc.TABLE_NAME = %s
             AND tc.CONSTRAINT_TYPE IN ('PRIMARY KEY', 'UNIQUE')
-            ORDER BY tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
             """
-
-            constraint_map = {}
+            params = [schema_name]
+            if table_name:
+                query += "AND tc.TABLE_NAME = %s\n"
+                params.append(table_name)
+            query += "ORDER BY tc.TABLE_NAME, tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION"
 
             with self.conn.cursor() as cur:
-                cur.execute(query, (schema_name, table_name))
-                for row in cur.fetchall():
-                    constraint_name = row["CONSTRAINT_NAME"].lower()
-                    if constraint_name not in constraint_map:
-                        constraint_type = (
-                            ConstraintType.PRIMARY_KEY
-                            if row["CONSTRAINT_TYPE"] == "PRIMARY KEY"
-                            else ConstraintType.UNIQUE
+                cur.execute(query, params)
+                for (row_table, name), group in groupby(
+                    _iter_rows(cur), key=by_constraint
+                ):
+                    rows = list(group)
+                    constraints_by_table.setdefault(row_table.lower(), []).append(
+                        Constraint(
+                            name=name.lower(),
+                            type=(
+                                ConstraintType.PRIMARY_KEY
+                                if rows[0]["CONSTRAINT_TYPE"] == "PRIMARY KEY"
+                                else ConstraintType.UNIQUE
+                            ),
+                            columns=[row["COLUMN_NAME"].lower() for row in rows],
                         )
-                        constraint_map[constraint_name] = Constraint(
-                            name=constraint_name, type=constraint_type, columns=[]
-                        )
-                    constraint_map[constraint_name].columns.append(
-                        row["COLUMN_NAME"].lower()
                     )
-
-                constraints.extend(constraint_map.values())
         except Exception:
             if not self._constraint_warning_shown:
-                import logging
-
-                logger = logging.getLogger(__name__)
                 logger.warning(
                     f"Could not fetch constraints (INFORMATION_SCHEMA.KEY_COLUMN_USAGE "
                     f"not accessible). Constraints will be skipped."
@@ -304,6 +710,7 @@ class SnowflakeSchemaDiscovery:
         try:
             fk_query = """
             SELECT
+                kcu.TABLE_NAME,
                 rc.CONSTRAINT_NAME,
                 kcu.COLUMN_NAME,
                 kcu2.TABLE_NAME as REFERENCED_TABLE_NAME,
@@ -316,61 +723,112 @@ class SnowflakeSchemaDiscovery:
                 ON rc.UNIQUE_CONSTRAINT_NAME = kcu2.CONSTRAINT_NAME
                 AND rc.UNIQUE_CONSTRAINT_SCHEMA = kcu2.CONSTRAINT_SCHEMA
             WHERE rc.CONSTRAINT_SCHEMA = %s
-            AND kcu.TABLE_NAME = %s
-            ORDER BY rc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
             """
+            params = [schema_name]
+            if table_name:
+                fk_query += "AND kcu.TABLE_NAME = %s\n"
+                params.append(table_name)
+            fk_query += (
+                "ORDER BY kcu.TABLE_NAME, rc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION"
+            )
 
-            fk_map = {}
             with self.conn.cursor() as cur:
-                cur.execute(fk_query, (schema_name, table_name))
-                for row in cur.fetchall():
-                    constraint_name = row["CONSTRAINT_NAME"].lower()
-                    if constraint_name not in fk_map:
-                        fk_map[constraint_name] = Constraint(
-                            name=constraint_name,
+                cur.execute(fk_query, params)
+                for (row_table, name), group in groupby(
+                    _iter_rows(cur), key=by_constraint
+                ):
+                    rows = list(group)
+                    constraints_by_table.setdefault(row_table.lower(), []).append(
+                        Constraint(
+                            name=name.lower(),
                             type=ConstraintType.FOREIGN_KEY,
-                            columns=[],
-                            referenced_table=row["REFERENCED_TABLE_NAME"].lower(),
-                            referenced_columns=[],
+                            columns=[row["COLUMN_NAME"].lower() for row in rows],
+                            referenced_table=rows[0]["REFERENCED_TABLE_NAME"].lower(),
+                            referenced_columns=[
+                                row["REFERENCED_COLUMN_NAME"].lower() for row in rows
+                            ],
                         )
-                    fk_map[constraint_name].columns.append(row["COLUMN_NAME"].lower())
-                    fk_map[constraint_name].referenced_columns.append(
-                        row["REFERENCED_COLUMN_NAME"].lower()
                     )
-
-                constraints.extend(fk_map.values())
         except Exception:
             # Already warned about KEY_COLUMN_USAGE above; silently skip FK fetch
             pass
 
-        return constraints
+        return constraints_by_table
 
     def _get_row_count(self, schema_name: str, table_name: str) -> int:
-        """Get approximate row count."""
+        """Get exact row count (scans the table)."""
+        cache_key = (self.conn.config["database"], schema_name, table_name)
+        if cache_key in self._row_count_cache:
+            return self._row_count_cache[cache_key]
+
         query = f"SELECT COUNT(*) as cnt FROM {schema_name}.{table_name}"
         try:
             with self.conn.cursor() as cur:
                 cur.execute(query)
                 result = cur.fetchone()
-                return result["CNT"] if result else 0
+                count = result["CNT"] if result else 0
         except Exception:
             return 0
+        self._row_count_cache[cache_key] = count
+        return count
 
     def _get_table_comment(self, schema_name: str, table_name: str) -> Optional[str]:
         """Get table comment."""
+        info = self._get_all_table_info(schema_name, table_name)
+        return info.get(table_name.lower(), (None, 0))[0]
+
+    def _get_all_table_info(
+        self, schema_name: str, table_name: Optional[str] = None
+    ) -> Dict[str, Tuple[Optional[str], int]]:
+        """
+        Get {table_name.lower(): (comment, row_count)} for tables in the schema.
+
+        Row counts come from Snowflake's micro-partition metadata (SHOW TABLES
+        "rows" / INFORMATION_SCHEMA.TABLES.ROW_COUNT), so no table is scanned.
+        """
+        cache_key = (self.conn.config["database"], schema_name, table_name)
+        if cache_key not in self._table_info_cache:
+            self._table_info_cache[cache_key] = self._fetch_table_info(
+                schema_name, table_name
+            )
+        return self._table_info_cache[cache_key]
+
+    def _fetch_table_info(
+        self, schema_name: str, table_name: Optional[str]
+    ) -> Dict[str, Tuple[Optional[str], int]]:
+        rows = self._show("TABLES", self._schema_scope(schema_name), like=table_name)
+        if rows is not None:
+            return {
+                row["name"].lower(): (row["comment"] or None, row["rows"] or 0)
+                for row in rows
+                if not table_name or row["name"] == table_name
+            }
+
         query = """
-        SELECT COMMENT
+        SELECT TABLE_NAME, COMMENT, ROW_COUNT
         FROM INFORMATION_SCHEMA.TABLES
         WHERE TABLE_SCHEMA = %s
-        AND TABLE_NAME = %s
         """
+        params = [schema_name]
+        if table_name:
+            query += "AND TABLE_NAME = %s\n"
+            params.append(table_name)
         with self.conn.cursor() as cur:
-            cur.execute(query, (schema_name, table_name))
-            result = cur.fetchone()
-            return result["COMMENT"] if result and result["COMMENT"] else None
+            cur.execute(query, params)
+            return {
+                row["TABLE_NAME"].lower(): (
+                    row["COMMENT"] or None,
+                    row["ROW_COUNT"] or 0,
+                )
+                for row in _iter_rows(cur)
+            }
 
     def _get_views(self, schema_name: str) -> List[str]:
         """Get all view names in schema."""
+        rows = self._show("VIEWS", self._schema_scope(schema_name))
+        if rows is not None:
+            return sorted(row["name"].lower() for row in rows)
+
         query = """
         SELECT TABLE_NAME
         FROM INFORMATION_SCHEMA.VIEWS
@@ -383,46 +841,89 @@ class SnowflakeSchemaDiscovery:
 
     def _get_view_definition(self, schema_name: str, view_name: str) -> Optional[str]:
         """Get view DDL definition."""
-        query = """
-        SELECT GET_DDL('VIEW', %s || '.' || %s) as DDL
-        """
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute(query, (schema_name, view_name))
-                result = cur.fetchone()
-                return result["DDL"] if result else None
-        except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"Could not fetch view definition for {schema_name}.{view_name}: {e}"
-            )
-            return None
+        return self._get_ddl_definitions("VIEW", schema_name, [view_name])[0]
 
     def _get_procedure_definition(
         self, schema_name: str, procedure_name: str
     ) -> Optional[str]:
         """Get procedure DDL definition."""
-        query = """
-        SELECT GET_DDL('PROCEDURE', %s || '.' || %s) as DDL
+        return self._get_ddl_definitions("PROCEDURE", schema_name, [procedure_name])[0]
+
+    def _get_ddl_definitions(
+        self, kind: str, schema_name: str, names: List[str]
+    ) -> List[Optional[str]]:
+        """
+        Get GET_DDL output for several objects of one kind.
+
+        All queries are submitted asynchronously first and collected
+        afterwards, so Snowflake runs them concurrently and the client pays
+        one round trip per object instead of one full query each.
+        Returns DDLs in the order of *names* (None where GET_DDL failed).
+        """
+        database = self.conn.config["database"]
+        query_ids = {
+            name: self._submit_ddl_async(kind, schema_name, name)
+            for name in names
+            if (database, kind, schema_name, name) not in self._ddl_cache
+        }
+        ddls = []
+        for name in names:
+            cache_key = (database, kind, schema_name, name)
+            if cache_key in self._ddl_cache:
+                ddls.append(self._ddl_cache[cache_key])
+                continue
+            sfqid = query_ids[name]
+            try:
+                ddl = self._collect_ddl(sfqid) if sfqid is not None else None
+            except Exception as e:
+                logger.warning(
+                    f"Could not fetch {kind.lower()} definition for "
+                    f"{schema_name}.{name}: {e}"
+                )
+                ddl = None
+            # Failures are not cached so a later call retries them
+            if ddl is not None:
+                self._ddl_cache[cache_key] = ddl
+            ddls.append(ddl)
+        return ddls
+
+    def _submit_ddl_async(
+        self, kind: str, schema_name: str, name: str
+    ) -> Optional[str]:
+        """Start GET_DDL for one object without waiting; returns its query id."""
+        query = f"""
+        SELECT GET_DDL('{kind}', %s || '.' || %s) as DDL
         """
         try:
             with self.conn.cursor() as cur:
-                cur.execute(query, (schema_name, procedure_name))
-                result = cur.fetchone()
-                return result["DDL"] if result else None
+                cur.execute_async(query, (schema_name, name))
+                return cur.sfqid
         except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(
-                f"Could not fetch procedure definition for {schema_name}.{procedure_name}: {e}"
+                f"Could not fetch {kind.lower()} definition for "
+                f"{schema_name}.{name}: {e}"
             )
             return None
 
+    def _collect_ddl(self, sfqid: str) -> Optional[str]:
+        """Wait for an async GET_DDL query and return its DDL."""
+        sf_conn = self.conn.connect()
+        # Raises if the query failed
+        status = sf_conn.get_query_status_throw_if_error(sfqid)
+        while sf_conn.is_still_running(status):
+            time.sleep(0.05)
+            status = sf_conn.get_query_status_throw_if_error(sfqid)
+        with self.conn.cursor() as cur:
+            cur.get_results_from_sfqid(sfqid)
+            result = cur.fetchone()
+            return result["DDL"] if result else None
+
     def _get_procedures(self, schema_name: str) -> List[str]:
         """Get all procedure names in schema."""
+        rows = self._show("PROCEDURES", self._schema_scope(schema_name))
+        if rows is not None:
+            return sorted({row["name"].lower() for row in rows})
+
         query = """
         SELECT PROCEDURE_NAME
         FROM INFORMATION_SCHEMA.PROCEDURES
@@ -434,8 +935,5 @@ class SnowflakeSchemaDiscovery:
                 cur.execute(query, (schema_name,))
                 return [row["PROCEDURE_NAME"].lower() for row in cur.fetchall()]
         except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(f"Could not fetch procedures: {e}")
             return []
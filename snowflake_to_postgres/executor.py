@@ -5,14 +5,21 @@ Executes DDL statements on PostgreSQL with transaction management.
 """
 
 import logging
+import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Callable, List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Statements sent on their own rather than inside a multi-statement batch
+_ISOLATED_DDL = re.compile(
+    r"\b(CONCURRENTLY|VACUUM|CREATE\s+DATABASE|DROP\s+DATABASE|ALTER\s+SYSTEM)\b",
+    re.IGNORECASE,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of DDL execution."""
 
@@ -27,9 +34,37 @@ class ExecutionResult:
 class PostgresDDLExecutor:
     """Executes DDL statements on PostgreSQL database."""
 
-    def __init__(self, pg_connection, dry_run: bool = False):
+    def __init__(self, pg_connection, dry_run: bool = False, batch_size: int = 100):
+        """
+        Args:
+            pg_connection: PostgresConnection
+            dry_run: Log statements instead of executing them
+            batch_size: Statements sent to the server per round trip. A batch
+                that fails is rolled back and replayed one statement at a time
+                so errors are still reported per statement.
+        """
         self.pg_conn = pg_connection
         self.dry_run = dry_run
+        self.batch_size = max(1, batch_size)
+
+    def _chunk_statements(
+        self, statements: List[str]
+    ) -> Iterator[List[Tuple[int, str]]]:
+        """Group (index, statement) pairs into batches of up to batch_size."""
+        chunk = []
+        for i, statement in enumerate(statements, 1):
+            if _ISOLATED_DDL.search(statement):
+                if chunk:
+                    yield chunk
+                    chunk = []
+                yield [(i, statement)]
+                continue
+            chunk.append((i, statement))
+            if len(chunk) >= self.batch_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
     def execute_ddl(
         self,
@@ -48,7 +83,7 @@ class PostgresDDLExecutor:
         Returns:
             ExecutionResult with execution summary
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         executed = 0
         failed = 0
         errors = []
@@ -57,17 +92,18 @@ class PostgresDDLExecutor:
         if self.dry_run:
             logger.info("DRY RUN MODE - No statements will be executed")
             statements = [s for s in statements if s.strip()]
+            total = len(statements)
             for i, stmt in enumerate(statements, 1):
                 if progress_callback:
-                    progress_callback(i, len(statements), stmt[:100])
-                logger.info(f"[DRY RUN] Statement {i}/{len(statements)}:\n{stmt}")
+                    progress_callback(i, total, stmt[:100])
+                # Lazy %-formatting: per-statement logs are only built if emitted
+                logger.info("[DRY RUN] Statement %d/%d:\n%s", i, total, stmt)
 
-            end_time = datetime.now()
             return ExecutionResult(
                 success=True,
                 statements_executed=len(statements),
                 statements_failed=0,
-                execution_time=(end_time - start_time).total_seconds(),
+                execution_time=time.perf_counter() - start_time,
                 errors=[],
                 warnings=["DRY RUN MODE - No changes were made"],
             )
@@ -80,25 +116,62 @@ class PostgresDDLExecutor:
             # Filter empty statements so progress counts and totals are accurate
             statements = [s for s in statements if s.strip()]
 
+            total = len(statements)
+            # Report roughly 200 times per run rather than once per statement
+            step = max(1, total // 200)
+
             try:
-                for i, statement in enumerate(statements, 1):
+                for chunk in self._chunk_statements(statements):
                     if progress_callback:
-                        progress_callback(i, len(statements), statement[:100])
-
-                    try:
-                        logger.debug(f"Executing statement {i}/{len(statements)}")
-                        cursor.execute(statement)
-                        executed += 1
-
-                    except Exception as e:
-                        failed += 1
-                        error_msg = f"Statement {i} failed: {str(e)}\nStatement: {statement[:200]}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
-
-                        if stop_on_error:
-                            conn.rollback()
-                            raise
+                        for i, statement in chunk:
+                            if i % step == 0 or i == total:
+                                progress_callback(i, total, statement[:100])
+
+                    if len(chunk) > 1:
+                        # One round trip for the whole batch; the savepoint lets
+                        # a failed batch be undone and replayed statement by
+                        # statement to pinpoint the error.
+                        cursor.execute("SAVEPOINT ddl_batch")
+                        try:
+                            logger.debug(
+                                "Executing statements %d-%d/%d",
+                                chunk[0][0],
+                                chunk[-1][0],
+                                total,
+                            )
+                            cursor.execute("\n;\n".join(stmt for _, stmt in chunk))
+                            cursor.execute("RELEASE SAVEPOINT ddl_batch")
+                            executed += len(chunk)
+                            continue
+                        except Exception as e:
+                            cursor.execute("ROLLBACK TO SAVEPOINT ddl_batch")
+                            logger.debug(
+                                "Batch failed (%s); retrying statements one by one", e
+                            )
+
+                    for i, statement in chunk:
+                        try:
+                            logger.debug("Executing statement %d/%d", i, total)
+                            if not stop_on_error:
+                                cursor.execute("SAVEPOINT ddl_statement")
+                            cursor.execute(statement)
+                            executed += 1
+                            if not stop_on_error:
+                                # Don't let subtransactions pile up until commit
+                                cursor.execute("RELEASE SAVEPOINT ddl_statement")
+
+                        except Exception as e:
+                            failed += 1
+                            error_msg = f"Statement {i} failed: {str(e)}\nStatement: {statement[:200]}"
+                            errors.append(error_msg)
+                            logger.error(error_msg)
+
+                            if stop_on_error:
+                                conn.rollback()
+                                raise
+                            # Keep the transaction usable for the next statement
+                            cursor.execute("ROLLBACK TO SAVEPOINT ddl_statement")
+                            cursor.execute("RELEASE SAVEPOINT ddl_statement")
 
                 # Commit all changes
                 conn.commit()
@@ -112,13 +185,11 @@ class PostgresDDLExecutor:
             finally:
                 cursor.close()
 
-        end_time = datetime.now()
-
         return ExecutionResult(
             success=failed == 0,
             statements_executed=executed,
             statements_failed=failed,
-            execution_time=(end_time - start_time).total_seconds(),
+            execution_time=time.perf_counter() - start_time,
             errors=errors,
             warnings=warnings,
         )
@@ -4,19 +4,32 @@ snowflake_to_postgres/management/commands/sf_migrate.py
 Django management command for Snowflake to PostgreSQL migration.
 """
 
+import argparse
+import io
 import json
+import os
+import queue
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
 
+try:
+    import orjson  # optional: faster `discover --format json`
+except ImportError:
+    orjson = None
+
 from ...checkpoint import CheckpointManager
 from ...connections import PostgresConnection, SnowflakeConnection
 from ...data_transfer import DataTransferEngine
 from ...discovery import SnowflakeSchemaDiscovery
-from ...executor import PostgresDDLExecutor
+from ...executor import ExecutionResult, PostgresDDLExecutor
 from ...translator import PostgresDDLGenerator
 from ...validator import DataValidator
 from ...view_procedure_translator import (
@@ -24,6 +37,14 @@ from ...view_procedure_translator import (
     SnowflakeViewTranslator,
 )
 
+# Minimum seconds between two per-batch/per-statement progress lines
+PROGRESS_INTERVAL = 0.25
+
+# On-disk discovery cache, relative to the working directory
+SCHEMA_CACHE_DIR = Path(".sf_migrate_cache")
+# Fingerprints of tables that passed validation, under SCHEMA_CACHE_DIR
+VALIDATION_FINGERPRINTS = "validation_fingerprints.json"
+
 
 class TeeWriter:
     """Writes to the wrapped stdout AND, if a log_file is open, streams to it in real-time."""
@@ -115,8 +136,48 @@ Examples:
         parser.add_argument(
             "--batch-size",
             type=int,
-            default=10000,
-            help="Batch size for data transfer (default: 10000)",
+            default=100000,
+            help="Batch size for data transfer (default: 100000). Batches are "
+            "shrunk automatically for very wide rows (see --target-batch-bytes).",
+        )
+        parser.add_argument(
+            "--target-batch-bytes",
+            type=int,
+            default=64 * 1024 * 1024,
+            metavar="BYTES",
+            help="Approximate size cap per transfer batch (default: 64 MiB). The "
+            "first batch of each table measures the row width and later "
+            "batches shrink to fit. 0 disables the cap.",
+        )
+
+        # Parallel workers for validation
+        parser.add_argument(
+            "--validate-workers",
+            type=int,
+            default=4,
+            help="Number of tables validated concurrently (default: 4). "
+            "Each worker uses its own Snowflake connection.",
+        )
+
+        # Discovery cache
+        parser.add_argument(
+            "--schema-cache-ttl",
+            type=int,
+            default=900,
+            metavar="SECONDS",
+            help="Reuse a discovered schema cached under "
+            f"{SCHEMA_CACHE_DIR}/ for up to SECONDS (default: 900), as long as "
+            "the Snowflake catalog is unchanged.",
+        )
+        parser.add_argument(
+            "--no-schema-cache",
+            action="store_true",
+            help="Neither read nor write the on-disk schema discovery cache.",
+        )
+        parser.add_argument(
+            "--refresh-schema-cache",
+            action="store_true",
+            help="Rediscover the schema and overwrite its cache entry.",
         )
 
         # Parallel workers for data transfer
@@ -125,7 +186,16 @@ Examples:
             type=int,
             default=1,
             help="Number of parallel table-transfer workers (default: 1). "
-            "Each worker uses its own Snowflake connection.",
+            "Each worker uses its own Snowflake connection. build also creates "
+            "tables over this many PostgreSQL connections (one transaction "
+            "each, so a failed build is not rolled back as a whole).",
+        )
+        parser.add_argument(
+            "--worker-processes",
+            action="store_true",
+            help="Run --workers as separate processes instead of threads, each "
+            "with its own Snowflake and PostgreSQL connections. Spreads row "
+            "encoding across CPU cores.",
         )
 
         # Checkpoint file for resumable transfers
@@ -138,6 +208,71 @@ Examples:
             "Example: --checkpoint checkpoints/my_schema.json",
         )
 
+        # Commit frequency for data transfer
+        parser.add_argument(
+            "--commit-every",
+            type=int,
+            metavar="N",
+            help="Commit every N batches during transfer. 0 commits once per table "
+            "(fastest; a failed table is rolled back entirely). "
+            "Default: 1 with --checkpoint, otherwise 0.",
+        )
+
+        # Concurrent Snowflake result downloads per table
+        parser.add_argument(
+            "--download-workers",
+            type=int,
+            default=1,
+            help="Download N Snowflake result chunks concurrently per table "
+            "during transfer (default: 1 = sequential fetch).",
+        )
+
+        # Server-side transfer through S3
+        parser.add_argument(
+            "--s3-stage",
+            type=str,
+            metavar="S3_URL",
+            help="Transfer via S3 instead of through this machine: Snowflake "
+            "unloads to S3_URL (e.g. s3://bucket/prefix) and PostgreSQL imports "
+            "with the aws_s3 extension. Uses AWS_ACCESS_KEY_ID, "
+            "AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN and AWS_REGION.",
+        )
+
+        # Load method for data transfer
+        parser.add_argument(
+            "--copy",
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help="Load rows with COPY FROM STDIN (default). --no-copy falls back "
+            "to batched INSERTs, e.g. for targets that reject COPY.",
+        )
+        parser.add_argument(
+            "--copy-format",
+            type=str,
+            choices=["binary", "csv"],
+            default="binary",
+            help="COPY wire format (default: binary). Binary is used per table "
+            "only when every target column type has an encoder, otherwise CSV.",
+        )
+
+        # Bulk-load mode for data transfer
+        parser.add_argument(
+            "--bulk-mode",
+            action="store_true",
+            help="During transfer, drop non-constraint indexes and set tables "
+            "UNLOGGED, then rebuild indexes, SET LOGGED and ANALYZE afterwards.",
+        )
+
+        # Deferred constraints for migrate
+        parser.add_argument(
+            "--defer-constraints",
+            action="store_true",
+            help="During migrate, create tables without PRIMARY KEY/UNIQUE/FOREIGN "
+            "KEY constraints and add them after the data transfer, building "
+            "--workers tables' keys in parallel. Combine with --bulk-mode to also "
+            "load UNLOGGED.",
+        )
+
         # WHERE clause for filtering data
         parser.add_argument(
             "--where",
@@ -185,6 +320,17 @@ Examples:
             help="Continue processing even if errors occur",
         )
 
+        # DDL statements per round trip
+        parser.add_argument(
+            "--ddl-batch",
+            type=int,
+            default=100,
+            metavar="N",
+            help="DDL statements sent to PostgreSQL per round trip for build and "
+            "destroy (default: 100). A failing batch is replayed one statement "
+            "at a time.",
+        )
+
         # Skip post-action interactive prompts (verify / save logs)
         parser.add_argument(
             "--no-prompt",
@@ -211,9 +357,38 @@ Examples:
                 "Default: 0 (skipped)."
             ),
         )
+        parser.add_argument(
+            "--sample-method",
+            choices=["row", "bernoulli", "system"],
+            default="row",
+            help="Snowflake sampling for Layer 5: row = exactly --sample-size "
+            "rows (default), bernoulli = row-level percentage, system = whole "
+            "micro-partitions (cheapest, least random).",
+        )
+        parser.add_argument(
+            "--hash-sample",
+            action="store_true",
+            help="Layer 5: first compare checksums of about --sample-size rows "
+            "(picked by primary key hash) computed inside both databases; only "
+            "if they differ are rows fetched and compared one by one.",
+        )
+        parser.add_argument(
+            "--skip-unchanged",
+            action="store_true",
+            help="Validate: skip tables that passed a previous run and whose "
+            "Snowflake and PostgreSQL metadata show no writes since (recorded "
+            f"in {SCHEMA_CACHE_DIR}/{VALIDATION_FINGERPRINTS}).",
+        )
 
     def handle(self, *args, **options):
         action = options["action"]
+        # Schemas discovered during this run, keyed by (schema, table filter)
+        self._schema_cache = {}
+        # Connections shared by every handler in this run (see _snowflake)
+        self._sf_conn = None
+        self._pg_conns = {}
+        # Set while _progress_printer is active
+        self._progress_queue = None
         start_time = datetime.now()
         suppress = (
             options.get("force") or options.get("no_prompt") or options.get("dry_run")
@@ -232,8 +407,10 @@ Examples:
             try:
                 self._assert_schema_exists(options["schema"])
             except CommandError:
+                self._close_connections()
                 raise
             except Exception as e:
+                self._close_connections()
                 raise CommandError(f"Could not verify schema: {e}")
 
         # Actions that support log saving / verify prompts
@@ -266,26 +443,22 @@ Examples:
         tee = TeeWriter(self.stdout, log_file)
         self.stdout = tee
 
+        # action -> (handler, post-action prompt: None = none, else verify flag)
+        handlers = {
+            "discover": (self.handle_discover, None),
+            "build": (self.handle_build, False),
+            "build-views": (self.handle_build_views, False),
+            "destroy": (self.handle_destroy, None),
+            "migrate": (self.handle_migrate, True),
+            "transfer": (self.handle_transfer, True),
+            "validate": (self.handle_validate, False),
+        }
+
         try:
-            if action == "discover":
-                self.handle_discover(options)
-            elif action == "build":
-                self.handle_build(options)
-                self._post_action(options, action, verify=False)
-            elif action == "build-views":
-                self.handle_build_views(options)
-                self._post_action(options, action, verify=False)
-            elif action == "destroy":
-                self.handle_destroy(options)
-            elif action == "migrate":
-                self.handle_migrate(options)
-                self._post_action(options, action, verify=True)
-            elif action == "transfer":
-                self.handle_transfer(options)
-                self._post_action(options, action, verify=True)
-            elif action == "validate":
-                self.handle_validate(options)
-                self._post_action(options, action, verify=False)
+            handler, verify = handlers[action]
+            handler(options)
+            if verify is not None:
+                self._post_action(options, action, verify=verify)
 
         except Exception as e:
             raise CommandError(f"Error during {action}: {str(e)}")
@@ -304,6 +477,7 @@ Examples:
             self.stdout.write(self.style.HTTP_INFO(f"\nTotal time: {duration}"))
 
         finally:
+            self._close_connections()
             if log_file:
                 end_time = datetime.now()
                 log_file.write(f"\nEnded: {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -318,17 +492,20 @@ Examples:
 
         self.stdout.write(self.style.WARNING(f"Discovering schema: {schema_name}"))
 
-        with SnowflakeConnection() as sf_conn:
-            discovery = SnowflakeSchemaDiscovery(sf_conn)
-            schema = discovery.discover_schema(schema_name)
+        schema = self._load_or_discover_schema(options, schema_name)
 
         if output_format == "json":
             self._output_schema_json(schema)
         else:
             self._output_schema_text(schema)
 
-    def handle_build(self, options):
-        """Build schema structure without data."""
+    def handle_build(self, options, defer_constraints=False):
+        """
+        Build schema structure without data.
+
+        defer_constraints: create bare tables; migrate adds the constraints
+                           after the transfer (_add_deferred_constraints).
+        """
         source_schema = self._get_required_option(options, "schema")
         target_schema = options.get("target") or source_schema.lower()
         db_alias = options["db"]
@@ -340,29 +517,46 @@ Examples:
         )
 
         # Discover schema
-        table_filter = options.get("table")
-        with SnowflakeConnection() as sf_conn:
-            discovery = SnowflakeSchemaDiscovery(sf_conn)
-            schema = discovery.discover_schema(
-                source_schema,
-                table_filter=table_filter,
-                status_callback=self._create_status_callback(),
-            )
+        schema = self._load_or_discover_schema(
+            options,
+            source_schema,
+            table_filter=options.get("table"),
+            status_callback=self._create_status_callback(),
+        )
 
         # Generate DDL
         self.stdout.write(f"  Generating DDL for {len(schema.tables)} table(s)...")
         generator = PostgresDDLGenerator()
-        ddl_statements = generator.generate_schema_ddl(schema, target_schema)
 
-        # Output to file if specified
+        # Output to file if specified (streamed as it is generated)
         if output_file:
-            self._write_ddl_to_file(ddl_statements, output_file)
+            self._write_ddl_to_file(
+                generator.iter_schema_ddl(
+                    schema, target_schema, defer_constraints=defer_constraints
+                ),
+                output_file,
+            )
             self.stdout.write(self.style.SUCCESS(f"DDL written to: {output_file}"))
             return
 
+        workers = max(1, options.get("workers", 1))
+        if workers > 1 and len(schema.tables) > 1:
+            self._build_in_parallel(
+                options, generator, schema, target_schema, workers, defer_constraints
+            )
+            return
+
+        ddl_statements = list(
+            generator.iter_schema_ddl(
+                schema, target_schema, defer_constraints=defer_constraints
+            )
+        )
+
         # Execute DDL
-        with PostgresConnection(db_alias) as pg_conn:
-            executor = PostgresDDLExecutor(pg_conn, dry_run=dry_run)
+        with self._postgres(db_alias) as pg_conn:
+            executor = PostgresDDLExecutor(
+                pg_conn, dry_run=dry_run, batch_size=options.get("ddl_batch", 100)
+            )
 
             real_count = sum(1 for s in ddl_statements if s.strip())
             if real_count == 0:
@@ -384,6 +578,51 @@ Examples:
 
             self._display_execution_result(result)
 
+    def _build_in_parallel(
+        self, options, generator, schema, target_schema, workers, defer_constraints
+    ):
+        """
+        Execute build DDL over several connections.
+
+        The schema is created first and foreign keys last; in between the
+        tables (which have no FKs yet, so no ordering between them) are split
+        into one contiguous slice per worker, each sent in --ddl-batch round
+        trips in its own transaction.
+        """
+        schema_statements, table_groups, fk_statements = (
+            generator.generate_schema_ddl_groups(
+                schema, target_schema, defer_constraints=defer_constraints
+            )
+        )
+        per_worker = -(-len(table_groups) // workers)  # ceil division
+        slices = [
+            [stmt for group in table_groups[i : i + per_worker] for stmt in group]
+            for i in range(0, len(table_groups), per_worker)
+        ]
+        total = (
+            len(schema_statements) + sum(map(len, table_groups)) + len(fk_statements)
+        )
+        self.stdout.write(
+            f"Executing {total} DDL statements ({len(slices)} parallel workers)..."
+        )
+
+        stop_on_error = not options["continue_on_error"]
+        start = time.perf_counter()
+        with self._postgres(options["db"], max_conn=max(5, workers)) as pg_conn:
+            executor = PostgresDDLExecutor(
+                pg_conn,
+                dry_run=options["dry_run"],
+                batch_size=options.get("ddl_batch", 100),
+            )
+            results = [executor.execute_ddl(schema_statements, stop_on_error)]
+            results += self._execute_ddl_groups(
+                executor, slices, workers, stop_on_error
+            )
+            if fk_statements:
+                results.append(executor.execute_ddl(fk_statements, stop_on_error))
+
+        self._display_execution_result(self._merge_execution_results(results, start))
+
     def handle_build_views(self, options):
         """Build views only."""
         source_schema = self._get_required_option(options, "schema")
@@ -396,13 +635,14 @@ Examples:
             self.style.WARNING(f"Building views: {source_schema} -> {target_schema}")
         )
 
-        # Discover schema (views + procedures only; tables not needed here)
-        with SnowflakeConnection() as sf_conn:
-            discovery = SnowflakeSchemaDiscovery(sf_conn)
-            schema = discovery.discover_schema(
-                source_schema,
-                status_callback=self._create_status_callback(),
-            )
+        # Views + procedures only; tables are not needed here. Within migrate
+        # the full schema discovered by build already has them.
+        schema = self._schema_cache.get((source_schema, None))
+        if schema is None:
+            with self._snowflake() as sf_conn:
+                schema = SnowflakeSchemaDiscovery(sf_conn).discover_views(
+                    source_schema, status_callback=self._create_status_callback()
+                )
 
         if not schema.views and not schema.procedures:
             self.stdout.write("  No views or procedures found.")
@@ -454,7 +694,7 @@ Examples:
             self.stdout.write(
                 f"  Executing {len(translated_views)} translated view(s)..."
             )
-            with PostgresConnection(db_alias) as pg_conn:
+            with self._postgres(db_alias) as pg_conn:
                 for view_name, pg_ddl, cross_deps in translated_views:
                     if cross_deps:
                         self.stdout.write(
@@ -472,8 +712,12 @@ Examples:
                     try:
                         with pg_conn.connection() as conn:
                             conn.autocommit = True
-                            with conn.cursor() as cur:
-                                cur.execute(pg_ddl)
+                            try:
+                                with conn.cursor() as cur:
+                                    cur.execute(pg_ddl)
+                            finally:
+                                # The pool is shared with later steps
+                                conn.autocommit = False
                         self.stdout.write(self.style.SUCCESS(f"  ✓ {view_name}"))
                         succeeded.append(view_name)
                     except Exception as e:
@@ -555,8 +799,10 @@ Examples:
         drop_statements = generator.generate_drop_schema_ddl(target_schema)
 
         # Execute
-        with PostgresConnection(db_alias) as pg_conn:
-            executor = PostgresDDLExecutor(pg_conn, dry_run=dry_run)
+        with self._postgres(db_alias) as pg_conn:
+            executor = PostgresDDLExecutor(
+                pg_conn, dry_run=dry_run, batch_size=options.get("ddl_batch", 100)
+            )
             result = executor.execute_ddl(drop_statements)
 
             self._display_execution_result(result)
@@ -569,21 +815,112 @@ Examples:
         self.stdout.write(self.style.WARNING("=== FULL MIGRATION ==="))
         self.stdout.write(f"Source: {source_schema}")
         self.stdout.write(f"Target: {target_schema}")
+        defer_constraints = options.get("defer_constraints", False)
+        steps = 4 if defer_constraints else 3
 
         # Step 1: Build schema
-        self.stdout.write(self.style.WARNING("\n[1/3] Building schema structure..."))
-        self.handle_build(options)
+        self.stdout.write(
+            self.style.WARNING(f"\n[1/{steps}] Building schema structure...")
+        )
+        self.handle_build(options, defer_constraints=defer_constraints)
 
         # Step 2: Transfer data
-        self.stdout.write(self.style.WARNING("\n[2/3] Transferring data..."))
+        self.stdout.write(self.style.WARNING(f"\n[2/{steps}] Transferring data..."))
         self.handle_transfer(options)
 
-        # Step 3: Build views (best effort)
-        self.stdout.write(self.style.WARNING("\n[3/3] Building views (best effort)..."))
+        # Step 3: Add the constraints left out of step 1
+        if defer_constraints:
+            self.stdout.write(
+                self.style.WARNING(f"\n[3/{steps}] Adding deferred constraints...")
+            )
+            self._add_deferred_constraints(options, source_schema, target_schema)
+
+        # Last step: Build views (best effort)
+        self.stdout.write(
+            self.style.WARNING(f"\n[{steps}/{steps}] Building views (best effort)...")
+        )
         self.handle_build_views(options)
 
         self.stdout.write(self.style.SUCCESS("\n=== MIGRATION COMPLETE ==="))
 
+    def _add_deferred_constraints(self, options, source_schema, target_schema):
+        """
+        Add the PK/UNIQUE/FK constraints that handle_build deferred.
+
+        Each table's keys are built in their own transaction on their own
+        pooled connection, --workers tables at a time; foreign keys follow
+        once every key they reference exists.
+        """
+        db_alias = options["db"]
+        workers = max(1, options.get("workers", 1))
+        stop_on_error = not options["continue_on_error"]
+
+        schema = self._load_or_discover_schema(
+            options, source_schema, table_filter=options.get("table")
+        )
+        (
+            key_groups,
+            fk_statements,
+        ) = PostgresDDLGenerator().generate_post_load_constraint_ddl(
+            schema, target_schema
+        )
+        self.stdout.write(
+            f"  {sum(map(len, key_groups))} key constraint(s) on "
+            f"{len(key_groups)} table(s), {len(fk_statements)} foreign key(s)"
+        )
+
+        start = time.perf_counter()
+        with self._postgres(db_alias, max_conn=max(5, workers)) as pg_conn:
+            executor = PostgresDDLExecutor(
+                pg_conn,
+                dry_run=options["dry_run"],
+                batch_size=options.get("ddl_batch", 100),
+            )
+            results = self._execute_ddl_groups(
+                executor, key_groups, workers, stop_on_error
+            )
+            if fk_statements:
+                results.append(
+                    executor.execute_ddl(fk_statements, stop_on_error=stop_on_error)
+                )
+
+        self._display_execution_result(self._merge_execution_results(results, start))
+
+    def _execute_ddl_groups(self, executor, groups, workers, stop_on_error):
+        """
+        Run independent groups of DDL concurrently, one execute_ddl per group.
+
+        Each group is its own transaction on its own pooled connection. With
+        stop_on_error, the first failure cancels groups not yet started and
+        raises CommandError; groups already committed stay.
+        """
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(executor.execute_ddl, group, stop_on_error)
+                for group in groups
+            ]
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # stop_on_error: the failing group was rolled back
+                    for pending in futures:
+                        pending.cancel()
+                    raise CommandError(f"DDL execution failed: {e}")
+        return results
+
+    def _merge_execution_results(self, results, start):
+        """Combine per-group ExecutionResults into one summary since start."""
+        return ExecutionResult(
+            success=all(r.success for r in results),
+            statements_executed=sum(r.statements_executed for r in results),
+            statements_failed=sum(r.statements_failed for r in results),
+            execution_time=time.perf_counter() - start,
+            errors=[e for r in results for e in r.errors],
+            warnings=list(dict.fromkeys(w for r in results for w in r.warnings)),
+        )
+
     def handle_transfer(self, options):
         """Transfer data from Snowflake to PostgreSQL."""
         source_schema = self._get_required_option(options, "schema")
@@ -593,18 +930,50 @@ Examples:
         workers = options.get("workers", 1)
         table_filter = [options["table"]] if options.get("table") else None
         where_clause = options.get("where")
+        if where_clause and ";" in where_clause:
+            # Spliced into the Snowflake SELECT — one predicate, not a script
+            raise CommandError("--where must not contain ';'")
         limit = options.get("limit")
         checkpoint_path = options.get("checkpoint")
+        commit_every = options.get("commit_every")
+        if commit_every is None:
+            # Checkpoints only advance on commit, so keep per-batch commits for resume
+            commit_every = 1 if checkpoint_path else 0
+        bulk_mode = options.get("bulk_mode", False)
+        use_processes = options.get("worker_processes", False)
+        use_copy = options.get("copy", True)
+        binary_copy = options.get("copy_format", "binary") == "binary"
+        download_workers = options.get("download_workers", 1)
+        s3_stage = options.get("s3_stage")
+        aws_credentials = None
+        if s3_stage:
+            aws_credentials = {
+                "access_key_id": os.getenv("AWS_ACCESS_KEY_ID"),
+                "secret_access_key": os.getenv("AWS_SECRET_ACCESS_KEY"),
+                "session_token": os.getenv("AWS_SESSION_TOKEN", ""),
+                "region": os.getenv("AWS_REGION", ""),
+            }
+            if not aws_credentials["access_key_id"]:
+                raise CommandError(
+                    "--s3-stage requires AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY"
+                )
 
         self.stdout.write(
             self.style.WARNING(f"Transferring data: {source_schema} -> {target_schema}")
         )
         if workers > 1:
-            self.stdout.write(f"  Workers: {workers} (parallel)")
+            mode = "processes" if use_processes else "parallel"
+            self.stdout.write(f"  Workers: {workers} ({mode})")
         if where_clause:
             self.stdout.write(f"  WHERE: {where_clause}")
         if limit:
             self.stdout.write(f"  LIMIT: {limit:,}")
+        if bulk_mode:
+            self.stdout.write(
+                "  Bulk mode: indexes dropped, tables UNLOGGED during load"
+            )
+        if not use_copy:
+            self.stdout.write("  Load method: INSERT (--no-copy)")
 
         checkpoint = None
         if checkpoint_path:
@@ -626,25 +995,37 @@ Examples:
         # Scale PG pool to match worker count (plus a small buffer)
         pg_max_conn = max(5, workers + 2)
 
-        with SnowflakeConnection() as sf_conn, PostgresConnection(
+        with self._snowflake() as sf_conn, self._postgres(
             db_alias, max_conn=pg_max_conn
         ) as pg_conn:
             transfer_engine = DataTransferEngine(
-                sf_conn, pg_conn, batch_size=batch_size
+                sf_conn,
+                pg_conn,
+                batch_size=batch_size,
+                use_copy=use_copy,
+                binary_copy=binary_copy,
+                commit_every=commit_every,
+                download_workers=download_workers,
+                max_batch_bytes=options.get("target_batch_bytes", 64 * 1024 * 1024),
+                s3_stage=s3_stage,
+                aws_credentials=aws_credentials,
             )
 
-            stats_list = transfer_engine.transfer_schema(
-                source_schema=source_schema,
-                target_schema=target_schema,
-                table_filter=table_filter,
-                where_clause=where_clause,
-                limit=limit,
-                workers=workers,
-                checkpoint=checkpoint,
-                progress_callback=self._create_transfer_progress_callback(),
-                row_progress_callback=self._create_row_progress_callback(),
-                status_callback=self._create_status_callback(),
-            )
+            with self._progress_printer(enabled=workers > 1):
+                stats_list = transfer_engine.transfer_schema(
+                    source_schema=source_schema,
+                    target_schema=target_schema,
+                    table_filter=table_filter,
+                    where_clause=where_clause,
+                    limit=limit,
+                    workers=workers,
+                    checkpoint=checkpoint,
+                    progress_callback=self._create_transfer_progress_callback(),
+                    row_progress_callback=self._create_row_progress_callback(),
+                    status_callback=self._create_status_callback(),
+                    bulk_mode=bulk_mode,
+                    use_processes=use_processes,
+                )
 
             self._display_transfer_stats(stats_list)
 
@@ -655,6 +1036,8 @@ Examples:
         db_alias = options["db"]
         table_name = options.get("table")
         sample_size = options.get("sample_size", 0)
+        sample_method = options.get("sample_method", "row")
+        validate_workers = max(1, options.get("validate_workers", 4))
 
         self.stdout.write(
             self.style.WARNING(f"Validating: {source_schema} -> {target_schema}")
@@ -662,19 +1045,32 @@ Examples:
         if sample_size:
             self.stdout.write(f"  Row sample size: {sample_size:,} (Layer 5 enabled)")
 
-        with SnowflakeConnection() as sf_conn, PostgresConnection(db_alias) as pg_conn:
+        # Scale PG pool to match worker count (plus a small buffer)
+        pg_max_conn = max(5, validate_workers + 2)
+
+        with self._snowflake() as sf_conn, self._postgres(
+            db_alias, max_conn=pg_max_conn
+        ) as pg_conn:
             validator = DataValidator(
                 sf_conn,
                 pg_conn,
                 sample_size=sample_size,
+                sample_method=sample_method,
+                hash_sample=options.get("hash_sample", False),
                 status_callback=self._create_status_callback(),
+                fingerprint_cache=(
+                    SCHEMA_CACHE_DIR / VALIDATION_FINGERPRINTS
+                    if options.get("skip_unchanged")
+                    else None
+                ),
             )
 
             if table_name:
                 tables = [table_name.upper()]
             else:
-                # Lightweight table list — no COUNT(*) like discover_schema does
-                with sf_conn.cursor() as cur:
+                # Lightweight table list — no COUNT(*) like discover_schema does.
+                # Tuple cursor: one name per row needs no per-row dict.
+                with sf_conn.cursor(dict_cursor=False) as cur:
                     cur.execute(
                         """
                         SELECT TABLE_NAME
@@ -684,72 +1080,172 @@ Examples:
                         """,
                         (source_schema,),
                     )
-                    tables = [row["TABLE_NAME"] for row in cur.fetchall()]
+                    tables = [row[0] for row in cur]
+                # Column/PK metadata for all tables in two queries, not 2 per table
+                validator.prefetch_metadata(source_schema)
 
             total = len(tables)
+            if validate_workers > 1 and total > 1:
+                self.stdout.write(f"  Workers: {validate_workers} (parallel)")
+
+            # Each table's checks are shown as soon as it is validated; the
+            # summary follows at the end (or on Ctrl-C, for the tables done).
             results = []
+            result_iter = self._iter_validation_results(
+                validator, tables, source_schema, target_schema, validate_workers
+            )
+            try:
+                # closing(): on Ctrl-C, cancel the queued tables right away
+                with closing(result_iter):
+                    for result in result_iter:
+                        results.append(result)
+                        # One write per table, so it can't interleave with
+                        # the workers' status lines
+                        self._display_table_result(result)
+            except KeyboardInterrupt:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"\nInterrupted after {len(results)}/{total} table(s)"
+                    )
+                )
+                self._display_validation_results(results)
+                raise
+            finally:
+                # --skip-unchanged: keep the tables that passed, even on Ctrl-C
+                validator.save_fingerprints()
+
+            self._display_validation_results(results)
+
+    def _iter_validation_results(
+        self, validator, tables, source_schema, target_schema, workers
+    ):
+        """
+        Validate tables, yielding each TableValidationResult as it completes.
+
+        With workers > 1 tables are validated concurrently (in completion
+        order). Validation is dominated by query round trips, so tables
+        overlap well. Every DataValidator query opens its own cursor:
+        Snowflake cursors come from the calling thread's connection and
+        PostgreSQL cursors from the pool, so the threads never share one.
+        """
+        total = len(tables)
+        if workers <= 1 or total <= 1:
             for i, table in enumerate(tables, 1):
                 self.stdout.write(
                     self.style.HTTP_INFO(f"\n  [{i}/{total}] {table.lower()}")
                 )
-                result = validator.validate_table(
+                yield validator.validate_table(
                     sf_schema=source_schema,
                     sf_table=table,
                     pg_schema=target_schema,
                     pg_table=table.lower(),
                 )
-                results.append(result)
+            return
 
-            self._display_validation_results(results)
+        print_lock = threading.Lock()
+        status_callback = self._create_status_callback()
+
+        def _validate_one(table):
+            def _status(message):
+                with print_lock:
+                    status_callback(f"[{table.lower()}] {message.strip()}")
+
+            return validator.with_status_callback(_status).validate_table(
+                sf_schema=source_schema,
+                sf_table=table,
+                pg_schema=target_schema,
+                pg_table=table.lower(),
+            )
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(_validate_one, table) for table in tables]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # On Ctrl-C, don't start the remaining tables
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _display_table_result(self, result):
+        """Display one table's validation checks."""
+        lines = []
+        out = lines.append
+        success, error = self.style.SUCCESS, self.style.ERROR
+        check_icons = {
+            None: self.style.WARNING("  ⚠"),
+            True: success("  ✓"),
+            False: error("  ✗"),
+        }
+        table_status = success("✓") if result.passed else error("✗")
+        out(f"\n{table_status} {result.table_name}  ({result.duration:.1f}s)")
+        for check in result.checks:
+            out(f"{check_icons[check.passed]} {check.name}: {check.message}")
+            if check.details:
+                for detail in check.details[:10]:
+                    out(f"      {detail}")
+                if len(check.details) > 10:
+                    out(f"      ... and {len(check.details) - 10} more")
+        self._write_lines(lines)
 
     def _display_validation_results(self, results):
-        """Display validation results summary."""
+        """Display the validation summary (per-table checks are shown as they finish)."""
+        lines = []
+        out = lines.append
+        success, error = self.style.SUCCESS, self.style.ERROR
         all_passed = all(r.passed for r in results)
         total_checks = sum(len(r.checks) for r in results)
         failed_checks = sum(len(r.failed_checks) for r in results)
 
         if all_passed:
-            self.stdout.write(self.style.SUCCESS("\n=== Validation Complete ==="))
+            out(success("\n=== Validation Complete ==="))
         else:
-            self.stdout.write(self.style.ERROR("\n=== Validation FAILED ==="))
-
-        for result in results:
-            table_status = (
-                self.style.SUCCESS("✓") if result.passed else self.style.ERROR("✗")
-            )
-            self.stdout.write(
-                f"\n{table_status} {result.table_name}  ({result.duration:.1f}s)"
-            )
-            for check in result.checks:
-                if check.passed is None:
-                    icon = self.style.WARNING("  ⚠")
-                elif check.passed:
-                    icon = self.style.SUCCESS("  ✓")
-                else:
-                    icon = self.style.ERROR("  ✗")
-                self.stdout.write(f"{icon} {check.name}: {check.message}")
-                if check.details:
-                    for detail in check.details[:10]:
-                        self.stdout.write(f"      {detail}")
-                    if len(check.details) > 10:
-                        self.stdout.write(
-                            f"      ... and {len(check.details) - 10} more"
-                        )
+            out(error("\n=== Validation FAILED ==="))
+            failed_tables = [r.table_name for r in results if not r.passed]
+            out(f"Failed tables    : {', '.join(failed_tables)}")
 
-        self.stdout.write(f"\nTables validated : {len(results)}")
-        self.stdout.write(f"Checks run       : {total_checks}")
-        self.stdout.write(f"Checks failed    : {failed_checks}")
+        out(f"\nTables validated : {len(results)}")
+        out(f"Checks run       : {total_checks}")
+        out(f"Checks failed    : {failed_checks}")
 
         if all_passed:
-            self.stdout.write(
-                self.style.SUCCESS("\nAll checks passed. Data integrity confirmed.")
-            )
+            out(success("\nAll checks passed. Data integrity confirmed."))
         else:
-            self.stdout.write(
-                self.style.ERROR(
-                    f"\n{failed_checks} check(s) failed. Review output above."
-                )
+            out(error(f"\n{failed_checks} check(s) failed. Review output above."))
+
+        self._write_lines(lines)
+
+    def _load_or_discover_schema(
+        self, options, schema_name, table_filter=None, status_callback=None
+    ):
+        """
+        Discover a Snowflake schema, reusing earlier results where possible.
+
+        Within one run (e.g. build then build-views during migrate) a schema is
+        discovered once. Across runs, discovery pickles its result under
+        SCHEMA_CACHE_DIR and reuses it for --schema-cache-ttl seconds while the
+        schema's catalog fingerprint is unchanged.
+        """
+        key = (schema_name, table_filter)
+        if key in self._schema_cache:
+            return self._schema_cache[key]
+
+        cache_dir = None if options.get("no_schema_cache") else SCHEMA_CACHE_DIR
+        cache_ttl = (
+            0
+            if options.get("refresh_schema_cache")
+            else options.get("schema_cache_ttl", 900)
+        )
+        with self._snowflake() as sf_conn:
+            discovery = SnowflakeSchemaDiscovery(
+                sf_conn, cache_dir=cache_dir, cache_ttl=cache_ttl
             )
+            schema = discovery.discover_schema(
+                schema_name,
+                table_filter=table_filter,
+                status_callback=status_callback,
+            )
+        self._schema_cache[key] = schema
+        return schema
 
     def _get_required_option(self, options, key):
         """Get required option or raise error."""
@@ -760,50 +1256,78 @@ Examples:
 
     def _output_schema_text(self, schema):
         """Output schema in human-readable text format."""
-        self.stdout.write(self.style.SUCCESS(f"\n=== Schema: {schema.name} ==="))
-        self.stdout.write(f"Database: {schema.database}")
-        self.stdout.write(f"Tables: {len(schema.tables)}")
-        self.stdout.write(f"Views: {len(schema.views)}")
-        self.stdout.write(f"Procedures: {len(schema.procedures)}\n")
+        lines = []
+        out = lines.append
+        info = self.style.HTTP_INFO
+        out(self.style.SUCCESS(f"\n=== Schema: {schema.name} ==="))
+        out(f"Database: {schema.database}")
+        out(f"Tables: {len(schema.tables)}")
+        out(f"Views: {len(schema.views)}")
+        out(f"Procedures: {len(schema.procedures)}\n")
 
         for table in schema.tables:
-            self.stdout.write(self.style.HTTP_INFO(f"\nTable: {table.name}"))
-            self.stdout.write(f"  Rows: ~{table.row_count:,}")
-            self.stdout.write(f"  Columns: {len(table.columns)}")
+            out(info(f"\nTable: {table.name}"))
+            out(f"  Rows: ~{table.row_count:,}")
+            out(f"  Columns: {len(table.columns)}")
 
             if table.primary_key:
                 pk_cols = ", ".join(table.primary_key.columns)
-                self.stdout.write(f"  Primary Key: {pk_cols}")
+                out(f"  Primary Key: {pk_cols}")
 
             if table.foreign_keys:
-                self.stdout.write(f"  Foreign Keys: {len(table.foreign_keys)}")
+                out(f"  Foreign Keys: {len(table.foreign_keys)}")
 
             # Show columns
-            self.stdout.write("  Columns:")
+            out("  Columns:")
             for col in table.columns[:10]:
                 nullable = "NULL" if col.is_nullable else "NOT NULL"
-                self.stdout.write(f"    - {col.name}: {col.data_type} {nullable}")
+                out(f"    - {col.name}: {col.data_type} {nullable}")
 
             if len(table.columns) > 10:
-                self.stdout.write(f"    ... and {len(table.columns) - 10} more")
+                out(f"    ... and {len(table.columns) - 10} more")
 
         # Show views
         if schema.views:
-            self.stdout.write(self.style.HTTP_INFO("\nViews:"))
+            out(info("\nViews:"))
             for view in schema.views:
-                self.stdout.write(f"  - {view.name}")
+                out(f"  - {view.name}")
 
         # Show procedures
         if schema.procedures:
-            self.stdout.write(self.style.HTTP_INFO("\nProcedures:"))
+            out(info("\nProcedures:"))
             for proc in schema.procedures:
-                self.stdout.write(f"  - {proc.name}")
+                out(f"  - {proc.name}")
+
+        self._write_lines(lines)
 
     def _output_schema_json(self, schema):
-        """Output schema in JSON format."""
-        output = {"schema": schema.name, "database": schema.database, "tables": []}
+        """
+        Output schema in JSON format.
 
-        for table in schema.tables:
+        Tables are serialised and written one at a time, so only one table's
+        dict is alive at once. The layout matches dumping the whole document
+        with indent=2.
+        """
+        if orjson is not None:
+
+            def dumps(obj):
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+        else:
+
+            def dumps(obj):
+                # Raw UTF-8 like orjson, not \uXXXX escapes, so both match
+                return json.dumps(obj, indent=2, ensure_ascii=False)
+
+        write = self.stdout.write
+        write(
+            "{\n"
+            f'  "schema": {dumps(schema.name)},\n'
+            f'  "database": {dumps(schema.database)},\n'
+            '  "tables": [',
+            ending="",
+        )
+        for i, table in enumerate(schema.tables):
             table_data = {
                 "name": table.name,
                 "row_count": table.row_count,
@@ -816,14 +1340,21 @@ Examples:
                     for col in table.columns
                 ],
             }
-            output["tables"].append(table_data)
-
-        self.stdout.write(json.dumps(output, indent=2))
+            # Nest the table two levels deep: indent every line by 4 spaces
+            body = dumps(table_data).replace("\n", "\n    ")
+            write(f"{',' if i else ''}\n    {body}", ending="")
+        write(("\n  ]" if schema.tables else "]") + "\n}")
 
     def _create_progress_callback(self):
         """Create progress callback for DDL execution."""
+        last_emit = [0.0]
 
         def callback(current, total, statement):
+            # At most one line per PROGRESS_INTERVAL, but always the last one
+            now = time.monotonic()
+            if current < total and now - last_emit[0] < PROGRESS_INTERVAL:
+                return
+            last_emit[0] = now
             self.stdout.write(f"  [{current}/{total}] {statement[:80]}...")
 
         return callback
@@ -832,16 +1363,29 @@ Examples:
         """Create progress callback for data transfer."""
 
         def callback(table_name, current, total):
-            self.stdout.write(f"  [{current}/{total}] Transferring: {table_name}")
+            self._progress(f"  [{current}/{total}] Transferring: {table_name}")
 
         return callback
 
     def _create_row_progress_callback(self):
-        """Create progress callback for per-batch row progress."""
+        """
+        Create progress callback for per-batch row progress.
+
+        Returns None when stdout is not a terminal (piped, CI): the per-table
+        summary already reports row counts, so headless runs skip this output.
+        """
+        if not self.stdout.isatty():
+            return None
+
+        last_emit = [0.0]
 
         def callback(rows_so_far):
-            self.stdout.write(f"    {rows_so_far:,} rows transferred so far...")
-            self.stdout.flush()
+            # Fires once per batch; skip batches within PROGRESS_INTERVAL
+            now = time.monotonic()
+            if now - last_emit[0] < PROGRESS_INTERVAL:
+                return
+            last_emit[0] = now
+            self._progress(f"    {rows_so_far:,} rows transferred so far...")
 
         return callback
 
@@ -849,11 +1393,60 @@ Examples:
         """Create callback for status messages during transfer."""
 
         def callback(message):
-            self.stdout.write(f"    {message}")
-            self.stdout.flush()
+            self._progress(f"    {message}")
 
         return callback
 
+    def _progress(self, line):
+        """Write a progress line now, or queue it for _progress_printer."""
+        if self._progress_queue is not None:
+            self._progress_queue.put(line)
+        else:
+            self.stdout.write(line)
+            self.stdout.flush()
+
+    @contextmanager
+    def _progress_printer(self, enabled=True):
+        """
+        Hand progress lines to a single printer thread while the block runs.
+
+        Parallel transfer workers then only enqueue a string instead of
+        writing to the terminal while holding the engine's print lock; the
+        printer coalesces whatever has queued up into one write.
+        """
+        if not enabled:
+            yield
+            return
+
+        lines = queue.SimpleQueue()
+
+        def _print():
+            done = False
+            while not done:
+                batch = [lines.get()]
+                while True:
+                    try:
+                        batch.append(lines.get_nowait())
+                    except queue.Empty:
+                        break
+                # The None sentinel is the last item ever queued
+                done = batch[-1] is None
+                if done:
+                    batch.pop()
+                if batch:
+                    self._write_lines(batch)
+                    self.stdout.flush()
+
+        printer = threading.Thread(target=_print, name="progress-printer", daemon=True)
+        self._progress_queue = lines
+        printer.start()
+        try:
+            yield
+        finally:
+            self._progress_queue = None
+            lines.put(None)
+            printer.join()
+
     def _display_execution_result(self, result):
         """Display execution result summary."""
         if result.success:
@@ -877,38 +1470,88 @@ Examples:
 
     def _display_transfer_stats(self, stats_list):
         """Display data transfer statistics."""
+        lines = []
+        out = lines.append
+        error = self.style.ERROR
         total_rows = sum(s.rows_transferred for s in stats_list)
         total_time = sum(s.transfer_time for s in stats_list)
         successful = sum(1 for s in stats_list if s.success)
 
-        self.stdout.write(self.style.SUCCESS(f"\n=== Transfer Complete ==="))
-        self.stdout.write(f"Tables processed: {len(stats_list)}")
-        self.stdout.write(f"Successful: {successful}")
-        self.stdout.write(f"Failed: {len(stats_list) - successful}")
-        self.stdout.write(f"Total rows: {total_rows:,}")
-        self.stdout.write(f"Total time: {total_time:.2f}s")
+        out(self.style.SUCCESS(f"\n=== Transfer Complete ==="))
+        out(f"Tables processed: {len(stats_list)}")
+        out(f"Successful: {successful}")
+        out(f"Failed: {len(stats_list) - successful}")
+        out(f"Total rows: {total_rows:,}")
+        out(f"Total time: {total_time:.2f}s")
 
         if total_time > 0:
-            self.stdout.write(f"Average speed: {total_rows / total_time:.0f} rows/s")
+            out(f"Average speed: {total_rows / total_time:.0f} rows/s")
 
         # Show per-table stats
-        self.stdout.write("\nPer-table statistics:")
+        out("\nPer-table statistics:")
         for stats in stats_list:
             status = "✓" if stats.success else "✗"
-            self.stdout.write(
+            out(
                 f"  {status} {stats.table_name}: "
                 f"{stats.rows_transferred:,} rows in {stats.transfer_time:.2f}s "
                 f"({stats.rows_per_second:.0f} rows/s)"
             )
 
             if not stats.success:
-                self.stdout.write(
-                    self.style.ERROR(f"      Error: {stats.error_message}")
-                )
+                out(error(f"      Error: {stats.error_message}"))
+
+        self._write_lines(lines)
+
+    def _write_lines(self, lines):
+        """
+        Write many lines with a single stdout.write.
+
+        Each line gets a newline unless it already ends with one, as
+        stdout.write would add; the log tee then also writes once.
+        """
+        buf = io.StringIO()
+        for line in lines:
+            buf.write(line if line.endswith("\n") else line + "\n")
+        self.stdout.write(buf.getvalue(), ending="")
+
+    @contextmanager
+    def _snowflake(self):
+        """
+        Yield this run's SnowflakeConnection, opening it on first use.
+
+        Every handler in a run shares it (migrate's build, transfer and
+        build-views steps, the verify prompt), so a run logs in to Snowflake
+        once. handle() closes it when the action finishes.
+        """
+        if self._sf_conn is None:
+            self._sf_conn = SnowflakeConnection()
+        yield self._sf_conn
+
+    @contextmanager
+    def _postgres(self, db_alias, max_conn=5):
+        """Yield this run's PostgresConnection for db_alias, with >= max_conn slots."""
+        pg_conn = self._pg_conns.get(db_alias)
+        if pg_conn is None:
+            pg_conn = PostgresConnection(db_alias, max_conn=max_conn)
+            self._pg_conns[db_alias] = pg_conn
+        elif pg_conn.max_conn < max_conn:
+            # Too small for this step: reopen (lazily) at the larger size
+            pg_conn.close_pool()
+            pg_conn.min_conn = pg_conn.max_conn = max_conn
+        yield pg_conn
+
+    def _close_connections(self):
+        """Close the connections opened by _snowflake and _postgres."""
+        if self._sf_conn is not None:
+            self._sf_conn.close()
+            self._sf_conn = None
+        for pg_conn in self._pg_conns.values():
+            pg_conn.close_pool()
+        self._pg_conns = {}
 
     def _assert_schema_exists(self, schema_name: str) -> None:
         """Raise CommandError immediately if the schema doesn't exist in Snowflake."""
-        with SnowflakeConnection() as sf_conn:
+        with self._snowflake() as sf_conn:
             with sf_conn.cursor() as cur:
                 cur.execute(
                     "SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA "
@@ -1005,7 +1648,6 @@ Examples:
 
     def _write_ddl_to_file(self, statements, filepath):
         """Write DDL statements to file."""
-        with open(filepath, "w") as f:
-            for stmt in statements:
-                f.write(stmt)
-                f.write("\n\n")
+        # 1 MB buffer: large schemas flush in a few big writes
+        with open(filepath, "w", buffering=1 << 20) as f:
+            f.writelines(f"{stmt}\n\n" for stmt in statements)
@@ -4,11 +4,19 @@ snowflake_to_postgres/translator.py
 Translates Snowflake data types and DDL to PostgreSQL equivalents.
 """
 
-from typing import List, Optional
+import heapq
+from typing import Iterator, List, Optional, Tuple
 
 from .discovery import Column, Schema, Table
 
 
+def quote_ident(name: str) -> str:
+    """Double-quote a PostgreSQL identifier, escaping embedded quotes."""
+    if '"' in name:
+        name = name.replace('"', '""')
+    return f'"{name}"'
+
+
 class SnowflakeToPostgresTypeMapper:
     """Maps Snowflake data types to PostgreSQL data types."""
 
@@ -53,33 +61,62 @@ class SnowflakeToPostgresTypeMapper:
         "ARRAY": "JSONB",
     }
 
+    def __init__(self):
+        # base type -> formatter, built once so map_type is a single dict hit
+        self._dispatch = self._build_dispatch()
+
+    def _build_dispatch(self):
+        """Precompile TYPE_MAPPING into per-type formatting functions."""
+
+        def numeric(pg_type):
+            def fmt(column):
+                precision = column.numeric_precision
+                if not precision:
+                    return pg_type
+                scale = column.numeric_scale
+                if scale is not None and scale > 0:
+                    return f"{pg_type}({precision},{scale})"
+                return f"{pg_type}({precision})"
+
+            return fmt
+
+        def character(pg_type):
+            def fmt(column):
+                length = column.character_maximum_length
+                return f"{pg_type}({length})" if length else pg_type
+
+            return fmt
+
+        def fixed(pg_type):
+            return lambda column: pg_type
+
+        dispatch = {}
+        for base_type, pg_type in self.TYPE_MAPPING.items():
+            if pg_type in ("NUMERIC", "DECIMAL"):
+                dispatch[base_type] = numeric(pg_type)
+            elif pg_type in ("VARCHAR", "CHAR"):
+                dispatch[base_type] = character(pg_type)
+            else:
+                dispatch[base_type] = fixed(pg_type)
+        return dispatch
+
     def map_type(self, column: Column) -> str:
         """
         Map a Snowflake column type to PostgreSQL equivalent.
-        """
-        base_type = column.data_type.upper()
 
-        # Handle parameterized types
-        if base_type in self.TYPE_MAPPING:
-            pg_type = self.TYPE_MAPPING[base_type]
-
-            # Add precision/scale for numeric types
-            if pg_type in ("NUMERIC", "DECIMAL") and column.numeric_precision:
-                if column.numeric_scale is not None and column.numeric_scale > 0:
-                    return (
-                        f"{pg_type}({column.numeric_precision},{column.numeric_scale})"
-                    )
-                else:
-                    return f"{pg_type}({column.numeric_precision})"
-
-            # Add length for character types
-            if pg_type in ("VARCHAR", "CHAR") and column.character_maximum_length:
-                return f"{pg_type}({column.character_maximum_length})"
+        Unknown types default to TEXT.
+        """
+        # Discovery stores data_type upper-cased, so the exact lookup hits for
+        # every mapped type; .upper() is only paid for hand-built Columns
+        # and types missing from TYPE_MAPPING
+        fmt = self._dispatch.get(column.data_type)
+        if fmt is None:
+            fmt = self._dispatch.get(column.data_type.upper(), _map_unknown)
+        return fmt(column)
 
-            return pg_type
 
-        # Default to TEXT for unknown types
-        return "TEXT"
+def _map_unknown(column: Column) -> str:
+    return "TEXT"
 
 
 class PostgresDDLGenerator:
@@ -94,69 +131,136 @@ class PostgresDDLGenerator:
         """
         Generate complete DDL for a schema.
         """
+        return list(self.iter_schema_ddl(schema, target_schema))
+
+    def iter_schema_ddl(
+        self, schema: Schema, target_schema: str = None, defer_constraints=False
+    ) -> Iterator[str]:
+        """
+        Yield the statements of generate_schema_ddl one at a time.
+
+        Lets callers such as `build --output` write DDL as it is produced
+        instead of holding every statement of a large schema in memory.
+
+        defer_constraints: create bare tables (no PK/UNIQUE/FK) for a bulk
+                           load; apply generate_post_load_constraint_ddl after.
+        """
         target_schema = target_schema or schema.name.lower()
-        ddl_statements = []
 
         # Create schema
-        ddl_statements.append(f"CREATE SCHEMA IF NOT EXISTS {target_schema};")
-        ddl_statements.append("")
+        yield f"CREATE SCHEMA IF NOT EXISTS {target_schema};"
+        yield ""
 
         # Generate table DDL (sorted by dependencies)
         sorted_tables = self._sort_tables_by_dependencies(schema.tables)
 
         for table in sorted_tables:
-            ddl_statements.extend(self.generate_table_ddl(table, target_schema))
-            ddl_statements.append("")
+            yield from self.generate_table_ddl(
+                table, target_schema, inline_constraints=not defer_constraints
+            )
+            yield ""
+
+        if defer_constraints:
+            return
 
         # Generate foreign keys separately (after all tables exist)
         for table in schema.tables:
             fk_statements = self._generate_foreign_keys(table, target_schema)
             if fk_statements:
-                ddl_statements.extend(fk_statements)
-                ddl_statements.append("")
+                yield from fk_statements
+                yield ""
 
-        return ddl_statements
+    def generate_schema_ddl_groups(
+        self, schema: Schema, target_schema: str = None, defer_constraints=False
+    ) -> Tuple[List[str], List[List[str]], List[str]]:
+        """
+        Split iter_schema_ddl into phases for concurrent execution.
 
-    def generate_table_ddl(self, table: Table, schema: str) -> List[str]:
-        """Generate DDL for a single table."""
-        statements = []
+        Returns (schema_statements, table_groups, fk_statements). Foreign keys
+        are only added in the last phase, so the per-table groups do not
+        depend on each other and can run on separate connections.
+        """
+        target_schema = target_schema or schema.name.lower()
+        schema_statements = [f"CREATE SCHEMA IF NOT EXISTS {target_schema};"]
+        table_groups = [
+            self.generate_table_ddl(
+                table, target_schema, inline_constraints=not defer_constraints
+            )
+            for table in schema.tables
+        ]
+        fk_statements = (
+            []
+            if defer_constraints
+            else [
+                statement
+                for table in schema.tables
+                for statement in self._generate_foreign_keys(table, target_schema)
+            ]
+        )
+        return schema_statements, table_groups, fk_statements
+
+    def generate_post_load_constraint_ddl(
+        self, schema: Schema, target_schema: str = None
+    ) -> Tuple[List[List[str]], List[str]]:
+        """
+        Generate the constraints left out by iter_schema_ddl(defer_constraints=True).
 
-        # Table creation
-        columns_ddl = []
-        for col in table.columns:
-            col_def = self._generate_column_definition(col)
-            columns_ddl.append(f"    {col_def}")
+        Returns (key_groups, fk_statements): one group of PK/UNIQUE statements
+        per table, which can be built concurrently, and the foreign keys, which
+        must run after every key they reference exists.
+        """
+        target_schema = target_schema or schema.name.lower()
+        key_groups = [
+            statements
+            for table in schema.tables
+            if (statements := self._generate_key_constraints(table, target_schema))
+        ]
+        fk_statements = [
+            statement
+            for table in schema.tables
+            for statement in self._generate_foreign_keys(table, target_schema)
+        ]
+        return key_groups, fk_statements
+
+    def generate_table_ddl(
+        self, table: Table, schema: str, inline_constraints: bool = True
+    ) -> List[str]:
+        """
+        Generate DDL for a single table.
 
-        # Add primary key inline if exists
-        if table.primary_key:
-            pk_cols = ", ".join([f'"{col}"' for col in table.primary_key.columns])
-            columns_ddl.append(
-                f'    CONSTRAINT "{table.primary_key.name}" PRIMARY KEY ({pk_cols})'
-            )
+        inline_constraints=False leaves out PRIMARY KEY/UNIQUE; see
+        _generate_key_constraints for adding them later.
+        """
+        qualified = f"{schema}.{quote_ident(table.name)}"
 
-        # Add unique constraints inline
-        for constraint in table.unique_constraints:
-            unique_cols = ", ".join([f'"{col}"' for col in constraint.columns])
-            columns_ddl.append(
-                f'    CONSTRAINT "{constraint.name}" UNIQUE ({unique_cols})'
+        # Table creation
+        columns_ddl = [
+            f"    {self._generate_column_definition(col)}" for col in table.columns
+        ]
+        if inline_constraints:
+            columns_ddl.extend(
+                f"    {definition}" for definition in self._key_definitions(table)
             )
 
-        table_ddl = f'CREATE TABLE IF NOT EXISTS {schema}."{table.name}" (\n'
-        table_ddl += ",\n".join(columns_ddl)
-        table_ddl += "\n);"
-
-        statements.append(table_ddl)
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {qualified} (\n"
+            + ",\n".join(columns_ddl)
+            + "\n);"
+        ]
 
         # Add table comment
         if table.comment:
-            comment_sql = f"COMMENT ON TABLE {schema}.\"{table.name}\" IS '{self._escape_string(table.comment)}';"
-            statements.append(comment_sql)
+            statements.append(
+                f"COMMENT ON TABLE {qualified} IS '{self._escape_string(table.comment)}';"
+            )
 
         # Add column comments
-        for col in table.columns:
-            if col.comment:
-                comment_sql = f'COMMENT ON COLUMN {schema}."{table.name}"."{col.name}" IS \'{self._escape_string(col.comment)}\';'
-                statements.append(comment_sql)
+        statements.extend(
+            f"COMMENT ON COLUMN {qualified}.{quote_ident(col.name)} "
+            f"IS '{self._escape_string(col.comment)}';"
+            for col in table.columns
+            if col.comment
+        )
 
         return statements
 
@@ -164,7 +268,7 @@ class PostgresDDLGenerator:
         """Generate column definition."""
         pg_type = self.type_mapper.map_type(col)
 
-        col_def = f'"{col.name}" {pg_type}'
+        col_def = f"{quote_ident(col.name)} {pg_type}"
 
         if not col.is_nullable:
             col_def += " NOT NULL"
@@ -177,18 +281,47 @@ class PostgresDDLGenerator:
 
         return col_def
 
+    def _key_definitions(self, table: Table) -> List[str]:
+        """PRIMARY KEY and UNIQUE constraint clauses for a table."""
+        definitions = []
+
+        # Primary key
+        if table.primary_key:
+            pk_cols = ", ".join(map(quote_ident, table.primary_key.columns))
+            definitions.append(
+                f"CONSTRAINT {quote_ident(table.primary_key.name)} PRIMARY KEY ({pk_cols})"
+            )
+
+        # Unique constraints
+        for constraint in table.unique_constraints:
+            unique_cols = ", ".join(map(quote_ident, constraint.columns))
+            definitions.append(
+                f"CONSTRAINT {quote_ident(constraint.name)} UNIQUE ({unique_cols})"
+            )
+
+        return definitions
+
+    def _generate_key_constraints(self, table: Table, schema: str) -> List[str]:
+        """Generate ALTER TABLE statements adding PRIMARY KEY/UNIQUE constraints."""
+        return [
+            f"ALTER TABLE {schema}.{quote_ident(table.name)} ADD {definition};"
+            for definition in self._key_definitions(table)
+        ]
+
     def _generate_foreign_keys(self, table: Table, schema: str) -> List[str]:
         """Generate foreign key constraints."""
         statements = []
 
         for fk in table.foreign_keys:
-            fk_cols = ", ".join([f'"{col}"' for col in fk.columns])
-            ref_cols = ", ".join([f'"{col}"' for col in fk.referenced_columns])
+            fk_cols = ", ".join(map(quote_ident, fk.columns))
+            ref_cols = ", ".join(map(quote_ident, fk.referenced_columns))
 
-            fk_sql = f'ALTER TABLE {schema}."{table.name}" '
-            fk_sql += f'ADD CONSTRAINT "{fk.name}" '
+            fk_sql = f"ALTER TABLE {schema}.{quote_ident(table.name)} "
+            fk_sql += f"ADD CONSTRAINT {quote_ident(fk.name)} "
             fk_sql += f"FOREIGN KEY ({fk_cols}) "
-            fk_sql += f'REFERENCES {schema}."{fk.referenced_table}" ({ref_cols});'
+            fk_sql += (
+                f"REFERENCES {schema}.{quote_ident(fk.referenced_table)} ({ref_cols});"
+            )
 
             statements.append(fk_sql)
 
@@ -197,28 +330,35 @@ class PostgresDDLGenerator:
     def _sort_tables_by_dependencies(self, tables: List[Table]) -> List[Table]:
         """
         Sort tables to respect foreign key dependencies.
-        """
-        table_map = {t.name: t for t in tables}
-        sorted_tables = []
-        visited = set()
 
-        def visit(table: Table):
-            if table.name in visited:
-                return
-
-            visited.add(table.name)
-
-            # Visit referenced tables first
+        Iterative Kahn's algorithm, so long FK chains can't hit the recursion
+        limit. Among tables whose references are satisfied the original order
+        wins; tables on an FK cycle are appended in their original order.
+        """
+        index = {t.name: i for i, t in enumerate(tables)}
+        in_degree = [0] * len(tables)
+        dependents = [[] for _ in tables]
+        for i, table in enumerate(tables):
             for fk in table.foreign_keys:
-                if fk.referenced_table and fk.referenced_table in table_map:
-                    visit(table_map[fk.referenced_table])
-
-            sorted_tables.append(table)
-
-        for table in tables:
-            visit(table)
-
-        return sorted_tables
+                j = index.get(fk.referenced_table)
+                if j is not None and j != i:  # self-references don't order
+                    in_degree[i] += 1
+                    dependents[j].append(i)
+
+        ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for k in dependents[i]:
+                in_degree[k] -= 1
+                if in_degree[k] == 0:
+                    heapq.heappush(ready, k)
+
+        if len(order) < len(tables):
+            placed = set(order)
+            order.extend(i for i in range(len(tables)) if i not in placed)
+        return [tables[i] for i in order]
 
     def _escape_string(self, s: str) -> str:
         """Escape string for SQL."""
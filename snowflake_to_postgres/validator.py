@@ -5,12 +5,20 @@ Data validation engine for comparing Snowflake and PostgreSQL data after transfe
 Runs up to 5 layers of checks, from fast row counts to row-level sampling.
 """
 
+import copy
+import json
 import logging
+import math
+import re
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -51,35 +59,180 @@ class DataValidator:
     Layers:
       1 – Total row count
       2 – Per-partition row counts (grouped by date column, if present)
-      3 – Column-level statistics (NULL counts + MIN/MAX), one scan each side
+      3 – Column-level statistics (NULL counts + MIN/MAX); shares Layer 1's
+          single scan of each side
       4 – Aggregate fingerprint (SUM of numeric cols per date partition)
-      5 – Row-level sample comparison (opt-in via sample_size > 0, requires PK)
+      5 – Row-level sample comparison (opt-in via sample_size > 0, requires PK);
+          with hash_sample, a checksum comparison first (see _check_row_hash)
+
+    With fingerprint_cache set, a table whose metadata fingerprint matches the
+    one recorded at its last passing validation skips all layers (see
+    _table_fingerprint).
+
+    Every query opens its own cursor (the calling thread's Snowflake session, a
+    pooled PostgreSQL connection), so tables can be validated from several
+    threads at once. Within a layer the Snowflake and PostgreSQL queries are
+    independent and run concurrently (see _run_both).
     """
 
-    # Max columns processed in a single SQL expression list
-    _NULL_CHUNK = 50
-    _MINMAX_CHUNK = 25
+    # Max aggregate expressions in a single Layer 1/3 SELECT
+    _STATS_CHUNK = 200
+    # Max primary keys per Layer 5 lookup query
+    _PK_LOOKUP_CHUNK = 1000
+
+    # Layer 5 hash check: how each Snowflake type is rendered as text on
+    # both sides so that equal values hash equally. Tables with any other
+    # type (FLOAT, VARIANT, BINARY, ...) go straight to the row sample.
+    _HASH_RENDER = {
+        **dict.fromkeys(
+            ("NUMBER", "NUMERIC", "DECIMAL", "INT", "INTEGER", "BIGINT")
+            + ("SMALLINT", "TINYINT", "BYTEINT", "BOOLEAN"),
+            ("TO_VARCHAR({c})", "{c}::text"),
+        ),
+        **dict.fromkeys(
+            ("TEXT", "VARCHAR", "CHAR", "CHARACTER", "STRING"),
+            ("{c}", "{c}::text"),
+        ),
+        "DATE": ("TO_VARCHAR({c}, 'YYYY-MM-DD')", "to_char({c}, 'YYYY-MM-DD')"),
+        **dict.fromkeys(
+            ("TIMESTAMP", "TIMESTAMP_NTZ", "DATETIME"),
+            (
+                "TO_VARCHAR({c}, 'YYYY-MM-DD HH24:MI:SS.FF6')",
+                "to_char({c}, 'YYYY-MM-DD HH24:MI:SS.US')",
+            ),
+        ),
+        **dict.fromkeys(
+            ("TIMESTAMP_TZ", "TIMESTAMP_LTZ"),
+            (
+                "TO_VARCHAR(CONVERT_TIMEZONE('UTC', {c}), 'YYYY-MM-DD HH24:MI:SS.FF6')",
+                "to_char({c} AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS.US')",
+            ),
+        ),
+    }
+
+    # Column names that suggest the partitioning date column
+    _DATE_NAME_RE = re.compile(r"date|day|period|month|week|year", re.IGNORECASE)
+
+    # Column classification, keyed on the normalized type (see _column_dict)
+    _DATE_TYPES = frozenset(
+        {"DATE", "TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"}
+    )
+    _NUMERIC_TYPES = frozenset(
+        {
+            "NUMBER",
+            "NUMERIC",
+            "DECIMAL",
+            "FLOAT",
+            "FLOAT4",
+            "FLOAT8",
+            "DOUBLE",
+            "REAL",
+            "INTEGER",
+            "INT",
+            "BIGINT",
+            "SMALLINT",
+            "TINYINT",
+        }
+    )
 
     def __init__(
         self,
         sf_connection,
         pg_connection,
         sample_size: int = 0,
+        sample_method: str = "row",
+        hash_sample: bool = False,
         status_callback: Optional[Callable[[str], None]] = None,
         pg_work_mem: str = "64MB",
         chunk_date_ranges: bool = True,
+        fingerprint_cache: Optional[Path] = None,
     ):
         self.sf_conn = sf_connection
         self.pg_conn = pg_connection
         self.sample_size = sample_size
+        self.sample_method = sample_method
+        self.hash_sample = hash_sample
         self.status_callback = status_callback
         self.pg_work_mem = pg_work_mem
         self.chunk_date_ranges = chunk_date_ranges
+        # Column / primary key metadata by (schema, TABLE), filled per table
+        # or for a whole schema by prefetch_metadata
+        self._columns_cache: Dict[Tuple[str, str], List[Dict]] = {}
+        self._pk_cache: Dict[Tuple[str, str], List[str]] = {}
+        # Fingerprints of tables that passed, persisted to fingerprint_cache
+        self.fingerprint_cache = Path(fingerprint_cache) if fingerprint_cache else None
+        self._fingerprints = self._load_fingerprints()
+        self._fingerprints_lock = threading.Lock()
+        # Per thread: the helper executor _run_both uses during validate_table
+        self._helper = threading.local()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def with_status_callback(
+        self, status_callback: Optional[Callable[[str], None]]
+    ) -> "DataValidator":
+        """Return a copy reporting to status_callback; metadata caches are shared."""
+        validator = copy.copy(self)
+        validator.status_callback = status_callback
+        return validator
+
+    def prefetch_metadata(self, schema: str) -> None:
+        """
+        Load column and primary key metadata for every table in schema.
+
+        Two schema-wide INFORMATION_SCHEMA queries replace two per table when
+        validating many tables. Tables missing from the result (or a failed
+        query) fall back to the per-table lookups.
+        """
+        columns_query = """
+        SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+        # Collected apart from the cache, so a query failing part-way through
+        # (e.g. "Information schema query returned too much data" on a large
+        # schema) leaves no partial column lists behind
+        columns: Dict[Tuple[str, str], List[Dict]] = {}
+        try:
+            with self.sf_conn.cursor(dict_cursor=False) as cur:
+                cur.execute(columns_query, (schema,))
+                for table, name, data_type in cur:
+                    columns.setdefault((schema, table), []).append(
+                        self._column_dict(name, data_type)
+                    )
+        except Exception as e:
+            logger.warning(f"Could not prefetch column metadata for {schema}: {e}")
+            return
+        for key, table_columns in columns.items():
+            self._columns_cache.setdefault(key, table_columns)
+
+        pk_query = """
+        SELECT kcu.TABLE_NAME, kcu.COLUMN_NAME
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+            ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+            AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+            AND tc.TABLE_NAME = kcu.TABLE_NAME
+        WHERE tc.TABLE_SCHEMA = %s
+        AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+        ORDER BY kcu.TABLE_NAME, kcu.ORDINAL_POSITION
+        """
+        try:
+            with self.sf_conn.cursor(dict_cursor=False) as cur:
+                cur.execute(pk_query, (schema,))
+                pk_columns: Dict[Tuple[str, str], List[str]] = {}
+                for table, name in cur:
+                    pk_columns.setdefault((schema, table), []).append(name)
+        except Exception:
+            return
+        # Every fetched table is known now, including those without a PK
+        for key in self._columns_cache:
+            if key[0] == schema:
+                self._pk_cache.setdefault(key, pk_columns.get(key, []))
+
     def validate_table(
         self,
         sf_schema: str,
@@ -88,12 +241,55 @@ class DataValidator:
         pg_table: Optional[str] = None,
     ) -> TableValidationResult:
         """Run all validation layers for a single table."""
+        # One helper thread serves every _run_both call for this table
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            self._helper.pool = pool
+            try:
+                return self._validate_table(sf_schema, sf_table, pg_schema, pg_table)
+            finally:
+                self._helper.pool = None
+
+    def _validate_table(
+        self,
+        sf_schema: str,
+        sf_table: str,
+        pg_schema: str,
+        pg_table: Optional[str] = None,
+    ) -> TableValidationResult:
         self._pg_set_work_mem()
 
         pg_table = pg_table or sf_table.lower()
         start = time.time()
         result = TableValidationResult(table_name=f"{sf_schema}.{sf_table}")
 
+        # Read before any layer runs, so changes made during validation
+        # invalidate the fingerprint recorded below (see save_fingerprints)
+        fingerprint_key = fingerprint = None
+        if self.fingerprint_cache:
+            fingerprint_key = (
+                f"{self.sf_conn.config['database']}.{sf_schema}.{sf_table.upper()}"
+                f"|{self.pg_conn.config['dbname']}.{pg_schema}.{pg_table}"
+            )
+            fingerprint = self._table_fingerprint(
+                sf_schema, sf_table, pg_schema, pg_table
+            )
+            if (
+                fingerprint is not None
+                and self._fingerprints.get(fingerprint_key) == fingerprint
+            ):
+                result.checks.append(
+                    CheckResult(
+                        name="unchanged",
+                        passed=True,
+                        source_value=None,
+                        target_value=None,
+                        message="Unchanged since its last passing validation; "
+                        "layers skipped",
+                    )
+                )
+                result.duration = time.time() - start
+                return result
+
         columns = self._get_columns(sf_schema, sf_table)
         if not columns:
             result.checks.append(
@@ -134,11 +330,13 @@ class DataValidator:
         else:
             chunks = None
 
-        # Layer 1: row count
+        # Layer 1: row count (the same scan also collects Layer 3's stats)
         self._status("  Layer 1: Row count...")
-        result.checks.append(
-            self._check_row_count(sf_schema, sf_table, pg_schema, pg_table)
+        sf_stats, pg_stats = self._fused_table_stats(
+            sf_schema, sf_table, pg_schema, pg_table, columns
         )
+        row_count_check = self._check_row_count(sf_stats["CNT"], pg_stats["CNT"])
+        result.checks.append(row_count_check)
 
         # Layer 2: per-partition counts
         if date_col:
@@ -153,9 +351,7 @@ class DataValidator:
 
         # Layer 3: column-level stats
         self._status("  Layer 3: Column statistics...")
-        result.checks.extend(
-            self._check_column_stats(sf_schema, sf_table, pg_schema, pg_table, columns)
-        )
+        result.checks.extend(self._check_column_stats(columns, sf_stats, pg_stats))
 
         # Layer 4: aggregate fingerprint
         if numeric_cols and date_col:
@@ -179,10 +375,19 @@ class DataValidator:
             self._status(f"  Layer 5: Row sample ({self.sample_size:,} rows)...")
             result.checks.append(
                 self._check_row_sample(
-                    sf_schema, sf_table, pg_schema, pg_table, columns
+                    sf_schema,
+                    sf_table,
+                    pg_schema,
+                    pg_table,
+                    columns,
+                    sf_row_count=row_count_check.source_value,
                 )
             )
 
+        if fingerprint is not None and result.passed:
+            with self._fingerprints_lock:
+                self._fingerprints[fingerprint_key] = fingerprint
+
         result.duration = time.time() - start
         return result
 
@@ -190,13 +395,47 @@ class DataValidator:
     # Layer implementations
     # ------------------------------------------------------------------
 
-    def _check_row_count(self, sf_schema, sf_table, pg_schema, pg_table) -> CheckResult:
-        sf_count = self._sf_scalar(
-            f"SELECT COUNT(*) as CNT FROM {sf_schema}.{sf_table}", "CNT"
-        )
-        pg_count = self._pg_scalar(
-            f'SELECT COUNT(*) as cnt FROM {pg_schema}."{pg_table}"', "cnt"
-        )
+    def _fused_table_stats(
+        self, sf_schema, sf_table, pg_schema, pg_table, columns
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Collect Layer 1 and Layer 3 statistics in one scan per side.
+
+        Returns (sf_stats, pg_stats), each keyed CNT (row count), N<i> (NULL
+        count of columns[i]) and, for numeric/date columns, MN<i>/MX<i>. Only
+        tables with more than _STATS_CHUNK expressions need a second scan.
+        """
+        sf_exprs = []
+        pg_exprs = []
+        for i, col in enumerate(columns):
+            sf_name = col["name"]
+            pg_name = sf_name.lower()
+            sf_exprs.append(f'COUNT(*) - COUNT("{sf_name}") as N{i}')
+            pg_exprs.append(f'COUNT(*) - COUNT("{pg_name}") as n{i}')
+            if self._is_numeric_or_date(col["type_norm"]):
+                sf_exprs += [f'MIN("{sf_name}") as MN{i}', f'MAX("{sf_name}") as MX{i}']
+                pg_exprs += [f'MIN("{pg_name}") as mn{i}', f'MAX("{pg_name}") as mx{i}']
+
+        sf_stats: Dict[str, Any] = {}
+        pg_stats: Dict[str, Any] = {}
+        for start in range(0, len(sf_exprs), self._STATS_CHUNK):
+            end = start + self._STATS_CHUNK
+            sf_row, pg_row = self._run_both(
+                lambda: self._sf_fetchone(
+                    f"SELECT COUNT(*) as CNT, {', '.join(sf_exprs[start:end])} "
+                    f"FROM {sf_schema}.{sf_table}"
+                ),
+                lambda: self._pg_fetchone(
+                    f"SELECT COUNT(*) as cnt, {', '.join(pg_exprs[start:end])} "
+                    f'FROM {pg_schema}."{pg_table}"'
+                ),
+            )
+            sf_stats.update(sf_row or {})
+            # Same keys on both sides: PostgreSQL folds the aliases to lower case
+            pg_stats.update({k.upper(): v for k, v in (pg_row or {}).items()})
+        return sf_stats, pg_stats
+
+    def _check_row_count(self, sf_count, pg_count) -> CheckResult:
         passed = sf_count == pg_count
         if sf_count is not None and pg_count is not None:
             delta = abs(sf_count - pg_count)
@@ -230,39 +469,48 @@ class DataValidator:
                     self._status(
                         f"    [chunk {idx+1}/{total}] {chunk_start} – {chunk_end}"
                     )
-                sf_counts.update(
-                    self._sf_group_count(
+                sf_chunk, pg_chunk = self._run_both(
+                    lambda: self._sf_group_count(
                         sf_schema,
                         sf_table,
                         date_col,
                         date_from=chunk_start,
                         date_to=chunk_end,
-                    )
-                )
-                pg_counts.update(
-                    self._pg_group_count(
+                    ),
+                    lambda: self._pg_group_count(
                         pg_schema,
                         pg_table,
                         date_col.lower(),
                         date_from=chunk_start,
                         date_to=chunk_end,
-                    )
+                    ),
                 )
+                sf_counts.update(sf_chunk)
+                pg_counts.update(pg_chunk)
         else:
-            sf_counts = self._sf_group_count(sf_schema, sf_table, date_col)
-            pg_counts = self._pg_group_count(pg_schema, pg_table, date_col.lower())
+            sf_counts, pg_counts = self._run_both(
+                lambda: self._sf_group_count(sf_schema, sf_table, date_col),
+                lambda: self._pg_group_count(pg_schema, pg_table, date_col.lower()),
+            )
 
-        all_dates = set(sf_counts) | set(pg_counts)
-        mismatches = []
-        for d in sorted(all_dates):
+        all_dates = sf_counts.keys() | pg_counts.keys()
+        # Usually every partition matches: one dict comparison settles it,
+        # and otherwise only the mismatched dates are sorted and formatted
+        if sf_counts == pg_counts:
+            mismatched = []
+        else:
+            mismatched = sorted(
+                d for d in all_dates if sf_counts.get(d, 0) != pg_counts.get(d, 0)
+            )
+        details = []
+        for d in mismatched[:25]:
             sf_v = sf_counts.get(d, 0)
             pg_v = pg_counts.get(d, 0)
-            if sf_v != pg_v:
-                mismatches.append(
-                    f"  {d}: SF={sf_v:,}  PG={pg_v:,}  delta={abs(sf_v - pg_v):,}"
-                )
+            details.append(
+                f"  {d}: SF={sf_v:,}  PG={pg_v:,}  delta={abs(sf_v - pg_v):,}"
+            )
 
-        passed = len(mismatches) == 0
+        passed = len(mismatched) == 0
         return CheckResult(
             name="partition_counts",
             passed=passed,
@@ -271,20 +519,23 @@ class DataValidator:
             message=(
                 f"Partition counts match ({len(all_dates)} partitions)"
                 if passed
-                else f"{len(mismatches)}/{len(all_dates)} partitions mismatched"
+                else f"{len(mismatched)}/{len(all_dates)} partitions mismatched"
             ),
-            details=mismatches[:25],
+            details=details,
         )
 
-    def _check_column_stats(
-        self, sf_schema, sf_table, pg_schema, pg_table, columns
-    ) -> List[CheckResult]:
+    def _check_column_stats(self, columns, sf_stats, pg_stats) -> List[CheckResult]:
         results = []
 
-        # NULL counts — single table scan per side
-        null_mismatches = self._compare_null_counts(
-            sf_schema, sf_table, pg_schema, pg_table, columns
-        )
+        # NULL counts
+        null_mismatches = []
+        for i, col in enumerate(columns):
+            sf_nulls = sf_stats.get(f"N{i}")
+            pg_nulls = pg_stats.get(f"N{i}")
+            if sf_nulls != pg_nulls:
+                null_mismatches.append(
+                    f"  {col['name']}: SF={sf_nulls:,}  PG={pg_nulls:,}"
+                )
         results.append(
             CheckResult(
                 name="null_counts",
@@ -300,12 +551,24 @@ class DataValidator:
             )
         )
 
-        # MIN / MAX — single scan for numeric + date columns
-        checkable = [c for c in columns if self._is_numeric_or_date(c["type"])]
+        # MIN / MAX for numeric + date columns
+        checkable = [
+            (i, c)
+            for i, c in enumerate(columns)
+            if self._is_numeric_or_date(c["type_norm"])
+        ]
         if checkable:
-            minmax_mismatches = self._compare_minmax(
-                sf_schema, sf_table, pg_schema, pg_table, checkable
-            )
+            minmax_mismatches = []
+            for i, col in checkable:
+                sf_mn = self._norm_val(sf_stats.get(f"MN{i}"))
+                sf_mx = self._norm_val(sf_stats.get(f"MX{i}"))
+                pg_mn = self._norm_val(pg_stats.get(f"MN{i}"))
+                pg_mx = self._norm_val(pg_stats.get(f"MX{i}"))
+                if sf_mn != pg_mn or sf_mx != pg_mx:
+                    minmax_mismatches.append(
+                        f"  {col['name']}: "
+                        f"SF=({sf_mn}, {sf_mx})  PG=({pg_mn}, {pg_mx})"
+                    )
             results.append(
                 CheckResult(
                     name="min_max_values",
@@ -336,8 +599,8 @@ class DataValidator:
         cols = numeric_cols[:10]  # cap to keep query manageable
 
         if chunks:
-            sf_aggs: Dict[str, Dict[int, Any]] = {}
-            pg_aggs: Dict[str, Dict[int, Any]] = {}
+            sf_aggs: Dict[str, Tuple] = {}
+            pg_aggs: Dict[str, Tuple] = {}
             total = len(chunks)
             for idx, (chunk_start, chunk_end) in enumerate(chunks):
                 if idx % 50 == 0:
@@ -348,40 +611,47 @@ class DataValidator:
                     self._status(
                         f"    [chunk {idx+1}/{total}] {chunk_start} – {chunk_end}"
                     )
-                sf_aggs.update(
-                    self._sf_aggregates_by_date(
+                sf_chunk, pg_chunk = self._run_both(
+                    lambda: self._sf_aggregates_by_date(
                         sf_schema,
                         sf_table,
                         date_col,
                         cols,
                         date_from=chunk_start,
                         date_to=chunk_end,
-                    )
-                )
-                pg_aggs.update(
-                    self._pg_aggregates_by_date(
+                    ),
+                    lambda: self._pg_aggregates_by_date(
                         pg_schema,
                         pg_table,
                         date_col.lower(),
                         cols,
                         date_from=chunk_start,
                         date_to=chunk_end,
-                    )
+                    ),
                 )
+                sf_aggs.update(sf_chunk)
+                pg_aggs.update(pg_chunk)
         else:
-            sf_aggs = self._sf_aggregates_by_date(sf_schema, sf_table, date_col, cols)
-            pg_aggs = self._pg_aggregates_by_date(
-                pg_schema, pg_table, date_col.lower(), cols
+            sf_aggs, pg_aggs = self._run_both(
+                lambda: self._sf_aggregates_by_date(
+                    sf_schema, sf_table, date_col, cols
+                ),
+                lambda: self._pg_aggregates_by_date(
+                    pg_schema, pg_table, date_col.lower(), cols
+                ),
             )
 
         all_dates = set(sf_aggs) | set(pg_aggs)
+        missing = (None,) * len(cols)
         mismatches = []
         for d in sorted(all_dates):
-            sf_row = sf_aggs.get(d, {})
-            pg_row = pg_aggs.get(d, {})
-            for i, col in enumerate(cols):
-                sf_val = self._norm_decimal(sf_row.get(i))
-                pg_val = self._norm_decimal(pg_row.get(i))
+            sf_row = sf_aggs.get(d, missing)
+            pg_row = pg_aggs.get(d, missing)
+            for col, sf_sum, pg_sum in zip(cols, sf_row, pg_row):
+                if self._sums_match(sf_sum, pg_sum):
+                    continue
+                sf_val = self._norm_decimal(sf_sum)
+                pg_val = self._norm_decimal(pg_sum)
                 if sf_val != pg_val:
                     mismatches.append(f"  {d} / {col}: SF={sf_val}  PG={pg_val}")
                     if len(mismatches) >= 30:
@@ -405,7 +675,7 @@ class DataValidator:
         )
 
     def _check_row_sample(
-        self, sf_schema, sf_table, pg_schema, pg_table, columns
+        self, sf_schema, sf_table, pg_schema, pg_table, columns, sf_row_count=None
     ) -> CheckResult:
         pk_cols = self._get_pk_columns(sf_schema, sf_table)
         if not pk_cols:
@@ -417,63 +687,207 @@ class DataValidator:
                 message="Row sample skipped: no primary key detected on source table",
             )
 
-        sf_rows = self._sf_tablesample(sf_schema, sf_table, self.sample_size)
-        if not sf_rows:
+        # Both sides select columns in this order, so rows are plain tuples
+        # and the primary key is a list of positions
+        col_names = [col["name"] for col in columns]
+        col_pos = {name.upper(): i for i, name in enumerate(col_names)}
+        pk_idx = [col_pos[pk.upper()] for pk in pk_cols if pk.upper() in col_pos]
+        if len(pk_idx) != len(pk_cols):
             return CheckResult(
                 name="row_sample",
-                passed=True,
+                passed=None,
                 source_value=0,
                 target_value=0,
-                message="Row sample: table appears empty",
+                message="Row sample skipped: primary key columns not found",
+            )
+
+        if self.hash_sample:
+            hash_check = self._check_row_hash(
+                sf_schema, sf_table, pg_schema, pg_table, columns, pk_idx, sf_row_count
             )
+            if hash_check is not None:
+                return hash_check
+
+        norm_val = self._norm_val
 
+        # The sample arrives in chunks, each checked with one PK lookup
+        # query, so memory stays flat however large sample_size is
+        sampled = 0
         not_found = 0
         mismatches = []
-        for sf_row in sf_rows:
-            pg_row = self._pg_lookup_by_pk(pg_schema, pg_table, pk_cols, sf_row)
-            if pg_row is None:
-                not_found += 1
-                continue
-            for col in columns:
-                col_lower = col["name"].lower()
-                sf_val = self._norm_val(sf_row.get(col["name"], sf_row.get(col_lower)))
-                pg_val = self._norm_val(pg_row.get(col_lower))
-                if sf_val != pg_val:
-                    pk_info = {
-                        pk: sf_row.get(pk, sf_row.get(pk.lower())) for pk in pk_cols
-                    }
-                    mismatches.append(
-                        f"  pk={pk_info} col={col_lower}: SF={sf_val!r}  PG={pg_val!r}"
-                    )
-                    if len(mismatches) >= 20:
-                        break
+        for sf_rows in self._sf_tablesample(
+            sf_schema, sf_table, col_names, self.sample_size, sf_row_count
+        ):
+            sampled += len(sf_rows)
+            pg_by_pk = self._pg_lookup_by_pks(
+                pg_schema, pg_table, col_names, pk_idx, sf_rows
+            )
+            for sf_row in sf_rows:
+                pg_row = pg_by_pk.get(self._pk_key(pk_idx, sf_row))
+                if pg_row is None:
+                    not_found += 1
+                    continue
+                for i, (sf_raw, pg_raw) in enumerate(zip(sf_row, pg_row)):
+                    # Most values already match as-is; only normalize the rest
+                    if type(sf_raw) is type(pg_raw) and sf_raw == pg_raw:
+                        continue
+                    sf_val = norm_val(sf_raw)
+                    pg_val = norm_val(pg_raw)
+                    if sf_val != pg_val:
+                        pk_info = {col_names[j]: sf_row[j] for j in pk_idx}
+                        mismatches.append(
+                            f"  pk={pk_info} col={col_names[i].lower()}: "
+                            f"SF={sf_val!r}  PG={pg_val!r}"
+                        )
+                        if len(mismatches) >= 20:
+                            break
+                if len(mismatches) >= 20:
+                    break
             if len(mismatches) >= 20:
                 break
 
+        if not sampled:
+            return CheckResult(
+                name="row_sample",
+                passed=True,
+                source_value=0,
+                target_value=0,
+                message="Row sample: table appears empty",
+            )
+
         passed = not_found == 0 and len(mismatches) == 0
         details = []
         if not_found:
-            details.append(f"  {not_found}/{len(sf_rows)} rows not found in Postgres")
+            details.append(f"  {not_found}/{sampled} rows not found in Postgres")
         details.extend(mismatches)
 
         return CheckResult(
             name="row_sample",
             passed=passed,
-            source_value=len(sf_rows),
-            target_value=len(sf_rows) - not_found,
+            source_value=sampled,
+            target_value=sampled - not_found,
             message=(
-                f"Row sample passed ({len(sf_rows):,} rows checked)"
+                f"Row sample passed ({sampled:,} rows checked)"
                 if passed
                 else f"Row sample failed: {not_found} missing, {len(mismatches)} field mismatch(es)"
             ),
             details=details,
         )
 
+    def _check_row_hash(
+        self,
+        sf_schema,
+        sf_table,
+        pg_schema,
+        pg_table,
+        columns,
+        pk_idx,
+        sf_row_count=None,
+    ) -> Optional[CheckResult]:
+        """
+        Compare a deterministic sample by checksum, without moving any rows.
+
+        Both engines pick the same rows (those whose primary key MD5 falls
+        in bucket 0 of row_count / sample_size buckets), render every column
+        identically, and return the row count and the sum of 60-bit row
+        hashes. Matching totals pass Layer 5. Returns None, meaning "run
+        the row sample", if the totals differ, the bucket is empty, a column
+        type cannot be rendered identically, or a query fails.
+        """
+        renders = [self._HASH_RENDER.get(col["type_norm"]) for col in columns]
+        if None in renders:
+            return None
+        sf_cols = [
+            sf.format(c=f'"{col["name"]}"') for col, (sf, _) in zip(columns, renders)
+        ]
+        pg_cols = [
+            pg.format(c=f'"{col["name"].lower()}"')
+            for col, (_, pg) in zip(columns, renders)
+        ]
+        buckets = max(1, (sf_row_count or 0) // self.sample_size)
+
+        def _concat(exprs, chr_func):
+            # CHR(1) stands in for NULL so a NULL never equals any text
+            return " || '|' || ".join(f"COALESCE({e}, {chr_func}(1))" for e in exprs)
+
+        sf_row = _concat(sf_cols, "CHR")
+        sf_key = _concat([sf_cols[i] for i in pk_idx], "CHR")
+        pg_row = _concat(pg_cols, "chr")
+        pg_key = _concat([pg_cols[i] for i in pk_idx], "chr")
+        sf_query = (
+            "SELECT COUNT(*) as CNT, "
+            f"SUM(TO_NUMBER(LEFT(MD5({sf_row}), 15), 'XXXXXXXXXXXXXXX')) as DIGEST "
+            f"FROM {sf_schema}.{sf_table} "
+            f"WHERE MOD(TO_NUMBER(LEFT(MD5({sf_key}), 8), 'XXXXXXXX'), {buckets}) = 0"
+        )
+        pg_query = (
+            "SELECT COUNT(*) as cnt, "
+            f"SUM(('x' || left(md5({pg_row}), 15))::bit(60)::bigint) as digest "
+            f'FROM {pg_schema}."{pg_table}" '
+            f"WHERE mod(('x' || left(md5({pg_key}), 8))::bit(32)::bigint, {buckets}) = 0"
+        )
+
+        self._status("    Comparing row hashes...")
+        try:
+            sf_result, pg_result = self._run_both(
+                lambda: self._sf_fetchone(sf_query),
+                lambda: self._pg_fetchone(pg_query),
+            )
+        except Exception as e:
+            logger.warning(f"Row hash failed for {sf_schema}.{sf_table}: {e}")
+            return None
+        sf_cnt, sf_digest = sf_result["CNT"], sf_result["DIGEST"]
+        pg_cnt, pg_digest = pg_result["cnt"], pg_result["digest"]
+        if not sf_cnt or sf_cnt != pg_cnt or sf_digest != pg_digest:
+            if sf_cnt:
+                self._status("    Row hashes differ; falling back to the row sample")
+            return None
+
+        return CheckResult(
+            name="row_hash",
+            passed=True,
+            source_value=sf_cnt,
+            target_value=pg_cnt,
+            message=f"Row hashes match ({sf_cnt:,} rows in the sampled bucket)",
+        )
+
     # ------------------------------------------------------------------
     # Snowflake query helpers
     # ------------------------------------------------------------------
 
+    def _run_both(self, sf_query: Callable[[], Any], pg_query: Callable[[], Any]):
+        """
+        Run a Snowflake and a PostgreSQL query concurrently; return both results.
+
+        The PostgreSQL side runs on a helper thread (it only needs a pooled
+        connection); the Snowflake side stays on the calling thread so it keeps
+        using that thread's session instead of logging in a new one. Within
+        validate_table the helper is the table's executor; otherwise a
+        short-lived one is created.
+        """
+        pool = getattr(self._helper, "pool", None)
+        if pool is None:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pg_future = pool.submit(pg_query)
+                sf_result = sf_query()
+                return sf_result, pg_future.result()
+        pg_future = pool.submit(pg_query)
+        sf_result = sf_query()
+        return sf_result, pg_future.result()
+
+    @staticmethod
+    def _column_dict(name: str, data_type: str) -> Dict:
+        # type_norm: base type, upper case, parameters stripped
+        return {
+            "name": name,
+            "type": data_type,
+            "type_norm": data_type.upper().split("(")[0],
+        }
+
     def _get_columns(self, schema: str, table: str) -> List[Dict]:
+        key = (schema, table.upper())
+        if key in self._columns_cache:
+            return self._columns_cache[key]
         query = """
         SELECT COLUMN_NAME, DATA_TYPE
         FROM INFORMATION_SCHEMA.COLUMNS
@@ -482,12 +896,18 @@ class DataValidator:
         """
         with self.sf_conn.cursor() as cur:
             cur.execute(query, (schema, table))
-            return [
-                {"name": row["COLUMN_NAME"], "type": row["DATA_TYPE"]}
+            columns = [
+                self._column_dict(row["COLUMN_NAME"], row["DATA_TYPE"])
                 for row in cur.fetchall()
             ]
+        if columns:
+            self._columns_cache[key] = columns
+        return columns
 
     def _get_pk_columns(self, schema: str, table: str) -> List[str]:
+        key = (schema, table.upper())
+        if key in self._pk_cache:
+            return self._pk_cache[key]
         try:
             query = """
             SELECT kcu.COLUMN_NAME
@@ -502,15 +922,16 @@ class DataValidator:
             """
             with self.sf_conn.cursor() as cur:
                 cur.execute(query, (schema, table))
-                return [row["COLUMN_NAME"] for row in cur.fetchall()]
+                pk_columns = [row["COLUMN_NAME"] for row in cur.fetchall()]
         except Exception:
             return []
+        self._pk_cache[key] = pk_columns
+        return pk_columns
 
-    def _sf_scalar(self, query: str, key: str) -> Optional[int]:
+    def _sf_fetchone(self, query: str) -> Optional[Dict]:
         with self.sf_conn.cursor() as cur:
             cur.execute(query)
-            row = cur.fetchone()
-            return row[key] if row else None
+            return cur.fetchone()
 
     def _get_date_chunks(
         self, sf_schema: str, sf_table: str, date_col: str
@@ -587,9 +1008,9 @@ class DataValidator:
             f'SELECT CAST("{date_col}" AS DATE) as D, COUNT(*) as CNT '
             f"FROM {schema}.{table}{where} GROUP BY 1 ORDER BY 1"
         )
-        with self.sf_conn.cursor() as cur:
+        with self.sf_conn.cursor(dict_cursor=False) as cur:
             cur.execute(query)
-            return {str(row["D"]): row["CNT"] for row in cur.fetchall()}
+            return {str(d): cnt for d, cnt in cur}
 
     def _sf_aggregates_by_date(
         self,
@@ -599,7 +1020,7 @@ class DataValidator:
         numeric_cols: List[str],
         date_from=None,
         date_to=None,
-    ) -> Dict[str, Dict[int, Any]]:
+    ) -> Dict[str, Tuple]:
         col_exprs = ", ".join(
             [f'SUM("{c}") as S{i}' for i, c in enumerate(numeric_cols)]
         )
@@ -613,109 +1034,48 @@ class DataValidator:
             f'SELECT CAST("{date_col}" AS DATE) as D, {col_exprs} '
             f"FROM {schema}.{table}{where} GROUP BY 1 ORDER BY 1"
         )
-        with self.sf_conn.cursor() as cur:
+        # Tuple cursor: the sums, in numeric_cols order, follow the date
+        with self.sf_conn.cursor(dict_cursor=False) as cur:
             cur.execute(query)
-            return {
-                str(row["D"]): {i: row[f"S{i}"] for i in range(len(numeric_cols))}
-                for row in cur.fetchall()
-            }
+            return {str(row[0]): row[1:] for row in cur}
 
-    def _sf_tablesample(self, schema: str, table: str, n: int) -> List[Dict]:
-        try:
-            with self.sf_conn.cursor() as cur:
-                cur.execute(f"SELECT * FROM {schema}.{table} TABLESAMPLE ({n} ROWS)")
-                return cur.fetchall()
-        except Exception:
-            with self.sf_conn.cursor() as cur:
-                cur.execute(f"SELECT * FROM {schema}.{table} LIMIT {n}")
-                return cur.fetchall()
-
-    def _compare_null_counts(
+    def _sf_tablesample(
         self,
-        sf_schema: str,
-        sf_table: str,
-        pg_schema: str,
-        pg_table: str,
-        columns: List[Dict],
-    ) -> List[str]:
-        mismatches = []
-        for chunk_start in range(0, len(columns), self._NULL_CHUNK):
-            chunk = columns[chunk_start : chunk_start + self._NULL_CHUNK]
-
-            sf_exprs = ", ".join(
-                [
-                    f'COUNT(*) - COUNT("{c["name"]}") as N{i}'
-                    for i, c in enumerate(chunk)
-                ]
-            )
-            pg_exprs = ", ".join(
-                [
-                    f'COUNT(*) - COUNT("{c["name"].lower()}") as n{i}'
-                    for i, c in enumerate(chunk)
-                ]
-            )
-
-            with self.sf_conn.cursor() as cur:
-                cur.execute(f"SELECT {sf_exprs} FROM {sf_schema}.{sf_table}")
-                sf_row = cur.fetchone()
-
-            with self.pg_conn.cursor() as cur:
-                cur.execute(f'SELECT {pg_exprs} FROM {pg_schema}."{pg_table}"')
-                pg_row = cur.fetchone()
-
-            for i, col in enumerate(chunk):
-                sf_nulls = sf_row.get(f"N{i}") if sf_row else None
-                pg_nulls = pg_row.get(f"n{i}") if pg_row else None
-                if sf_nulls != pg_nulls:
-                    mismatches.append(
-                        f"  {col['name']}: SF={sf_nulls:,}  PG={pg_nulls:,}"
-                    )
-        return mismatches
+        schema: str,
+        table: str,
+        col_names: List[str],
+        n: int,
+        row_count: Optional[int] = None,
+    ) -> Iterator[List[Tuple]]:
+        """
+        Sample about *n* rows in Snowflake so only the sample crosses the wire.
 
-    def _compare_minmax(
-        self,
-        sf_schema: str,
-        sf_table: str,
-        pg_schema: str,
-        pg_table: str,
-        columns: List[Dict],
-    ) -> List[str]:
-        mismatches = []
-        for chunk_start in range(0, len(columns), self._MINMAX_CHUNK):
-            chunk = columns[chunk_start : chunk_start + self._MINMAX_CHUNK]
-
-            sf_exprs = ", ".join(
-                [
-                    f'MIN("{c["name"]}") as MN{i}, MAX("{c["name"]}") as MX{i}'
-                    for i, c in enumerate(chunk)
-                ]
-            )
-            pg_exprs = ", ".join(
-                [
-                    f'MIN("{c["name"].lower()}") as mn{i}, MAX("{c["name"].lower()}") as mx{i}'
-                    for i, c in enumerate(chunk)
-                ]
-            )
+        Yields the sample in lists of up to _PK_LOOKUP_CHUNK tuples, with
+        values in col_names order.
 
-            with self.sf_conn.cursor() as cur:
-                cur.execute(f"SELECT {sf_exprs} FROM {sf_schema}.{sf_table}")
-                sf_row = cur.fetchone()
-
-            with self.pg_conn.cursor() as cur:
-                cur.execute(f'SELECT {pg_exprs} FROM {pg_schema}."{pg_table}"')
-                pg_row = cur.fetchone()
-
-            for i, col in enumerate(chunk):
-                sf_mn = self._norm_val(sf_row.get(f"MN{i}") if sf_row else None)
-                sf_mx = self._norm_val(sf_row.get(f"MX{i}") if sf_row else None)
-                pg_mn = self._norm_val(pg_row.get(f"mn{i}") if pg_row else None)
-                pg_mx = self._norm_val(pg_row.get(f"mx{i}") if pg_row else None)
-                if sf_mn != pg_mn or sf_mx != pg_mx:
-                    mismatches.append(
-                        f"  {col['name']}: "
-                        f"SF=({sf_mn}, {sf_mx})  PG=({pg_mn}, {pg_mx})"
-                    )
-        return mismatches
+        sample_method "row" draws exactly n rows (BERNOULLI, fixed size).
+        "bernoulli" and "system" sample the percentage n/row_count and trim
+        with LIMIT; "system" picks whole micro-partitions, which avoids a
+        full scan but clusters the sample. Both fall back to "row" without
+        a row count.
+        """
+        method = self.sample_method
+        if method in ("bernoulli", "system") and row_count:
+            pct = min(100.0, max(0.0001, n / row_count * 100))
+            sample = f"SAMPLE {method.upper()} ({pct:.4f}) LIMIT {n}"
+        else:
+            sample = f"TABLESAMPLE ({n} ROWS)"
+        select = ", ".join(f'"{c}"' for c in col_names)
+        with self.sf_conn.cursor(dict_cursor=False) as cur:
+            try:
+                cur.execute(f"SELECT {select} FROM {schema}.{table} {sample}")
+            except Exception:
+                cur.execute(f"SELECT {select} FROM {schema}.{table} LIMIT {n}")
+            while True:
+                rows = cur.fetchmany(self._PK_LOOKUP_CHUNK)
+                if not rows:
+                    return
+                yield rows
 
     # ------------------------------------------------------------------
     # PostgreSQL query helpers
@@ -726,11 +1086,10 @@ class DataValidator:
         with self.pg_conn.cursor() as cur:
             cur.execute("SET work_mem = %s", (self.pg_work_mem,))
 
-    def _pg_scalar(self, query: str, key: str) -> Optional[int]:
+    def _pg_fetchone(self, query: str) -> Optional[Dict]:
         with self.pg_conn.cursor() as cur:
             cur.execute(query)
-            row = cur.fetchone()
-            return row[key] if row else None
+            return cur.fetchone()
 
     def _pg_group_count(
         self,
@@ -750,9 +1109,9 @@ class DataValidator:
             f'SELECT CAST("{date_col}" AS DATE) as d, COUNT(*) as cnt '
             f'FROM {schema}."{table}"{where} GROUP BY 1 ORDER BY 1'
         )
-        with self.pg_conn.cursor() as cur:
+        with self.pg_conn.cursor(dict_cursor=False) as cur:
             cur.execute(query)
-            return {str(row["d"]): row["cnt"] for row in cur.fetchall()}
+            return {str(d): cnt for d, cnt in cur}
 
     def _pg_aggregates_by_date(
         self,
@@ -762,7 +1121,7 @@ class DataValidator:
         numeric_cols: List[str],
         date_from=None,
         date_to=None,
-    ) -> Dict[str, Dict[int, Any]]:
+    ) -> Dict[str, Tuple]:
         col_exprs = ", ".join(
             [f'SUM("{c.lower()}") as s{i}' for i, c in enumerate(numeric_cols)]
         )
@@ -776,107 +1135,143 @@ class DataValidator:
             f'SELECT CAST("{date_col}" AS DATE) as d, {col_exprs} '
             f'FROM {schema}."{table}"{where} GROUP BY 1 ORDER BY 1'
         )
-        with self.pg_conn.cursor() as cur:
+        with self.pg_conn.cursor(dict_cursor=False) as cur:
             cur.execute(query)
-            return {
-                str(row["d"]): {i: row[f"s{i}"] for i in range(len(numeric_cols))}
-                for row in cur.fetchall()
-            }
+            return {str(row[0]): row[1:] for row in cur}
+
+    def _pk_key(self, pk_idx: List[int], row: Tuple) -> Tuple[str, ...]:
+        """A sampled or looked-up row's normalized primary key values."""
+        return tuple(self._norm_val(row[i]) for i in pk_idx)
 
-    def _pg_lookup_by_pk(
+    def _pg_lookup_by_pks(
         self,
         schema: str,
         table: str,
-        pk_cols: List[str],
-        sf_row: Dict,
-    ) -> Optional[Dict]:
-        conditions = " AND ".join([f'"{pk.lower()}" = %s' for pk in pk_cols])
-        values = [sf_row.get(pk, sf_row.get(pk.lower())) for pk in pk_cols]
+        col_names: List[str],
+        pk_idx: List[int],
+        sf_rows: List[Tuple],
+    ) -> Dict[Tuple[str, ...], Tuple]:
+        """
+        Fetch the PostgreSQL rows matching the sampled rows' primary keys.
+
+        One `WHERE (pk...) IN (...)` query per _PK_LOOKUP_CHUNK rows instead
+        of a query per row. Rows are tuples in col_names order, keyed like
+        _pk_key (normalized values); a chunk whose query fails falls back to
+        _pg_lookup_each.
+        """
+        select = ", ".join(f'"{c.lower()}"' for c in col_names)
+        key_cols = ", ".join(f'"{col_names[i].lower()}"' for i in pk_idx)
+        query = f'SELECT {select} FROM {schema}."{table}" WHERE ({key_cols}) IN %s'
+
+        pg_by_pk: Dict[Tuple[str, ...], Tuple] = {}
+        for start in range(0, len(sf_rows), self._PK_LOOKUP_CHUNK):
+            chunk = sf_rows[start : start + self._PK_LOOKUP_CHUNK]
+            keys = tuple(tuple(row[i] for i in pk_idx) for row in chunk)
+            try:
+                with self.pg_conn.cursor(dict_cursor=False) as cur:
+                    cur.execute(query, (keys,))
+                    pg_rows = cur.fetchall()
+            except Exception:
+                pg_rows = self._pg_lookup_each(schema, table, col_names, pk_idx, chunk)
+            for pg_row in pg_rows:
+                pg_by_pk.setdefault(self._pk_key(pk_idx, pg_row), pg_row)
+        return pg_by_pk
+
+    def _pg_lookup_each(
+        self,
+        schema: str,
+        table: str,
+        col_names: List[str],
+        pk_idx: List[int],
+        sf_rows: List[Tuple],
+    ) -> List[Tuple]:
+        """
+        Look the sampled rows up one primary key at a time.
+
+        The lookup is PREPAREd once on a single pooled connection, so
+        PostgreSQL parses and plans it once instead of per row. A row whose
+        lookup fails is treated as not found.
+        """
+        name = f"pk_lookup_{uuid.uuid4().hex}"
+        select = ", ".join(f'"{c.lower()}"' for c in col_names)
+        conditions = " AND ".join(
+            f'"{col_names[i].lower()}" = ${n}' for n, i in enumerate(pk_idx, 1)
+        )
+        params = ", ".join(["%s"] * len(pk_idx))
+
+        pg_rows = []
         try:
-            with self.pg_conn.cursor() as cur:
+            with self.pg_conn.cursor(dict_cursor=False) as cur:
                 cur.execute(
-                    f'SELECT * FROM {schema}."{table}" WHERE {conditions}', values
+                    f'PREPARE {name} AS SELECT {select} FROM {schema}."{table}" '
+                    f"WHERE {conditions}"
                 )
-                return cur.fetchone()
+                try:
+                    for sf_row in sf_rows:
+                        values = [sf_row[i] for i in pk_idx]
+                        try:
+                            cur.execute(f"EXECUTE {name} ({params})", values)
+                            pg_row = cur.fetchone()
+                        except Exception:
+                            # Prepared statements survive the rollback
+                            cur.connection.rollback()
+                            continue
+                        if pg_row is not None:
+                            pg_rows.append(pg_row)
+                finally:
+                    cur.execute(f"DEALLOCATE {name}")
         except Exception:
-            return None
+            pass
+        return pg_rows
 
     # ------------------------------------------------------------------
     # Column classification helpers
     # ------------------------------------------------------------------
 
     def _detect_date_column(self, columns: List[Dict]) -> Optional[str]:
-        date_types = {
-            "DATE",
-            "TIMESTAMP",
-            "TIMESTAMP_NTZ",
-            "TIMESTAMP_LTZ",
-            "TIMESTAMP_TZ",
-        }
-        name_hints = ("date", "day", "period", "month", "week", "year")
-
         # Prefer columns whose name contains a hint
         for col in columns:
-            if col["type"].upper() in date_types:
-                if any(hint in col["name"].lower() for hint in name_hints):
+            if col["type_norm"] in self._DATE_TYPES:
+                if self._DATE_NAME_RE.search(col["name"]):
                     return col["name"]
 
         # Fall back to the first date-type column
         for col in columns:
-            if col["type"].upper() in date_types:
+            if col["type_norm"] in self._DATE_TYPES:
                 return col["name"]
 
         return None
 
     def _get_numeric_columns(self, columns: List[Dict]) -> List[str]:
-        numeric_types = {
-            "NUMBER",
-            "NUMERIC",
-            "DECIMAL",
-            "FLOAT",
-            "FLOAT4",
-            "FLOAT8",
-            "DOUBLE",
-            "REAL",
-            "INTEGER",
-            "INT",
-            "BIGINT",
-            "SMALLINT",
-            "TINYINT",
-        }
         return [
-            col["name"]
-            for col in columns
-            if col["type"].upper().split("(")[0] in numeric_types
+            col["name"] for col in columns if col["type_norm"] in self._NUMERIC_TYPES
         ]
 
-    def _is_numeric_or_date(self, data_type: str) -> bool:
-        checkable = {
-            "NUMBER",
-            "NUMERIC",
-            "DECIMAL",
-            "FLOAT",
-            "FLOAT4",
-            "FLOAT8",
-            "DOUBLE",
-            "REAL",
-            "INTEGER",
-            "INT",
-            "BIGINT",
-            "SMALLINT",
-            "TINYINT",
-            "DATE",
-            "TIMESTAMP",
-            "TIMESTAMP_NTZ",
-            "TIMESTAMP_LTZ",
-            "TIMESTAMP_TZ",
-        }
-        return data_type.upper().split("(")[0] in checkable
+    def _is_numeric_or_date(self, type_norm: str) -> bool:
+        return type_norm in self._NUMERIC_TYPES or type_norm in self._DATE_TYPES
 
     # ------------------------------------------------------------------
     # Value normalization
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _sums_match(sf_sum: Any, pg_sum: Any) -> bool:
+        """
+        Cheap Layer 4 equality test, tried before _norm_decimal.
+
+        Decimals and ints compare exactly by value. FLOAT sums depend on
+        summation order, which differs between the engines, so they only
+        need to agree to a relative 1e-9. False means "compare normalized".
+        """
+        if sf_sum == pg_sum:
+            return True
+        if isinstance(sf_sum, float) or isinstance(pg_sum, float):
+            try:
+                return math.isclose(float(sf_sum), float(pg_sum), rel_tol=1e-9)
+            except (TypeError, ValueError):
+                return False
+        return False
+
     def _norm_decimal(self, val: Any) -> str:
         if val is None:
             return "NULL"
@@ -895,6 +1290,93 @@ class DataValidator:
             val = val.astimezone(timezone.utc)
         return str(val).strip()
 
+    def _table_fingerprint(
+        self, sf_schema: str, sf_table: str, pg_schema: str, pg_table: str
+    ) -> Optional[str]:
+        """
+        Fingerprint both sides of a table from catalog metadata alone.
+
+        Snowflake bumps LAST_ALTERED on any DML or DDL. On PostgreSQL the
+        cumulative insert/update/delete counters move with every write and
+        relfilenode changes on TRUNCATE or a rewrite. The validation options
+        are included so that, e.g., enabling Layer 5 re-validates. Returns
+        None (never skip) if either side cannot be read.
+        """
+        sf_query = """
+        SELECT ROW_COUNT, LAST_ALTERED
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = UPPER(%s)
+        """
+        pg_query = """
+        SELECT c.oid, c.relfilenode, s.n_tup_ins, s.n_tup_upd, s.n_tup_del
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_stat_user_tables s ON s.relid = c.oid
+        WHERE n.nspname = %s AND c.relname = %s
+        """
+
+        def _sf_side():
+            with self.sf_conn.cursor(dict_cursor=False) as cur:
+                cur.execute(sf_query, (sf_schema, sf_table))
+                return cur.fetchone()
+
+        def _pg_side():
+            with self.pg_conn.cursor(dict_cursor=False) as cur:
+                cur.execute(pg_query, (pg_schema, pg_table))
+                return cur.fetchone()
+
+        try:
+            sf_row, pg_row = self._run_both(_sf_side, _pg_side)
+        except Exception as e:
+            logger.warning(f"Could not fingerprint {sf_schema}.{sf_table}: {e}")
+            return None
+        if sf_row is None or pg_row is None:
+            return None
+        options = (
+            self.sample_size,
+            self.sample_method,
+            self.hash_sample,
+            self.chunk_date_ranges,
+        )
+        return "|".join(str(part) for part in (*sf_row, *pg_row, *options))
+
+    def _load_fingerprints(self) -> Dict[str, str]:
+        """Read the fingerprint cache file (empty if missing or unreadable)."""
+        if not self.fingerprint_cache:
+            return {}
+        try:
+            with open(self.fingerprint_cache) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(
+                f"Ignoring unreadable fingerprint cache {self.fingerprint_cache}: {e}"
+            )
+            return {}
+
+    def save_fingerprints(self) -> None:
+        """
+        Write the fingerprints of passing tables to fingerprint_cache.
+
+        validate_table only records them in memory; call this once after a
+        run (also an interrupted one) to persist them.
+        """
+        if not self.fingerprint_cache:
+            return
+        with self._fingerprints_lock:
+            fingerprints = dict(self._fingerprints)
+        try:
+            self.fingerprint_cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.fingerprint_cache.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(fingerprints, f, indent=2, sort_keys=True)
+            tmp.replace(self.fingerprint_cache)  # atomic rename
+        except Exception as e:
+            logger.warning(
+                f"Could not write fingerprint cache {self.fingerprint_cache}: {e}"
+            )
+
     def _status(self, message: str) -> None:
         if self.status_callback:
             self.status_callback(message)
@@ -11,6 +11,48 @@ from typing import List, Optional, Tuple
 class SnowflakeViewTranslator:
     """Translates Snowflake view DDL to PostgreSQL."""
 
+    # Patterns used by _replace_functions, compiled once
+    _LATERAL_SPLIT_TO_TABLE = re.compile(
+        r"\blateral\s+split_to_table\((\w+(?:\.\w+)?),\s*([^)]+)\)\s+(\w+)",
+        re.IGNORECASE,
+    )
+    _SPLIT_TO_TABLE = re.compile(
+        r"\bsplit_to_table\((\w+(?:\.\w+)?),\s*([^)]+)\)", re.IGNORECASE
+    )
+    _SINGLE_ARG_TO_TIMESTAMP = re.compile(
+        r"\bTO_TIMESTAMP\(\s*(\w+(?:\.\w+)?)\s*\)(?!\s*,)", re.IGNORECASE
+    )
+    _UNALIASED_TRIM = re.compile(
+        r"\btrim\((\w+)\)(?!\s+AS\b)(?=\s*(?:,|\r?\n|$|--|\bFROM\b|\bWHERE\b|\bORDER\b|\bGROUP\b|\bHAVING\b|\bLIMIT\b))",
+        re.IGNORECASE,
+    )
+
+    # (pattern, replacement) for plain function/cast renames
+    _FUNCTION_REPLACEMENTS = (
+        # Date functions
+        (r"\bCURRENT_TIMESTAMP\(\)", "CURRENT_TIMESTAMP"),
+        (r"\bGETDATE\(\)", "CURRENT_TIMESTAMP"),
+        (r"\bSYSDATE\(\)", "CURRENT_TIMESTAMP"),
+        (r"\bTO_DATE\(", "TO_TIMESTAMP("),
+        (r"\bDATE_TRUNC\(", "DATE_TRUNC("),
+        (r"\bDATEDIFF\(", "DATE_PART("),  # May need manual adjustment
+        # String functions
+        (r"\bCONCAT_WS\(", "CONCAT_WS("),
+        (r"\bNVL\(", "COALESCE("),
+        (r"\bIFNULL\(", "COALESCE("),
+        # Type casts
+        (r"::VARCHAR", "::TEXT"),
+        (r"::STRING", "::TEXT"),
+        (r"::NUMBER", "::NUMERIC"),
+    )
+    # All renames as one alternation; group g<N> is _FUNCTION_REPLACEMENTS[N].
+    # No replacement produces text another pattern matches, so one pass is
+    # equivalent to applying them in turn.
+    _FUNCTION_PATTERN = re.compile(
+        "|".join(f"(?P<g{i}>{p})" for i, (p, _) in enumerate(_FUNCTION_REPLACEMENTS)),
+        re.IGNORECASE,
+    )
+
     def translate_view(
         self, view_name: str, snowflake_ddl: str, target_schema: str
     ) -> Tuple[Optional[str], Optional[str], List[str]]:
@@ -277,65 +319,32 @@ class SnowflakeViewTranslator:
 
     def _replace_functions(self, sql: str) -> str:
         """Replace Snowflake-specific functions with PostgreSQL equivalents."""
-        result = sql
-
         # Strip LATERAL SPLIT_TO_TABLE(col, delim) alias → LATERAL UNNEST(STRING_TO_ARRAY(col, delim)) AS alias(value)
-        result = re.sub(
-            r"\blateral\s+split_to_table\((\w+(?:\.\w+)?),\s*([^)]+)\)\s+(\w+)",
-            r"lateral unnest(string_to_array(\1, \2)) AS \3(value)",
-            result,
-            flags=re.IGNORECASE,
+        result = self._LATERAL_SPLIT_TO_TABLE.sub(
+            r"lateral unnest(string_to_array(\1, \2)) AS \3(value)", sql
         )
         # Generic SPLIT_TO_TABLE without lateral
-        result = re.sub(
-            r"\bsplit_to_table\((\w+(?:\.\w+)?),\s*([^)]+)\)",
-            r"unnest(string_to_array(\1, \2))",
-            result,
-            flags=re.IGNORECASE,
-        )
+        result = self._SPLIT_TO_TABLE.sub(r"unnest(string_to_array(\1, \2))", result)
 
-        replacements = {
-            # Date functions
-            r"\bCURRENT_TIMESTAMP\(\)": "CURRENT_TIMESTAMP",
-            r"\bGETDATE\(\)": "CURRENT_TIMESTAMP",
-            r"\bSYSDATE\(\)": "CURRENT_TIMESTAMP",
-            r"\bTO_DATE\(": "TO_TIMESTAMP(",
-            r"\bDATE_TRUNC\(": "DATE_TRUNC(",
-            r"\bDATEDIFF\(": "DATE_PART(",  # May need manual adjustment
-            # String functions
-            r"\bCONCAT_WS\(": "CONCAT_WS(",
-            r"\bNVL\(": "COALESCE(",
-            r"\bIFNULL\(": "COALESCE(",
-            # Type casts
-            r"::VARCHAR": "::TEXT",
-            r"::STRING": "::TEXT",
-            r"::NUMBER": "::NUMERIC",
-        }
-
-        for pattern, replacement in replacements.items():
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        # Every _FUNCTION_REPLACEMENTS entry in one pass
+        replacements = self._FUNCTION_REPLACEMENTS
+        result = self._FUNCTION_PATTERN.sub(
+            lambda m: replacements[int(m.lastgroup[1:])][1], result
+        )
 
         # TO_TIMESTAMP(col) with a single argument is invalid in PostgreSQL when
         # the argument is a text column (Snowflake auto-detects format; PG requires
         # an explicit format string). Add a default ISO format for simple column refs.
         # Adjust the format string manually if the source data uses a different layout.
-        result = re.sub(
-            r"\bTO_TIMESTAMP\(\s*(\w+(?:\.\w+)?)\s*\)(?!\s*,)",
-            r"TO_TIMESTAMP(\1, 'YYYY-MM-DD HH24:MI:SS')",
-            result,
-            flags=re.IGNORECASE,
+        result = self._SINGLE_ARG_TO_TIMESTAMP.sub(
+            r"TO_TIMESTAMP(\1, 'YYYY-MM-DD HH24:MI:SS')", result
         )
 
         # In PostgreSQL, trim() has the implicit column alias 'btrim'. When multiple
         # trim() calls appear in a SELECT list without aliases, every column ends up
         # named 'btrim', causing "column specified more than once" errors. Add the
         # source column name as an explicit alias for simple trim(column_name) calls.
-        result = re.sub(
-            r"\btrim\((\w+)\)(?!\s+AS\b)(?=\s*(?:,|\r?\n|$|--|\bFROM\b|\bWHERE\b|\bORDER\b|\bGROUP\b|\bHAVING\b|\bLIMIT\b))",
-            r"trim(\1) AS \1",
-            result,
-            flags=re.IGNORECASE,
-        )
+        result = self._UNALIASED_TRIM.sub(r"trim(\1) AS \1", result)
 
         return result
 